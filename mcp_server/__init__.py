@@ -1,3 +1,9 @@
 from . import controllers
 from . import models
 from . import wizard
+
+
+def uninstall_hook(env):
+    """Drop the partitioned log storage backing the mcp_log view."""
+    env.cr.execute("DROP VIEW IF EXISTS mcp_log")
+    env.cr.execute("DROP TABLE IF EXISTS mcp_log_data CASCADE")
@@ -34,6 +34,9 @@ Requirements: Odoo 19.0 and mcp-server-odoo client package
         "wizard/mcp_model_selection_wizard_views.xml",
         "views/mcp_enabled_models_views.xml",
         "views/mcp_log_views.xml",
+        "views/mcp_log_stats_views.xml",
+        "views/mcp_log_archive_views.xml",
+        "views/mcp_slow_request_views.xml",
         "views/res_config_settings_views.xml",
     ],
     "demo": [],
@@ -41,6 +44,7 @@ Requirements: Odoo 19.0 and mcp-server-odoo client package
         "static/description/banner.png",
         "static/description/icon.png",
     ],
+    "uninstall_hook": "uninstall_hook",
     "installable": True,
     "application": False,
     "auto_install": False,
@@ -1,6 +1,23 @@
 from . import auth
+from . import columnar
+from . import compression
+from . import health
+from . import jsonrpc
+from . import keyset
+from . import log_export
+from . import log_queue
 from . import main
+from . import metrics
+from . import msgpack_rpc
+from . import profiling
 from . import rate_limiting
+from . import record_export
+from . import resource_usage
 from . import response_utils
+from . import sampler
+from . import slow_requests
+from . import tracing
 from . import utils
+from . import write_audit
 from . import xmlrpc
+from . import xmlrpc_stream
@@ -6,6 +6,8 @@ import logging
 from odoo import http
 from odoo.http import request
 
+from . import tracing
+
 _logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,8 @@ def get_user_from_api_key(api_key):
 
     try:
         # Use the _check_credentials method to validate API key
-        user_id = request.env["res.users.apikeys"].sudo()._check_credentials(scope="rpc", key=api_key)
+        with tracing.span("auth"):
+            user_id = request.env["res.users.apikeys"].sudo()._check_credentials(scope="rpc", key=api_key)
         if not user_id:
             # Log authentication failure
             request.env["mcp.log"].sudo().log_authentication(
@@ -100,3 +103,30 @@ def require_api_key(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def require_mcp_admin(func):
+    """
+    Decorator for endpoints restricted to MCP administrators.
+    Must be applied after `require_api_key` so that `kwargs['user']` is set.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from . import response_utils
+
+        user = kwargs.get("user")
+        if not user or not user.has_group("mcp_server.group_mcp_admin"):
+            request.env["mcp.log"].sudo().log_permission_denied(
+                model_name="mcp.log",
+                operation="admin",
+                user_id=user.id if user else None,
+                endpoint=request.httprequest.path,
+                ip_address=request.httprequest.remote_addr,
+                error_message="MCP administrator access required.",
+            )
+            return response_utils.error_response("MCP administrator access required.", "E403", status=403)
+
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,69 @@
+"""Columnar result format for search_read and read calls."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+COLUMNAR_FORMAT = "columnar"
+# Methods accepting the format option, with the position of their fields argument
+FIELDS_ARG_INDEX = {"search_read": 1, "read": 1}
+# Suffix of the column holding the display names of a many2one field
+NAME_SUFFIX = ".display_name"
+
+
+def pop_format(method: str, params: list) -> Tuple[list, bool]:
+    """
+    Remove the format option from the keyword arguments of an execute_kw call.
+
+    :param method: Model method
+    :param params: execute_kw parameters (db, uid, password, model, method, args, kwargs)
+    :return: Tuple of (parameters to dispatch, whether the columnar format was requested)
+    :rtype: tuple
+    :raises ValueError: If the format is not supported
+    """
+    if method not in FIELDS_ARG_INDEX or len(params) < 7 or not isinstance(params[6], dict):
+        return params, False
+    if "format" not in params[6]:
+        return params, False
+    kwargs = dict(params[6])
+    result_format = kwargs.pop("format")
+    if result_format != COLUMNAR_FORMAT:
+        raise ValueError(f"Unsupported result format '{result_format}', the only format is '{COLUMNAR_FORMAT}'")
+    return [*params[:6], kwargs], True
+
+
+def requested_fields(method: str, args: list, kwargs: dict) -> Optional[List[str]]:
+    """Return the fields argument of a search_read or read call, if any."""
+    index = FIELDS_ARG_INDEX[method]
+    if kwargs.get("fields") is not None:
+        return kwargs["fields"]
+    return args[index] if len(args) > index else None
+
+
+def to_columnar(model, rows: List[Dict[str, Any]], fields_list: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Turn the list of records returned by search_read or read into columns.
+
+    Many2one values ([id, display name] pairs) are split into a column of
+    ids and a "<field>.display_name" column; empty values are False in both.
+
+    :param model: Model the rows were read from, used for field types
+    :param rows: Records as returned by search_read or read
+    :param fields_list: Requested fields, used for the column list when there are no rows
+    :return: Dict with "fields" (column names in order), "ids" and "columns"
+    :rtype: dict
+    """
+    names = [name for name in (rows[0] if rows else fields_list or []) if name != "id"]
+    column_names = []
+    columns = {}
+    for name in names:
+        values = [row[name] for row in rows] if rows else []
+        field = model._fields.get(name)
+        if field is not None and field.type == "many2one":
+            columns[name] = [value[0] if isinstance(value, (list, tuple)) else value for value in values]
+            columns[name + NAME_SUFFIX] = [
+                value[1] if isinstance(value, (list, tuple)) and len(value) > 1 else False for value in values
+            ]
+            column_names += [name, name + NAME_SUFFIX]
+        else:
+            columns[name] = values
+            column_names.append(name)
+    return {"fields": column_names, "ids": [row["id"] for row in rows], "columns": columns}
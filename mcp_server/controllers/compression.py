@@ -0,0 +1,323 @@
+"""Content-Encoding negotiation (gzip, zstd) for MCP requests and responses."""
+
+import functools
+import io
+import threading
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from odoo.http import request
+
+from . import response_utils, tracing
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_LEVEL = 6
+# Decoded request bodies are capped like Odoo caps raw ones (DEFAULT_MAX_CONTENT_LENGTH)
+MAX_DECODED_REQUEST_SIZE = 128 * 1024 * 1024
+# Bytes of encoded request body read from the client at a time
+READ_SIZE = 64 * 1024
+# zlib window bits for a gzip container, and for gzip or zlib auto-detection
+GZIP_WBITS = 31
+GZIP_OR_ZLIB_WBITS = 47
+
+# Errors raised by the decoders for corrupt bodies
+_DECODE_ERRORS = (zlib.error, ValueError) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+_local = threading.local()
+
+
+def supported_encodings():
+    """Return the content codings this server can decode and encode, preferred first."""
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def _normalize(coding: str) -> str:
+    coding = coding.strip().lower()
+    return "gzip" if coding == "x-gzip" else coding
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the response coding from an Accept-Encoding header.
+
+    zstd is preferred over gzip when the client accepts both with the same
+    weight and the zstandard package is installed.
+
+    :param accept_encoding: Accept-Encoding header value
+    :return: "zstd", "gzip", or None to send the body as is
+    :rtype: str or None
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _sep, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _sep, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[_normalize(coding)] = weight
+    candidates = [
+        (weights.get(coding, weights.get("*", 0.0)), -rank, coding)
+        for rank, coding in enumerate(supported_encodings())
+    ]
+    weight, _rank, coding = max(candidates)
+    return coding if weight > 0 else None
+
+
+def _compressor(encoding: str, level: int):
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    return zlib.compressobj(min(level, 9), zlib.DEFLATED, GZIP_WBITS)
+
+
+def compress(data: bytes, encoding: str, level: int = DEFAULT_LEVEL) -> bytes:
+    """
+    Compress a complete body.
+
+    :param data: Body to compress
+    :param encoding: "gzip" or "zstd"
+    :param level: Compression level (gzip levels above 9 are capped at 9)
+    :return: Compressed body
+    :rtype: bytes
+    """
+    compressor = _compressor(encoding, level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str, level: int = DEFAULT_LEVEL) -> Iterator[bytes]:
+    """
+    Compress a streamed body chunk by chunk.
+
+    :param chunks: Chunks of the body
+    :param encoding: "gzip" or "zstd"
+    :param level: Compression level
+    :return: Iterator of compressed chunks
+    """
+    compressor = _compressor(encoding, level)
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class DecodedStream(io.RawIOBase):
+    """Readable stream decoding a gzip or zstd body while it is read.
+
+    The encoded body is read from the underlying stream READ_SIZE bytes at a
+    time and each read returns at most the requested number of decoded bytes,
+    so memory use does not depend on how well the body compresses. Reads fail
+    with ValueError once more than max_size bytes were decoded.
+    """
+
+    def __init__(self, raw, encoding: str, max_size: int = MAX_DECODED_REQUEST_SIZE):
+        """
+        :param raw: Binary file-like object holding the encoded body
+        :param encoding: Content-Encoding header value
+        :param max_size: Maximum decoded size
+        :raises ValueError: If the coding is not supported
+        """
+        super().__init__()
+        self.encoding = _normalize(encoding)
+        if self.encoding not in supported_encodings():
+            raise ValueError(f"Unsupported Content-Encoding '{self.encoding}'")
+        self._raw = raw
+        self._max_size = max_size
+        self._size = 0
+        if self.encoding == "zstd":
+            # A body may hold several frames, e.g. when it was compressed chunk by chunk
+            self._reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        else:
+            self._decompressor = zlib.decompressobj(GZIP_OR_ZLIB_WBITS)
+            self._input = b""
+            self._raw_eof = False
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return self.readall()
+        if not size:
+            return b""
+        try:
+            data = self._reader.read(size) if self.encoding == "zstd" else self._read_gzip(size)
+        except _DECODE_ERRORS as e:
+            raise ValueError(f"Invalid {self.encoding} request body: {e}") from e
+        self._size += len(data)
+        if self._size > self._max_size:
+            raise ValueError(f"Decoded request body exceeds {self._max_size} bytes")
+        return data
+
+    def _read_gzip(self, size):
+        # A gzip body may hold several members, decoded one after the other
+        while True:
+            if not self._input and not self._raw_eof:
+                self._input = self._raw.read(READ_SIZE)
+                self._raw_eof = not self._input
+            if self._decompressor.eof:
+                if not self._input:
+                    return b""
+                self._decompressor = zlib.decompressobj(GZIP_OR_ZLIB_WBITS)
+            elif not self._input:
+                raise ValueError("truncated stream")
+            data = self._decompressor.decompress(self._input, size)
+            if self._decompressor.eof:
+                # Start of the next member, if any
+                self._input = self._decompressor.unused_data
+            else:
+                self._input = self._decompressor.unconsumed_tail
+            if data:
+                return data
+
+
+def decompress(data: bytes, encoding: str, max_size: int = MAX_DECODED_REQUEST_SIZE) -> bytes:
+    """
+    Decode a request body.
+
+    :param data: Encoded body
+    :param encoding: Content-Encoding header value
+    :param max_size: Maximum decoded size
+    :return: Decoded body
+    :rtype: bytes
+    :raises ValueError: If the coding is not supported, the body is corrupt or
+        it decodes to more than max_size bytes
+    """
+    return DecodedStream(io.BytesIO(data), encoding, max_size).read()
+
+
+def request_encoding() -> Optional[str]:
+    """
+    Return the coding the body of the current request is decoded from.
+
+    :return: "gzip", "zstd", or None when the body is sent as is
+    :rtype: str or None
+    """
+    return getattr(_local, "encoding", None)
+
+
+def request_data() -> bytes:
+    """
+    Return the body of the current request, decoded if it was sent compressed.
+
+    :return: Request body
+    :rtype: bytes
+    :raises ValueError: If the body is corrupt or decodes to more than
+        MAX_DECODED_REQUEST_SIZE bytes
+    """
+    encoding = request_encoding()
+    if encoding is None:
+        return request.httprequest.get_data()
+    if getattr(_local, "data", None) is None:
+        with tracing.span("decompress"):
+            _local.data = DecodedStream(request.httprequest.stream, encoding).read()
+    return _local.data
+
+
+def request_stream(max_size: int = MAX_DECODED_REQUEST_SIZE):
+    """
+    Return a stream over the body of the current request, decoded while it is read if it was sent compressed.
+
+    :param max_size: Maximum decoded size, reads fail with ValueError past it
+    :return: Binary file-like object
+    """
+    encoding = request_encoding()
+    if encoding is None:
+        return request.httprequest.stream
+    return DecodedStream(request.httprequest.stream, encoding, max_size)
+
+
+def _get_int_param(key: str, default: int) -> int:
+    try:
+        return int(request.env["ir.config_parameter"].sudo().get_param(key, default))
+    except Exception:
+        return default
+
+
+def _compress_response(response, encoding: str, level: int, min_size: int):
+    if response.is_streamed:
+        # Size unknown before sending: streamed bodies are always compressed
+        response.response = compress_chunks(response.response, encoding, level)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        with tracing.span("compress"):
+            response.set_data(compress(data, encoding, level))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _json_error_response(message: str, status: int):
+    return response_utils.error_response(message, f"E{status}", status=status)
+
+
+def negotiate(func=None, *, error_response=None):
+    """
+    Decorator decoding compressed request bodies and compressing responses.
+
+    Request bodies sent with a gzip or zstd Content-Encoding are decoded as
+    endpoints read them, whole with :func:`request_data` or incrementally
+    with :func:`request_stream`, so limits on the decoded size apply before
+    a small body decoding to a large one is buffered. Unsupported codings
+    are rejected before the endpoint runs.
+    Responses are compressed with the coding preferred in Accept-Encoding,
+    at level `mcp_server.compression_level` (default 6, 0 disables response
+    compression), when their body is at least `mcp_server.compression_min_size`
+    bytes (default 1024). Streamed responses are compressed chunk by chunk.
+
+    Use it as ``@negotiate``, or as ``@negotiate(error_response=...)`` on
+    endpoints whose clients expect another error format than JSON.
+
+    :param func: The endpoint function
+    :param error_response: Callable building the response rejecting a body sent
+        with an unsupported coding, from the message and the HTTP status (JSON by default)
+    :return: Wrapped function, or a decorator when func is not given
+    """
+    if func is None:
+        return functools.partial(negotiate, error_response=error_response)
+    error_response = error_response or _json_error_response
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        content_encoding = _normalize(request.httprequest.headers.get("Content-Encoding", ""))
+        if content_encoding and content_encoding != "identity":
+            if content_encoding not in supported_encodings():
+                return error_response(f"Unsupported Content-Encoding '{content_encoding}'", 415)
+            _local.encoding = content_encoding
+        try:
+            response = func(*args, **kwargs)
+        finally:
+            _local.encoding = None
+            _local.data = None
+
+        level = _get_int_param("mcp_server.compression_level", DEFAULT_LEVEL)
+        if level <= 0 or not hasattr(response, "headers"):
+            return response
+        response.vary.add("Accept-Encoding")
+        if response.status_code in (204, 304) or "Content-Encoding" in response.headers:
+            return response
+        encoding = choose_encoding(request.httprequest.headers.get("Accept-Encoding"))
+        if encoding is None:
+            return response
+        return _compress_response(
+            response, encoding, level, _get_int_param("mcp_server.compression_min_size", DEFAULT_MIN_SIZE)
+        )
+
+    return wrapper
@@ -0,0 +1,112 @@
+"""Liveness and readiness reporting for the MCP health endpoint."""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from . import log_queue, metrics, tracing, utils
+
+_logger = logging.getLogger(__name__)
+
+# Deep checks touch the database: each worker runs at most one per interval
+# and answers other probes with the last report
+READINESS_MIN_INTERVAL_SECONDS = 5
+# Log queue fill ratio above which the worker reports itself degraded
+LOG_QUEUE_DEGRADED_RATIO = 0.9
+
+_started = time.monotonic()
+_readiness_lock = threading.Lock()
+# Last readiness report and the monotonic time it was computed at
+_last_readiness: Dict[str, Any] = {"report": None, "computed_at": 0.0}
+
+
+def liveness() -> Dict[str, Any]:
+    """
+    Report that this worker is up, from memory only.
+
+    :return: Dict with the worker pid and uptime
+    :rtype: dict
+    """
+    return {"pid": os.getpid(), "uptime_seconds": int(time.monotonic() - _started)}
+
+
+def _cache_ratio(counters: dict, hits: str, misses: str):
+    hit_count = sum(value for (name, _labels), value in counters.items() if name == hits)
+    miss_count = sum(value for (name, _labels), value in counters.items() if name == misses)
+    total = hit_count + miss_count
+    return round(hit_count / total, 4) if total else None
+
+
+def _compute_readiness(env) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        env.cr.execute("SELECT 1")
+        env.cr.fetchone()
+        database = {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 3)}
+    except Exception as e:
+        _logger.warning(f"MCP readiness probe: database check failed: {e}")
+        database = {"ok": False, "error": str(e)}
+
+    counters = metrics.snapshot()["counters"]
+    caches = utils.get_cache_stats()
+    caches["acl_hit_ratio"] = _cache_ratio(counters, "mcp_acl_cache_hits_total", "mcp_acl_cache_misses_total")
+
+    queue_stats = log_queue.get_queue_stats()
+    queue_stats["capacity"] = log_queue.QUEUE_MAX_SIZE
+    in_flight = tracing.in_flight()
+    mcp_enabled = utils.is_mcp_enabled() if database["ok"] else None
+
+    ready = (
+        database["ok"]
+        and mcp_enabled
+        and queue_stats["depth"] < log_queue.QUEUE_MAX_SIZE * LOG_QUEUE_DEGRADED_RATIO
+    )
+    return {
+        "status": "ok" if ready else "degraded",
+        "mcp_enabled": mcp_enabled,
+        "database": database,
+        "worker": {
+            **liveness(),
+            "in_flight": in_flight,
+            "in_flight_total": sum(in_flight.values()),
+        },
+        "caches": caches,
+        "log_queue": queue_stats,
+    }
+
+
+def readiness(env) -> Dict[str, Any]:
+    """
+    Report whether this worker can serve MCP requests.
+
+    The report is recomputed at most every READINESS_MIN_INTERVAL_SECONDS per
+    worker; probes in between, or arriving while another probe computes it,
+    get the previous report, flagged with its age.
+
+    :param env: Odoo environment of the probe request
+    :return: Readiness report, with "status" "ok" or "degraded"
+    :rtype: dict
+    """
+    now = time.monotonic()
+    report = _last_readiness["report"]
+    computed = False
+    fresh = report is not None and now - _last_readiness["computed_at"] < READINESS_MIN_INTERVAL_SECONDS
+    if not fresh and _readiness_lock.acquire(blocking=False):
+        try:
+            report = _compute_readiness(env)
+            _last_readiness.update(report=report, computed_at=time.monotonic())
+            computed = True
+        finally:
+            _readiness_lock.release()
+    if report is None:
+        # First probe of the worker while another one computes the report
+        return {"status": "pending", "worker": liveness()}
+    age_ms = int((time.monotonic() - _last_readiness["computed_at"]) * 1000)
+    return {**report, "cached": not computed, "age_ms": age_ms}
+
+
+def reset() -> None:
+    """Forget the last readiness report (used by tests)."""
+    _last_readiness.update(report=None, computed_at=0.0)
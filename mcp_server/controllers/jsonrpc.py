@@ -0,0 +1,125 @@
+"""JSON-RPC 2.0 encoding for the MCP object endpoint."""
+
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from odoo import fields
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Error codes reserved by the JSON-RPC 2.0 specification. Errors raised by
+# MCP checks keep the HTTP-aligned codes of XML-RPC faults (403, 429, ...).
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+# Names of the execute_kw parameters, for calls passing params as an object
+PARAM_NAMES = ("db", "uid", "password", "model", "method", "args", "kwargs")
+
+
+class JsonRpcError(Exception):
+    """Invalid JSON-RPC call, answered with an error object."""
+
+    def __init__(self, code: int, message: str, request_id=None, notification: bool = False):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.request_id = request_id
+        self.notification = notification
+
+
+def _default(value):
+    """Encode the values JSON has no type for the way the XML-RPC endpoint does."""
+    if isinstance(value, datetime):
+        return fields.Datetime.to_string(value)
+    if isinstance(value, date):
+        return fields.Date.to_string(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode a JSON-RPC response, with orjson when it is installed.
+
+    Dates and datetimes are formatted as Odoo server strings, like in XML-RPC
+    responses.
+
+    :param payload: Response object or list of response objects
+    :return: UTF-8 encoded JSON
+    :rtype: bytes
+    """
+    if orjson is not None:
+        # Pass datetimes to _default instead of orjson's RFC 3339 output; allow
+        # non-string keys, which json converts to strings
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(payload, default=_default, option=options)
+    return json.dumps(payload, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON-RPC request body.
+
+    :param data: Request body
+    :return: Decoded request object or batch array
+    :raises ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def result(request_id, value) -> dict:
+    """Build a success response object."""
+    return {"jsonrpc": "2.0", "id": request_id, "result": value}
+
+
+def error(request_id, code: int, message: str) -> dict:
+    """Build an error response object."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def parse_call(call: Any) -> Tuple[Optional[Any], List[Any], bool]:
+    """
+    Validate a JSON-RPC call and extract its execute_kw parameters.
+
+    Parameters are given either positionally, like XML-RPC execute_kw, or as
+    an object with the names in PARAM_NAMES.
+
+    :param call: Decoded call object
+    :return: Tuple of (request id, execute_kw parameters, whether the call is a notification)
+    :rtype: tuple
+    :raises JsonRpcError: If the call is invalid or its method is not execute_kw
+    """
+    if not isinstance(call, dict):
+        raise JsonRpcError(INVALID_REQUEST, "Invalid Request")
+    request_id = call.get("id")
+    notification = "id" not in call
+    if call.get("jsonrpc") != "2.0" or not isinstance(call.get("method"), str):
+        raise JsonRpcError(INVALID_REQUEST, "Invalid Request", request_id)
+    if call["method"] != "execute_kw":
+        raise JsonRpcError(
+            METHOD_NOT_FOUND,
+            f"Method not found: {call['method']}. Only execute_kw is allowed.",
+            request_id,
+            notification,
+        )
+
+    params = call.get("params", [])
+    if isinstance(params, dict):
+        params = [params.get(name) for name in PARAM_NAMES[:5]] + [
+            params.get("args") or [],
+            params.get("kwargs") or {},
+        ]
+    if not isinstance(params, list):
+        raise JsonRpcError(INVALID_PARAMS, "Invalid params: expected an array or an object.", request_id, notification)
+    return request_id, params, notification
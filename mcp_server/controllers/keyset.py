@@ -0,0 +1,85 @@
+"""Keyset (cursor) pagination for search_read through the MCP object endpoint."""
+
+from typing import Any, Dict, List, Tuple
+
+from .utils import decode_cursor, encode_cursor
+
+CURSOR_METHOD = "search_read_cursor"
+CURSOR_SCOPE = "mcp_server.search_read_cursor"
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+
+# Positional arguments of search_read_cursor
+CALL_ARGUMENTS = ("domain", "fields", "limit", "cursor", "order")
+# Supported orders: pages follow the primary key, the only unique key every model has
+ORDERS = {"id": False, "id asc": False, "id desc": True}
+
+
+def to_search_read(env, model_name: str, params: list) -> Tuple[list, Dict[str, Any]]:
+    """
+    Turn a search_read_cursor call into the search_read call fetching its page.
+
+    The page is selected with a condition on id instead of an offset, so
+    each page costs one index range scan whatever its position. One row
+    more than the page size is fetched to know whether another page follows.
+
+    :param env: Odoo environment, used to verify the cursor signature
+    :param model_name: Technical model name
+    :param params: execute_kw parameters, with args/kwargs
+        (domain, fields, limit, cursor, order); order is "id" (default) or "id desc"
+    :return: Tuple of (execute_kw parameters of the search_read call, page state for :func:`to_page`)
+    :rtype: tuple
+    :raises ValueError: If an argument or the cursor is invalid
+    """
+    args = list(params[5]) if len(params) > 5 else []
+    kwargs = dict(params[6]) if len(params) > 6 else {}
+    unknown = set(kwargs) - set(CALL_ARGUMENTS) - {"context"}
+    if len(args) > len(CALL_ARGUMENTS) or unknown:
+        raise ValueError(f"{CURSOR_METHOD} takes the arguments {', '.join(CALL_ARGUMENTS)}")
+    call = dict(zip(CALL_ARGUMENTS, args), **kwargs)
+
+    limit = call.get("limit") or DEFAULT_PAGE_SIZE
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    limit = min(limit, MAX_PAGE_SIZE)
+    order = str(call.get("order") or "id").strip().lower()
+    if order not in ORDERS:
+        raise ValueError(f"{CURSOR_METHOD} only orders by id, use 'id' or 'id desc'")
+    descending = ORDERS[order]
+
+    domain = list(call.get("domain") or [])
+    if call.get("cursor"):
+        try:
+            cursor_model, last_id, cursor_descending = decode_cursor(env, call["cursor"], scope=CURSOR_SCOPE)
+            last_id = int(last_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {e}") from e
+        if cursor_model != model_name or cursor_descending != descending:
+            raise ValueError("Invalid cursor: it was issued for another model or order")
+        domain = [("id", "<" if descending else ">", last_id), *domain]
+
+    search_kwargs = {"domain": domain, "limit": limit + 1, "order": "id desc" if descending else "id"}
+    if call.get("fields") is not None:
+        search_kwargs["fields"] = call["fields"]
+    if "context" in kwargs:
+        search_kwargs["context"] = kwargs["context"]
+    return [*params[:4], "search_read", [], search_kwargs], {"limit": limit, "descending": descending}
+
+
+def to_page(env, model_name: str, rows: List[Dict[str, Any]], page: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the search_read_cursor result from the rows of its search_read call.
+
+    :param env: Odoo environment, used to sign the cursor
+    :param model_name: Technical model name
+    :param rows: Records returned by search_read
+    :param page: Page state returned by :func:`to_search_read`
+    :return: Dict with "records" and "next_cursor", False after the last page
+    :rtype: dict
+    """
+    more = len(rows) > page["limit"]
+    rows = rows[: page["limit"]]
+    next_cursor = False
+    if more:
+        next_cursor = encode_cursor(env, [model_name, rows[-1]["id"], page["descending"]], scope=CURSOR_SCOPE)
+    return {"records": rows, "next_cursor": next_cursor}
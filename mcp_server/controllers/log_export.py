@@ -0,0 +1,181 @@
+"""Streaming export of MCP logs for external log collectors (SIEM)."""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime, timezone
+
+from odoo import api, http
+from odoo.exceptions import UserError
+from odoo.http import Response, request
+from odoo.modules.registry import Registry
+
+from . import auth, compression, metrics, response_utils, tracing, utils
+from .rate_limiting import rate_limit
+
+_logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_DEFAULT_LIMIT = 10000
+EXPORT_MAX_LIMIT = 100000
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _parse_since(value):
+    """Parse an ISO 8601 timestamp into a naive UTC datetime."""
+    since = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if since.tzinfo:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+
+def _csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def stream_log_export(dbname, uid, export_format, after_id, date_from, event_types, limit):
+    """
+    Generate the body of a log export, one encoded line at a time.
+
+    The request cursor is closed once the controller returns, so rows are
+    read from a dedicated cursor that lives as long as the response stream.
+    The export ends with a trailer holding the token to resume from, the
+    number of exported entries, whether none is left and, if the export was
+    interrupted, the error: a JSON object for NDJSON, "#<name>,<value>" lines
+    for CSV, "#next_cursor" being the last one.
+
+    :param dbname: Database to export from
+    :param uid: ID of the exporting user
+    :param export_format: "ndjson" or "csv"
+    :param after_id: Only entries with a greater id are exported
+    :param date_from: Only entries created at or after this date
+    :param event_types: Only entries of these event types
+    :param limit: Maximum number of exported entries
+    :return: Generator of encoded lines
+    """
+    with Registry(dbname).cursor() as cr:
+        env = api.Environment(cr, uid, {})
+        log_model = env["mcp.log"].sudo()
+        last_id = after_id
+        count = 0
+        header_written = False
+        try:
+            for values in log_model.iter_export_rows(after_id, date_from, event_types, limit):
+                if export_format == "csv":
+                    if not header_written:
+                        header_written = True
+                        yield _csv_line(values.keys()).encode()
+                    yield _csv_line([_csv_value(value) for value in values.values()]).encode()
+                else:
+                    yield (json.dumps(values, default=_json_default, separators=(",", ":")) + "\n").encode()
+                last_id = values["id"]
+                count += 1
+        except Exception as e:
+            # Headers are already sent, report the failure in-band and let the client resume
+            _logger.error(f"MCP log export failed after {count} entries: {e}")
+            error = {"error": "Export interrupted", "rows": count}
+            # The failed statement aborted the transaction, the cursor token still reads the signing secret
+            cr.rollback()
+        else:
+            error = None
+
+        trailer = {"next_cursor": log_model.encode_export_cursor(last_id), "rows": count, "complete": count < limit}
+        if error:
+            trailer.update(error, complete=False)
+        if export_format == "csv":
+            for name in ("error", "rows", "complete", "next_cursor"):
+                if name in trailer:
+                    value = trailer[name]
+                    yield _csv_line([f"#{name}", str(value).lower() if isinstance(value, bool) else value]).encode()
+        else:
+            yield (json.dumps(trailer, separators=(",", ":")) + "\n").encode()
+
+
+class McpLogExportController(http.Controller):
+    @http.route("/mcp/logs/export", type="http", auth="none", methods=["GET"], csrf=False)
+    @tracing.trace_request("/mcp/logs/export")
+    @compression.negotiate
+    @metrics.track_request("/mcp/logs/export")
+    @auth.require_api_key
+    @auth.require_mcp_admin
+    @rate_limit
+    def export_logs(self, **kwargs):
+        """
+        Log Export Endpoint
+        Path: /mcp/logs/export
+        Method: GET
+        Auth: API key of an MCP administrator required
+        Description: Stream log entries in id order as NDJSON or CSV
+        Parameters:
+            format: "ndjson" (default) or "csv"
+            cursor: Token returned by the previous export, to resume after its last entry
+            after_id: Resume after this log id (ignored when cursor is given)
+            since: Only entries created at or after this UTC timestamp
+            event_type: Comma-separated event types to export
+            limit: Maximum number of entries (default 10000, max 100000)
+        Response: Chunked stream of entries, the last line holds the next cursor
+        """
+        if not utils.is_mcp_enabled():
+            return response_utils.error_response(message="MCP Server is disabled globally.", code="E503", status=503)
+
+        user = kwargs.get("user")
+        export_format = (kwargs.get("format") or "ndjson").lower()
+        if export_format not in EXPORT_FORMATS:
+            return response_utils.error_response(
+                f"Unsupported export format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}.",
+                "E400",
+                status=400,
+            )
+
+        log_model = request.env["mcp.log"].sudo()
+        try:
+            if kwargs.get("cursor"):
+                after_id = log_model.decode_export_cursor(kwargs["cursor"])
+            else:
+                after_id = int(kwargs.get("after_id") or 0)
+            limit = max(1, min(int(kwargs.get("limit") or EXPORT_DEFAULT_LIMIT), EXPORT_MAX_LIMIT))
+            date_from = _parse_since(kwargs["since"]) if kwargs.get("since") else None
+        except (UserError, ValueError, TypeError) as e:
+            return response_utils.error_response(f"Invalid export parameters: {e}", "E400", status=400)
+        event_types = [name.strip() for name in (kwargs.get("event_type") or "").split(",") if name.strip()]
+
+        log_model.log_model_access(
+            model_name="mcp.log",
+            operation="export",
+            user_id=user.id,
+            endpoint=request.httprequest.path,
+            http_method=request.httprequest.method,
+            ip_address=request.httprequest.remote_addr,
+        )
+
+        body = stream_log_export(request.env.cr.dbname, user.id, export_format, after_id, date_from, event_types, limit)
+        # No Content-Length: the body is sent with chunked transfer encoding
+        return Response(
+            body,
+            status=200,
+            headers=[
+                ("Content-Type", f"{EXPORT_FORMATS[export_format]}; charset=utf-8"),
+                ("Cache-Control", "no-store"),
+                ("X-Content-Type-Options", "nosniff"),
+            ],
+            direct_passthrough=True,
+        )
@@ -0,0 +1,128 @@
+"""Background queue for MCP log entries written off the request path."""
+
+import logging
+import queue
+import threading
+from typing import Any, Dict
+
+from odoo import SUPERUSER_ID, api
+from odoo.modules.registry import Registry
+
+_logger = logging.getLogger(__name__)
+
+# Entries waiting to be written; when full, new entries are dropped rather
+# than slowing down requests
+QUEUE_MAX_SIZE = 10000
+# Maximum number of entries written in one transaction by the writer thread
+QUEUE_BATCH_SIZE = 200
+
+_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+_writer_lock = threading.Lock()
+_writer_thread = None
+
+# Plain integer increments are atomic enough for monitoring counters under the GIL
+_stats: Dict[str, int] = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0}
+
+
+def _in_test_mode(env) -> bool:
+    return hasattr(env.registry, "test_cr") and env.registry.test_cr is not None
+
+
+def submit(env, event_type: str, **values: Any) -> None:
+    """
+    Queue an mcp.log entry to be written once the current transaction commits.
+
+    The entry is handed to a background writer thread with its own cursor, so
+    the request neither waits for the insert nor holds locks on the log table.
+    Entries of rolled back transactions are never written. In test mode the
+    entry is written synchronously in the current transaction instead.
+
+    :param env: Environment of the request
+    :type env: odoo.api.Environment
+    :param event_type: mcp.log event type
+    :type event_type: str
+    :param values: Keyword arguments for mcp.log.log_event
+    """
+    if _in_test_mode(env):
+        env["mcp.log"].sudo().log_event(event_type, **values)
+        return
+
+    dbname = env.cr.dbname
+    env.cr.postcommit.add(lambda: enqueue(dbname, event_type, values))
+
+
+def enqueue(dbname: str, event_type: str, values: Dict[str, Any]) -> bool:
+    """
+    Hand an mcp.log entry to the background writer without blocking.
+
+    :return: False if the queue is full and the entry was dropped
+    :rtype: bool
+    """
+    try:
+        _queue.put_nowait((dbname, event_type, values))
+    except queue.Full:
+        _stats["dropped"] += 1
+        return False
+    _stats["enqueued"] += 1
+    _ensure_writer()
+    return True
+
+
+def get_queue_stats() -> Dict[str, int]:
+    """
+    Return the counters of the background log queue.
+
+    :return: Dict with depth, enqueued, written, dropped and failed entries
+    :rtype: dict
+    """
+    return dict(_stats, depth=_queue.qsize())
+
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="mcp.log.writer", daemon=True)
+            _writer_thread.start()
+
+
+def _writer_loop() -> None:
+    while True:
+        batch = [_queue.get()]
+        while len(batch) < QUEUE_BATCH_SIZE:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        by_database: Dict[str, list] = {}
+        for dbname, event_type, values in batch:
+            by_database.setdefault(dbname, []).append((event_type, values))
+        for dbname, entries in by_database.items():
+            _write_batch(dbname, entries)
+
+
+def _write_batch(dbname: str, entries: list) -> None:
+    written = failed = 0
+    try:
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            log_model = env["mcp.log"].with_context(mcp_log_raise_errors=True)
+            for event_type, values in entries:
+                # One bad entry must not abort the transaction of the whole batch
+                try:
+                    with cr.savepoint():
+                        log_model.log_event(event_type, **values)
+                except Exception as e:
+                    failed += 1
+                    _logger.error(f"Failed to write a queued MCP {event_type} log entry: {e}")
+                else:
+                    written += 1
+    except Exception as e:
+        # Nothing of the batch was committed
+        written, failed = 0, len(entries)
+        _logger.error(f"Failed to write {len(entries)} queued MCP log entries: {e}")
+    _stats["written"] += written
+    _stats["failed"] += failed
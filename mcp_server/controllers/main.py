@@ -6,7 +6,7 @@ from datetime import datetime
 from odoo import http
 from odoo.http import request
 
-from . import auth, response_utils, utils
+from . import auth, compression, health, metrics, response_utils, sampler, tracing, utils
 from .rate_limiting import rate_limit
 
 _logger = logging.getLogger(__name__)
@@ -16,6 +16,9 @@ class McpAPIController(http.Controller):
     _name = "mcp.api.controller"
 
     @http.route("/mcp/health", type="http", auth="none", methods=["GET"], csrf=False)
+    @tracing.trace_request("/mcp/health")
+    @compression.negotiate
+    @metrics.track_request("/mcp/health")
     def health_check(self, **kwargs):
         """
         Health Check Endpoint
@@ -23,10 +26,28 @@ class McpAPIController(http.Controller):
         Path: /mcp/health
         Method: GET
         Auth: None required
-        Description: Check if MCP server is running properly
-        Response: Basic server status and version information
+        Description: Check if MCP server is running properly. The default (liveness) mode answers
+            from the worker's memory, without querying the database; the enabled flag is the one
+            last cached by the worker. With deep=1 (readiness), the worker also reports database
+            latency, in-flight requests, cache states and log queue backlog; that report is
+            computed at most every few seconds per worker and served from memory in between.
+        Parameters:
+            deep: Set to 1 for the readiness report
+        Response: Basic server status and version information; 503 when disabled or not ready
         """
-        if not utils.is_mcp_enabled():
+        if kwargs.get("deep") in ("1", "true", "True"):
+            report = health.readiness(request.env)
+            report["mcp_server_version"] = utils.get_mcp_server_version()
+            if report["status"] != "ok":
+                return response_utils.error_response(
+                    message=f"MCP Server is not ready ({report['status']}).",
+                    code="E503",
+                    status=503,
+                    meta={"health": report},
+                )
+            return response_utils.success_response(report)
+
+        if not utils.is_mcp_enabled(allow_stale=True):
             return response_utils.error_response(
                 message="MCP Server is disabled globally.",
                 code="E503",
@@ -37,10 +58,14 @@ class McpAPIController(http.Controller):
         data = {
             "status": "ok",
             "mcp_server_version": mcp_server_version,
+            **health.liveness(),
         }
         return response_utils.success_response(data)
 
     @http.route("/mcp/system/info", type="http", auth="none", methods=["GET"], csrf=False)
+    @tracing.trace_request("/mcp/system/info")
+    @compression.negotiate
+    @metrics.track_request("/mcp/system/info")
     @auth.require_api_key
     @rate_limit
     def system_info(self, **kwargs):
@@ -66,6 +91,9 @@ class McpAPIController(http.Controller):
         return response_utils.success_response(system_info_data)
 
     @http.route("/mcp/auth/validate", type="http", auth="none", methods=["GET"], csrf=False)
+    @tracing.trace_request("/mcp/auth/validate")
+    @compression.negotiate
+    @metrics.track_request("/mcp/auth/validate")
     @auth.require_api_key
     @rate_limit
     def validate_auth(self, **kwargs):
@@ -94,6 +122,9 @@ class McpAPIController(http.Controller):
             return response_utils.error_response("API key validation failed unexpectedly.", "E500", status=500)
 
     @http.route("/mcp/models", type="http", auth="none", methods=["GET"], csrf=False)
+    @tracing.trace_request("/mcp/models")
+    @compression.negotiate
+    @metrics.track_request("/mcp/models")
     @auth.require_api_key
     @rate_limit
     def get_models(self, **kwargs):
@@ -126,6 +157,9 @@ class McpAPIController(http.Controller):
         methods=["GET"],
         csrf=False,
     )
+    @tracing.trace_request("/mcp/models/<model>/access")
+    @compression.negotiate
+    @metrics.track_request("/mcp/models/<model>/access")
     @auth.require_api_key
     @rate_limit
     def get_model_access(self, model, **kwargs):
@@ -220,3 +254,59 @@ class McpAPIController(http.Controller):
             "operations": operations,
         }
         return response_utils.success_response(data)
+
+    @http.route("/mcp/metrics", type="http", auth="none", methods=["GET"], csrf=False)
+    @compression.negotiate
+    @auth.require_api_key
+    @auth.require_mcp_admin
+    def get_metrics(self, **kwargs):
+        """
+        Metrics Endpoint
+        Path: /mcp/metrics
+        Method: GET
+        Auth: API key of an MCP administrator required
+        Description: Runtime metrics in Prometheus text format. Counters are kept per
+            worker process; pass aggregate=1 to sum the metrics of all workers.
+        Response: Request counters and latency histograms per endpoint, model and method,
+            rate limit rejections, cache hit ratios and log queue state
+        """
+        if kwargs.get("aggregate") in ("1", "true", "True"):
+            data = metrics.aggregated_snapshot()
+        else:
+            data = metrics.snapshot()
+        return request.make_response(
+            metrics.render(data),
+            [("Content-Type", "text/plain; version=0.0.4; charset=utf-8"), ("Cache-Control", "no-store")],
+        )
+
+    @http.route("/mcp/profile/flamegraph", type="http", auth="none", methods=["GET"], csrf=False)
+    @compression.negotiate
+    @auth.require_api_key
+    @auth.require_mcp_admin
+    def get_flamegraph(self, **kwargs):
+        """
+        Sampling Profiler Endpoint
+        Path: /mcp/profile/flamegraph
+        Method: GET
+        Auth: API key of an MCP administrator required
+        Description: Folded stacks sampled from the threads serving MCP requests in the
+            worker handling this call, over the last 15 minutes at most. Each stack is
+            rooted at "<endpoint> <model> <method>".
+        Parameters:
+            minutes: Only include the last N minutes
+            endpoint: Only include requests whose tag starts with this value (e.g. /mcp/xmlrpc/object)
+        Response: Flame graph input, one "frame;frame;frame count" line per stack
+        """
+        try:
+            minutes = int(kwargs["minutes"]) if kwargs.get("minutes") else None
+        except ValueError:
+            return response_utils.error_response("Invalid minutes parameter.", "E400", status=400)
+        stacks = sampler.folded_stacks(minutes=minutes, prefix=kwargs.get("endpoint") or None)
+        return request.make_response(
+            sampler.render_folded(stacks),
+            [
+                ("Content-Type", "text/plain; charset=utf-8"),
+                ("Cache-Control", "no-store"),
+                ("X-MCP-Sampler", sampler.worker_info()),
+            ],
+        )
@@ -0,0 +1,362 @@
+"""In-process runtime metrics for MCP Server, exposed in Prometheus text format."""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from odoo.tools import config
+
+from ..models.mcp_log_stats import LATENCY_BUCKETS_MS, LATENCY_COLUMNS
+from . import log_queue
+
+_logger = logging.getLogger(__name__)
+
+# Directory where each worker process drops its latest snapshot, for cross-worker aggregation
+SNAPSHOT_DIRECTORY = os.path.join(config["data_dir"], "mcp_metrics")
+SNAPSHOT_INTERVAL_SECONDS = 10
+# Snapshots older than this belong to workers that are gone
+SNAPSHOT_MAX_AGE_SECONDS = 300
+# Label combinations tracked per thread; model and method come from clients, so
+# further combinations are folded into a single overflow series
+MAX_SERIES_PER_SHARD = 1000
+# Shards kept between snapshots before a new thread retires those of finished threads
+MAX_UNSCRAPED_SHARDS = 1000
+OVERFLOW_LABEL = "__other__"
+
+COUNTER_HELP = {
+    "mcp_requests_total": "MCP requests handled, by endpoint, model, method and outcome",
+    "mcp_rate_limit_rejections_total": "Requests rejected by the rate limiter",
+    "mcp_acl_cache_hits_total": "Model/operation access checks served from cache",
+    "mcp_acl_cache_misses_total": "Model/operation access checks read from the database",
+    "mcp_log_queue_dropped_total": "Log entries dropped because the background log queue was full",
+    "mcp_log_queue_failed_total": "Log entries the background log queue failed to write",
+}
+
+GAUGE_HELP = {
+    "mcp_log_queue_depth": "Log entries waiting in the background log queue",
+}
+
+
+class _Shard:
+    """Counters of a single thread; only that thread writes to it, so no lock is needed."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        # (metric name, label values) -> value
+        self.counters: Dict[Tuple[str, tuple], float] = {}
+        # (endpoint, model, method) -> bucket counts followed by [sum, count]
+        self.histograms: Dict[tuple, List[float]] = {}
+
+
+_local = threading.local()
+# Shards of the threads that recorded metrics, with their thread
+_shards: List[Tuple[threading.Thread, _Shard]] = []
+# Metrics of the threads that have exited, folded together
+_retired = _Shard()
+_shards_lock = threading.Lock()
+_last_snapshot = [0.0]
+
+
+def _shard() -> _Shard:
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = _Shard()
+        # Taken on the first update of every thread, which for the threaded server
+        # means every request: shards of finished threads are retired by snapshots
+        # (scrapes and the periodic worker snapshot), here only when none ran for long
+        with _shards_lock:
+            if len(_shards) >= MAX_UNSCRAPED_SHARDS:
+                _retire_dead_shards()
+            _shards.append((threading.current_thread(), shard))
+    return shard
+
+
+def _merge(target: _Shard, shard: _Shard) -> None:
+    """Add the metrics of a shard to another, within the series limit of a shard."""
+    overflow = {}
+    for labels, values in dict(shard.histograms).items():
+        if labels not in target.histograms and len(target.histograms) >= MAX_SERIES_PER_SHARD:
+            overflow[labels] = (labels[0], OVERFLOW_LABEL, OVERFLOW_LABEL)
+        merged = target.histograms.setdefault(overflow.get(labels, labels), [0] * len(values))
+        for index, value in enumerate(list(values)):
+            merged[index] += value
+    for (name, labels), value in dict(shard.counters).items():
+        if name == "mcp_requests_total" and labels[:3] in overflow:
+            labels = overflow[labels[:3]] + labels[3:]
+        target.counters[(name, labels)] = target.counters.get((name, labels), 0) + value
+
+
+def _retire_dead_shards() -> None:
+    """Fold the shards of exited threads into the retired metrics; call with _shards_lock held."""
+    alive = []
+    for thread, shard in _shards:
+        if thread.is_alive():
+            alive.append((thread, shard))
+        else:
+            # The thread is gone, nothing writes to its shard anymore
+            _merge(_retired, shard)
+    _shards[:] = alive
+
+
+def inc(name: str, labels: tuple = (), value: float = 1) -> None:
+    """
+    Increment a counter in the calling thread's shard.
+
+    :param name: Metric name (see COUNTER_HELP)
+    :param labels: Label values, in the order of the metric's label names
+    :param value: Increment
+    """
+    counters = _shard().counters
+    key = (name, labels)
+    counters[key] = counters.get(key, 0) + value
+
+
+def _bucket_index(duration_ms: float) -> int:
+    for index, bound in enumerate(LATENCY_BUCKETS_MS):
+        if duration_ms <= bound:
+            return index
+    return len(LATENCY_BUCKETS_MS)
+
+
+def observe_request(
+    endpoint: str, model: Optional[str], method: Optional[str], duration_ms: float, status: str
+) -> None:
+    """
+    Count a handled request and add its duration to the latency histogram.
+
+    :param endpoint: Request path (route, not the raw URL)
+    :param model: Technical model name, if any
+    :param method: Model method or operation, if any
+    :param duration_ms: Handling time in milliseconds
+    :param status: Outcome, e.g. "ok", "denied", "error"
+    """
+    labels = (endpoint, model or "", method or "")
+    shard = _shard()
+    if labels not in shard.histograms and len(shard.histograms) >= MAX_SERIES_PER_SHARD:
+        labels = (endpoint, OVERFLOW_LABEL, OVERFLOW_LABEL)
+    key = ("mcp_requests_total", labels + (status,))
+    shard.counters[key] = shard.counters.get(key, 0) + 1
+
+    histogram = shard.histograms.get(labels)
+    if histogram is None:
+        histogram = shard.histograms[labels] = [0] * (len(LATENCY_COLUMNS) + 2)
+    histogram[_bucket_index(duration_ms)] += 1
+    histogram[-2] += duration_ms
+    histogram[-1] += 1
+
+    now = time.monotonic()
+    if now - _last_snapshot[0] > SNAPSHOT_INTERVAL_SECONDS:
+        _last_snapshot[0] = now
+        write_snapshot()
+
+
+def snapshot() -> Dict[str, dict]:
+    """
+    Merge the shards of all threads of this process.
+
+    Dict copies are atomic under the GIL, so shards are read without locking
+    the threads that write to them.
+
+    :return: Dict with "counters" and "histograms"
+    :rtype: dict
+    """
+    counters: Dict[Tuple[str, tuple], float] = {}
+    histograms: Dict[tuple, List[float]] = {}
+    with _shards_lock:
+        _retire_dead_shards()
+        shards = [shard for _thread, shard in _shards]
+        shards.append(_Shard())
+        _merge(shards[-1], _retired)
+    for shard in shards:
+        for key, value in dict(shard.counters).items():
+            counters[key] = counters.get(key, 0) + value
+        for key, values in dict(shard.histograms).items():
+            merged = histograms.setdefault(key, [0] * len(values))
+            for index, value in enumerate(list(values)):
+                merged[index] += value
+
+    queue_stats = log_queue.get_queue_stats()
+    counters[("mcp_log_queue_depth", ())] = queue_stats["depth"]
+    counters[("mcp_log_queue_dropped_total", ())] = queue_stats["dropped"]
+    counters[("mcp_log_queue_failed_total", ())] = queue_stats["failed"]
+    return {"counters": counters, "histograms": histograms}
+
+
+def _snapshot_path(pid: int) -> str:
+    return os.path.join(SNAPSHOT_DIRECTORY, f"{pid}.json")
+
+
+def write_snapshot() -> None:
+    """Publish this worker's metrics for aggregation by other workers."""
+    data = snapshot()
+    payload = {
+        "counters": [[name, list(labels), value] for (name, labels), value in data["counters"].items()],
+        "histograms": [[list(labels), values] for labels, values in data["histograms"].items()],
+    }
+    try:
+        os.makedirs(SNAPSHOT_DIRECTORY, exist_ok=True)
+        path = _snapshot_path(os.getpid())
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as snapshot_file:
+            json.dump(payload, snapshot_file)
+        os.replace(temporary, path)
+    except OSError as e:
+        _logger.debug(f"Could not write MCP metrics snapshot: {e}")
+
+
+def aggregated_snapshot() -> Dict[str, dict]:
+    """
+    Merge the snapshots published by all live workers with this process's metrics.
+
+    :return: Dict with "counters" and "histograms"
+    :rtype: dict
+    """
+    write_snapshot()
+    counters: Dict[Tuple[str, tuple], float] = {}
+    histograms: Dict[tuple, List[float]] = {}
+    try:
+        names = os.listdir(SNAPSHOT_DIRECTORY)
+    except OSError:
+        return snapshot()
+
+    now = time.time()
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(SNAPSHOT_DIRECTORY, name)
+        try:
+            if now - os.path.getmtime(path) > SNAPSHOT_MAX_AGE_SECONDS:
+                os.remove(path)
+                continue
+            with open(path) as snapshot_file:
+                payload = json.load(snapshot_file)
+        except (OSError, ValueError):
+            continue
+        for metric, labels, value in payload.get("counters", []):
+            key = (metric, tuple(labels))
+            counters[key] = counters.get(key, 0) + value
+        for labels, values in payload.get("histograms", []):
+            merged = histograms.setdefault(tuple(labels), [0] * len(values))
+            for index, value in enumerate(values):
+                merged[index] += value
+    return {"counters": counters, "histograms": histograms}
+
+
+def track_request(endpoint: str):
+    """
+    Decorator recording the outcome and duration of a REST endpoint.
+
+    The model label is taken from the `model` route argument when present.
+
+    :param endpoint: Route of the endpoint, used as label (e.g. "/mcp/models")
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = "500"
+            try:
+                response = func(*args, **kwargs)
+                status = str(getattr(response, "status_code", 200))
+                return response
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                observe_request(endpoint, kwargs.get("model"), None, duration_ms, status)
+
+        return wrapper
+
+    return decorator
+
+
+def reset() -> None:
+    """Drop all collected metrics of this process (used by tests)."""
+    with _shards_lock:
+        for _thread, shard in _shards:
+            shard.counters.clear()
+            shard.histograms.clear()
+        _retired.counters.clear()
+        _retired.histograms.clear()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _number(value) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _ratio(hits: float, misses: float) -> float:
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+def render(data: Dict[str, dict]) -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    :param data: Result of :func:`snapshot` or :func:`aggregated_snapshot`
+    :return: Metrics text
+    :rtype: str
+    """
+    label_names = {
+        "mcp_requests_total": ("endpoint", "model", "method", "status"),
+    }
+    lines = []
+    by_metric: Dict[str, list] = {}
+    for (name, labels), value in data["counters"].items():
+        by_metric.setdefault(name, []).append((labels, value))
+
+    for name, help_text, metric_type in [
+        *((name, help_text, "counter") for name, help_text in COUNTER_HELP.items()),
+        *((name, help_text, "gauge") for name, help_text in GAUGE_HELP.items()),
+    ]:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        samples = by_metric.get(name)
+        if not samples and name not in label_names:
+            samples = [((), 0)]
+        for labels, value in sorted(samples or []):
+            lines.append(f"{name}{_labels(label_names.get(name, ()), labels)} {_number(value)}")
+
+    name = "mcp_request_duration_ms"
+    lines.append(f"# HELP {name} MCP request handling time in milliseconds")
+    lines.append(f"# TYPE {name} histogram")
+    histogram_labels = ("endpoint", "model", "method")
+    for labels, values in sorted(data["histograms"].items()):
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, values):
+            cumulative += count
+            bucket_labels = _labels(histogram_labels + ("le",), labels + (bound,))
+            lines.append(f"{name}_bucket{bucket_labels} {_number(cumulative)}")
+        lines.append(f"{name}_bucket{_labels(histogram_labels + ('le',), labels + ('+Inf',))} {_number(values[-1])}")
+        lines.append(f"{name}_sum{_labels(histogram_labels, labels)} {_number(values[-2])}")
+        lines.append(f"{name}_count{_labels(histogram_labels, labels)} {_number(values[-1])}")
+
+    totals = {}
+    for (metric, _labels_values), value in data["counters"].items():
+        totals[metric] = totals.get(metric, 0) + value
+    ratios = {
+        "mcp_acl_cache_hit_ratio": (
+            "Share of access checks served from cache",
+            _ratio(totals.get("mcp_acl_cache_hits_total", 0), totals.get("mcp_acl_cache_misses_total", 0)),
+        ),
+    }
+    for name, (help_text, value) in ratios.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {_number(value)}")
+    return "\n".join(lines) + "\n"
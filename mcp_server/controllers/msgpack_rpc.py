@@ -0,0 +1,136 @@
+"""MessagePack encoding for the MCP object endpoint."""
+
+import itertools
+from datetime import date, datetime
+from typing import Any, Iterator, List
+
+from odoo import fields
+
+from .jsonrpc import PARAM_NAMES
+from .xmlrpc_stream import CHUNK_SIZE
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+CONTENT_TYPE = "application/msgpack"
+
+# Extension types, with the value formatted as an Odoo server string (UTF-8)
+EXT_DATE = 1
+EXT_DATETIME = 2
+
+
+def _default(value):
+    """Pack the values MessagePack has no type for."""
+    # datetime first: it is a subclass of date
+    if isinstance(value, datetime):
+        return msgpack.ExtType(EXT_DATETIME, fields.Datetime.to_string(value).encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(EXT_DATE, fields.Date.to_string(value).encode())
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+def _ext_hook(code: int, data: bytes):
+    if code == EXT_DATE:
+        return fields.Date.to_date(data.decode())
+    if code == EXT_DATETIME:
+        return fields.Datetime.to_datetime(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _packer():
+    return msgpack.Packer(default=_default, use_bin_type=True, strict_types=False)
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode a response.
+
+    :param payload: Response map
+    :return: MessagePack document
+    :rtype: bytes
+    """
+    return _packer().pack(payload)
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a request body.
+
+    :param data: Request body
+    :return: Decoded document
+    :raises ValueError: If the body is not a single valid MessagePack document
+    """
+    try:
+        return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+    except (ValueError, TypeError, msgpack.exceptions.UnpackException) as e:
+        raise ValueError(str(e) or type(e).__name__) from e
+
+
+def parse_call(call: Any) -> List[Any]:
+    """
+    Extract the execute_kw parameters of a request.
+
+    :param call: Array of execute_kw parameters, or map with the names in PARAM_NAMES
+    :return: execute_kw parameters
+    :rtype: list
+    :raises ValueError: If the request is neither an array nor a map
+    """
+    if isinstance(call, dict):
+        return [call.get(name) for name in PARAM_NAMES[:5]] + [call.get("args") or [], call.get("kwargs") or {}]
+    if isinstance(call, list):
+        return call
+    raise ValueError("expected an array or a map of execute_kw parameters")
+
+
+def result(value: Any) -> dict:
+    """Build a success response map."""
+    return {"result": value}
+
+
+def error(code: int, message: str) -> dict:
+    """Build an error response map."""
+    return {"error": {"code": code, "message": message}}
+
+
+def iter_result(rows: list, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode a {"result": [...]} response one chunk of rows at a time.
+
+    The array header carries the row count, so the chunks form a single
+    document that streaming unpackers can read row by row.
+
+    :param rows: List returned by the model method
+    :param chunk_size: Approximate size of the yielded chunks, in bytes
+    :return: Iterator of MessagePack chunks
+    """
+    packer = _packer()
+    buffer = [packer.pack_map_header(1), packer.pack("result"), packer.pack_array_header(len(rows))]
+    buffered = 0
+    for row in rows:
+        data = packer.pack(row)
+        buffer.append(data)
+        buffered += len(data)
+        if buffered >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            buffered = 0
+    yield b"".join(buffer)
+
+
+def stream_result(rows: list, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Start encoding a streamed response and return the chunk iterator to send.
+
+    As for XML-RPC, the first chunk is encoded right away so that a value
+    that cannot be packed in the first rows is raised before the response starts.
+
+    :param rows: List returned by the model method
+    :param chunk_size: Approximate size of the yielded chunks, in bytes
+    :return: Iterator of MessagePack chunks
+    """
+    chunks = iter_result(rows, chunk_size)
+    return itertools.chain([next(chunks)], chunks)
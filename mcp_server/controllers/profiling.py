@@ -0,0 +1,86 @@
+"""Opt-in profiling of single MCP requests for administrators."""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from odoo import fields
+from odoo.http import request
+from odoo.tools.profiler import Profiler
+
+_logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-MCP-Profile"
+PROFILE_RESULT_HEADER = "X-MCP-Profile-Attachment"
+# Collectors: executed SQL with timings, and a sampled call tree (cheap compared to tracing every call)
+PROFILE_COLLECTORS = ["sql", "traces_async"]
+PROFILE_MAX_CONCURRENT = 2
+
+_profile_slots = threading.BoundedSemaphore(PROFILE_MAX_CONCURRENT)
+
+
+def is_profile_requested() -> bool:
+    """Check whether the client asked for this request to be profiled."""
+    value = request.httprequest.headers.get(PROFILE_HEADER, "")
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def profile_request(user, description: str):
+    """
+    Run the wrapped code under the Odoo profiler if the client asked for it.
+
+    Profiling is restricted to MCP administrators and to PROFILE_MAX_CONCURRENT
+    requests at a time; over the limit, requests run unprofiled and the
+    response says so instead of waiting for a slot.
+
+    :param user: Authenticated user (res.users record) or None
+    :param description: Profile description, e.g. "res.partner.search_read"
+    :return: Context manager yielding the profiler, or None when not profiling
+    """
+    if not is_profile_requested():
+        yield None
+        return
+    if not user or not user.has_group("mcp_server.group_mcp_admin"):
+        request.future_response.headers[PROFILE_RESULT_HEADER] = "denied"
+        yield None
+        return
+    if not _profile_slots.acquire(blocking=False):
+        request.future_response.headers[PROFILE_RESULT_HEADER] = "busy"
+        yield None
+        return
+    try:
+        # db=None: results are kept in memory and stored as an attachment, not in ir.profile
+        with Profiler(collectors=PROFILE_COLLECTORS, db=None, description=description) as profiler:
+            yield profiler
+    finally:
+        _profile_slots.release()
+
+
+def save_profile(env, profiler, log):
+    """
+    Store a finished profile as a JSON attachment of the request's log entry.
+
+    :param env: Odoo environment
+    :param profiler: Profiler yielded by :func:`profile_request`
+    :param log: mcp.log record of the request (may be empty)
+    :return: The created ir.attachment record, or None on failure
+    """
+    try:
+        log = log[:1]
+        attachment = env["ir.attachment"].sudo().create(
+            {
+                "name": f"mcp_profile_{log.id or 'request'}_{fields.Datetime.now():%Y%m%d_%H%M%S}.json",
+                "raw": profiler.json().encode(),
+                "mimetype": "application/json",
+                "res_model": "mcp.log",
+                "res_id": log.id or False,
+            }
+        )
+        if log:
+            log.profile_attachment_id = attachment
+        request.future_response.headers[PROFILE_RESULT_HEADER] = str(attachment.id)
+        return attachment
+    except Exception as e:
+        _logger.warning(f"Failed to store MCP request profile: {e}")
+        return None
@@ -8,6 +8,8 @@ from typing import Any, Callable, Dict, List
 from odoo.exceptions import UserError
 from odoo.http import request
 
+from . import metrics, tracing
+
 _logger = logging.getLogger(__name__)
 
 # Constants for rate limiting configuration
@@ -73,6 +75,14 @@ def check_rate_limit(user_id: int) -> bool:
     :return: True if the user is within the limit, False otherwise.
     :rtype: bool
     """
+    with tracing.span("rate_limit"):
+        allowed = _check_rate_limit(user_id)
+    if not allowed:
+        metrics.inc("mcp_rate_limit_rejections_total")
+    return allowed
+
+
+def _check_rate_limit(user_id: int) -> bool:
     limit = get_request_limit()
 
     # If limit is 0, allow unlimited requests
@@ -0,0 +1,196 @@
+"""Streaming NDJSON export of model records, read in keyset-paginated chunks."""
+
+import json
+import logging
+
+from odoo import api, http
+from odoo.exceptions import AccessError, UserError
+from odoo.http import Response, request
+from odoo.modules.registry import Registry
+from odoo.tools import SQL
+
+from . import auth, compression, jsonrpc, metrics, response_utils, tracing, utils
+from .rate_limiting import rate_limit
+
+_logger = logging.getLogger(__name__)
+
+RECORD_EXPORT_SCOPE = "mcp_server.record_export"
+# Ids selected, and records read, per chunk
+EXPORT_CHUNK_SIZE = 1000
+
+
+def encode_export_cursor(env, model_name, last_id):
+    """Return the signed token resuming an export of a model after the given id."""
+    return utils.encode_cursor(env, [model_name, int(last_id)], scope=RECORD_EXPORT_SCOPE)
+
+
+def decode_export_cursor(env, model_name, token):
+    """
+    Return the record id an export token resumes after.
+
+    :raises ValueError: If the token is invalid or was issued for another model
+    """
+    try:
+        cursor_model, last_id = utils.decode_cursor(env, token, scope=RECORD_EXPORT_SCOPE)
+        last_id = int(last_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid export cursor: {e}") from e
+    if cursor_model != model_name:
+        raise ValueError("Invalid export cursor: it was issued for another model")
+    return last_id
+
+
+def stream_record_export(dbname, uid, model_name, query, fields_list, after_id, limit):
+    """
+    Generate the NDJSON body of a record export, one chunk of lines at a time.
+
+    Record ids are selected from the search query EXPORT_CHUNK_SIZE at a
+    time, keyset-paginated on the id, and each chunk is read with the ORM
+    and dropped from the cache before the next one, so worker memory does
+    not depend on the number of exported records. All chunks are read in
+    the transaction of a dedicated cursor that lives as long as the response
+    stream, so they share one snapshot. The last line holds the token to
+    resume the export from, and whether no matching record is left.
+
+    :param dbname: Database to export from
+    :param uid: ID of the exporting user
+    :param model_name: Technical model name
+    :param query: SQL selecting the ids to export
+    :type query: odoo.tools.SQL
+    :param fields_list: Fields to read
+    :param after_id: Id the export starts after
+    :param limit: Maximum number of exported records, or None
+    :return: Generator of encoded lines
+    """
+    with Registry(dbname).cursor() as cr:
+        env = api.Environment(cr, uid, {})
+        env = env(context=env["res.users"].context_get())
+        model = env[model_name]
+        last_id = after_id
+        count = 0
+        more = True
+        error = None
+        try:
+            while more:
+                size = EXPORT_CHUNK_SIZE if limit is None else min(EXPORT_CHUNK_SIZE, limit - count)
+                # One id past the chunk tells whether records are left once the limit is reached
+                cr.execute(
+                    SQL("SELECT q.id FROM (%s) q WHERE q.id > %s ORDER BY q.id LIMIT %s", query, last_id, size + 1)
+                )
+                ids = [row[0] for row in cr.fetchall()]
+                more = len(ids) > size
+                ids = ids[:size]
+                if ids:
+                    rows = model.browse(ids).read(fields_list)
+                    yield b"".join(jsonrpc.dumps(row) + b"\n" for row in rows)
+                    last_id = ids[-1]
+                    count += len(ids)
+                    env.invalidate_all()
+                if limit is not None and count >= limit:
+                    break
+        except Exception as e:
+            # Headers are already sent, report the failure in-band and let the client resume
+            _logger.error(f"MCP record export of {model_name} failed after {count} records: {e}")
+            error = {"error": "Export interrupted", "rows": count}
+            # The failed statement aborted the transaction, the trailer still reads the signing secret
+            cr.rollback()
+
+        trailer = {
+            "next_cursor": encode_export_cursor(env, model_name, last_id),
+            "rows": count,
+            "complete": not more,
+        }
+        if error:
+            trailer.update(error, complete=False)
+        yield (json.dumps(trailer, separators=(",", ":")) + "\n").encode()
+
+
+class McpRecordExportController(http.Controller):
+    @http.route(
+        "/mcp/models/<string:model>/export",
+        type="http",
+        auth="none",
+        methods=["POST"],
+        csrf=False,
+    )
+    @tracing.trace_request("/mcp/models/<model>/export")
+    @compression.negotiate
+    @metrics.track_request("/mcp/models/<model>/export")
+    @auth.require_api_key
+    @rate_limit
+    def export_records(self, model, **kwargs):
+        """
+        Record Export Endpoint
+        Path: /mcp/models/{model}/export
+        Method: POST
+        Auth: API key required; the model must be MCP-enabled with read access
+        Description: Stream the records matching a domain as NDJSON, in id order, for bulk pulls.
+            Access is checked once, then ids are selected and records read in chunks.
+        Body: {"domain": [...], "fields": ["name", ...], "cursor": "...", "after_id": 0, "limit": null}
+            cursor: Token returned by the previous export, to resume after its last record
+            after_id: Resume after this record id (ignored when cursor is given), e.g. the id
+                of the last record received before the connection dropped
+        Response: Chunked stream of records, the last line holds the next cursor
+        """
+        if not utils.is_mcp_enabled():
+            return response_utils.error_response(message="MCP Server is disabled globally.", code="E503", status=503)
+
+        user = kwargs.get("user")
+        try:
+            model_name = utils.sanitize_model_name(model)
+        except ValueError as e:
+            return response_utils.error_response(str(e), "E400", status=400)
+        if model_name not in request.env or not utils.check_mcp_access(
+            request.env(user=user.id), model_name, "search_read"
+        ):
+            return response_utils.error_response(
+                f"Access denied by MCP for model '{model_name}' method 'export'.", "E403", status=403
+            )
+
+        records = request.env(user=user.id)[model_name]
+        try:
+            body = json.loads(compression.request_data() or b"{}")
+            domain = body.get("domain") or []
+            fields_list = body.get("fields")
+            if not isinstance(domain, list):
+                raise ValueError("domain must be a list")
+            if not fields_list or not isinstance(fields_list, list):
+                raise ValueError("fields must be a non-empty list of field names")
+            unknown = [name for name in fields_list if name not in records._fields]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(map(str, unknown))}")
+            if body.get("cursor"):
+                after_id = decode_export_cursor(request.env, model_name, body["cursor"])
+            else:
+                after_id = int(body.get("after_id") or 0)
+            limit = max(1, int(body["limit"])) if body.get("limit") else None
+            # Access rights, record rules and the domain are checked here, once
+            query = records._search([("id", ">", after_id), *domain], order="id")
+        except AccessError as e:
+            return response_utils.error_response(str(e), "E403", status=403)
+        except (UserError, ValueError, TypeError, AttributeError) as e:
+            return response_utils.error_response(f"Invalid export parameters: {e}", "E400", status=400)
+
+        request.env["mcp.log"].sudo().log_model_access(
+            model_name=model_name,
+            operation="export",
+            user_id=user.id,
+            endpoint=request.httprequest.path,
+            http_method=request.httprequest.method,
+            ip_address=request.httprequest.remote_addr,
+        )
+
+        stream = stream_record_export(
+            request.env.cr.dbname, user.id, model_name, query.select(), fields_list, after_id, limit
+        )
+        # No Content-Length: the body is sent with chunked transfer encoding
+        return Response(
+            stream,
+            status=200,
+            headers=[
+                ("Content-Type", "application/x-ndjson; charset=utf-8"),
+                ("Cache-Control", "no-store"),
+                ("X-Content-Type-Options", "nosniff"),
+            ],
+            direct_passthrough=True,
+        )
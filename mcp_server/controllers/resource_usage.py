@@ -0,0 +1,98 @@
+"""Per-request resource accounting: SQL queries, rows, response size and peak memory."""
+
+import logging
+import random
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict
+
+_logger = logging.getLogger(__name__)
+
+# tracemalloc traces every thread of the process, so only one request at a time is measured
+_memory_slot = threading.Lock()
+
+
+class ResourceUsage:
+    """Resources consumed by one request, as stored on its mcp.log entry."""
+
+    __slots__ = ("sql_count", "sql_time_ms", "rows_returned", "response_bytes", "peak_memory_kb")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time_ms = 0.0
+        self.rows_returned = None
+        self.response_bytes = None
+        self.peak_memory_kb = None
+
+    def log_values(self) -> Dict[str, Any]:
+        """Return the measured values as keyword arguments for mcp.log.log_event."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def count_rows(result: Any) -> int:
+    """
+    Count the rows returned by a model method.
+
+    :param result: Return value of the method
+    :return: Length of a returned list, 1 for a single record dict, 0 otherwise
+    :rtype: int
+    """
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, dict):
+        return 1
+    return 0
+
+
+def _sample_memory(env) -> bool:
+    try:
+        rate = float(env["ir.config_parameter"].sudo().get_param("mcp_server.memory_sample_rate", "0"))
+    except (TypeError, ValueError):
+        return False
+    return rate > 0 and random.random() < rate
+
+
+@contextmanager
+def measure(env):
+    """
+    Measure the resources used by the wrapped code on the calling thread.
+
+    SQL counts come from the per-thread counters the Odoo cursor maintains, so
+    they are always collected at no extra cost. Peak memory (above the memory
+    in use on entry) requires tracemalloc and is only measured for the share
+    of requests set in `mcp_server.memory_sample_rate` (0 to 1, default 0),
+    one request at a time; allocations made by other threads meanwhile are
+    included.
+
+    :param env: Odoo environment, used to read the sample rate
+    :return: Context manager yielding a :class:`ResourceUsage` filled in on exit
+    """
+    usage = ResourceUsage()
+    thread = threading.current_thread()
+    query_count = getattr(thread, "query_count", 0)
+    query_time = getattr(thread, "query_time", 0.0)
+
+    memory = _sample_memory(env) and _memory_slot.acquire(blocking=False)
+    started_tracing = False
+    baseline = 0
+    if memory:
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+            started_tracing = True
+        baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        yield usage
+    finally:
+        usage.sql_count = getattr(thread, "query_count", 0) - query_count
+        usage.sql_time_ms = round((getattr(thread, "query_time", 0.0) - query_time) * 1000, 3)
+        if memory:
+            try:
+                usage.peak_memory_kb = max(tracemalloc.get_traced_memory()[1] - baseline, 0) // 1024
+                if started_tracing:
+                    tracemalloc.stop()
+            finally:
+                _memory_slot.release()
+
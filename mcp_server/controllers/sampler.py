@@ -0,0 +1,148 @@
+"""Always-on statistical sampler of the threads serving MCP requests."""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Samples per second of each busy MCP thread; prime, to avoid lockstep with periodic work
+SAMPLE_RATE_HZ = 19
+MAX_STACK_DEPTH = 64
+# Rolling window: WINDOW_SLICES slices of WINDOW_SLICE_SECONDS each (15 minutes)
+WINDOW_SLICE_SECONDS = 60
+WINDOW_SLICES = 15
+
+# Thread ident -> trace of the MCP request the thread is serving (see tracing.trace_request)
+_active: Dict[int, object] = {}
+# (slice start, {folded stack: samples}); only the sampler thread writes to it
+_window: deque = deque(maxlen=WINDOW_SLICES)
+_sampler_lock = threading.Lock()
+_sampler_thread = None
+
+
+def register(trace) -> None:
+    """Mark the calling thread as serving an MCP request, so it gets sampled."""
+    _active[threading.get_ident()] = trace
+
+
+def unregister() -> None:
+    """Stop sampling the calling thread."""
+    _active.pop(threading.get_ident(), None)
+
+
+def ensure_started() -> None:
+    """Start the sampler thread of this process if it is not running yet."""
+    global _sampler_thread
+    if _sampler_thread is not None and _sampler_thread.is_alive():
+        return
+    with _sampler_lock:
+        if _sampler_thread is None or not _sampler_thread.is_alive():
+            _sampler_thread = threading.Thread(target=_sampler_loop, name="mcp.sampler", daemon=True)
+            _sampler_thread.start()
+
+
+def _tag(trace) -> str:
+    parts = [getattr(trace, "name", "") or "unknown"]
+    attributes = getattr(trace, "attributes", {}) or {}
+    if attributes.get("model"):
+        parts.append(str(attributes["model"]))
+    if attributes.get("method"):
+        parts.append(str(attributes["method"]))
+    # ";" separates frames in the folded format
+    return " ".join(parts).replace(";", ":")
+
+
+def fold_stack(frame, tag: str) -> str:
+    """
+    Render a frame and its callers as a folded stack line (root first).
+
+    :param frame: Innermost frame of the sampled thread
+    :param tag: Request tag put at the root of the stack
+    :return: Folded stack, e.g. "/mcp/xmlrpc/object res.partner read;odoo.http:dispatch;..."
+    :rtype: str
+    """
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}".replace(";", ":"))
+        frame = frame.f_back
+    names.append(tag)
+    return ";".join(reversed(names))
+
+
+def _current_slice() -> dict:
+    slice_start = int(time.time() // WINDOW_SLICE_SECONDS * WINDOW_SLICE_SECONDS)
+    if not _window or _window[-1][0] != slice_start:
+        _window.append((slice_start, {}))
+    return _window[-1][1]
+
+
+def sample_once() -> int:
+    """
+    Take one sample of every thread currently serving an MCP request.
+
+    :return: Number of sampled threads
+    :rtype: int
+    """
+    active = dict(_active)
+    if not active:
+        return 0
+    frames = sys._current_frames()
+    stacks = _current_slice()
+    sampled = 0
+    for ident, trace in active.items():
+        frame = frames.get(ident)
+        if frame is None:
+            continue
+        folded = fold_stack(frame, _tag(trace))
+        stacks[folded] = stacks.get(folded, 0) + 1
+        sampled += 1
+    return sampled
+
+
+def _sampler_loop() -> None:
+    interval = 1.0 / SAMPLE_RATE_HZ
+    while True:
+        time.sleep(interval)
+        try:
+            sample_once()
+        except Exception as e:
+            _logger.debug(f"MCP sampler error: {e}")
+
+
+def folded_stacks(minutes: Optional[int] = None, prefix: Optional[str] = None) -> Dict[str, int]:
+    """
+    Aggregate the folded stacks sampled by this worker over the recent window.
+
+    :param minutes: Only include the last N minutes (whole window if not given)
+    :param prefix: Only include stacks whose request tag starts with this (e.g. an endpoint)
+    :return: Dict of folded stack to sample count
+    :rtype: dict
+    """
+    # Slices are only added while samples are taken, so an idle worker may still hold old ones
+    since = time.time() - (minutes * 60 if minutes else WINDOW_SLICES * WINDOW_SLICE_SECONDS)
+    result: Dict[str, int] = {}
+    for slice_start, stacks in list(_window):
+        if slice_start + WINDOW_SLICE_SECONDS < since:
+            continue
+        for folded, count in dict(stacks).items():
+            if prefix and not folded.startswith(prefix):
+                continue
+            result[folded] = result.get(folded, 0) + count
+    return result
+
+
+def render_folded(stacks: Dict[str, int]) -> str:
+    """Render folded stacks as flame graph input ("frame;frame;frame count" lines)."""
+    lines = [f"{folded} {count}" for folded, count in sorted(stacks.items(), key=lambda item: -item[1])]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def worker_info() -> str:
+    """Describe the sampler of this worker, for response headers."""
+    return f"pid={os.getpid()} rate={SAMPLE_RATE_HZ}Hz window={WINDOW_SLICES * WINDOW_SLICE_SECONDS}s"
@@ -0,0 +1,212 @@
+"""Detection of slow MCP calls, with a stack snapshot and the SQL they ran."""
+
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from odoo.modules.registry import Registry
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD_MS = 1000
+WATCHDOG_INTERVAL_SECONDS = 0.05
+MAX_STACK_FRAMES = 64
+# Last statements kept per request, and how much of each is kept
+SQL_RING_SIZE = 50
+SQL_MAX_LENGTH = 2000
+
+# Positional execute_kw arguments of the methods whose domain, fields and limit are journaled
+CALL_SIGNATURES = {
+    "search": ("domain", "offset", "limit", "order"),
+    "search_count": ("domain", "limit"),
+    "search_read": ("domain", "fields", "offset", "limit", "order"),
+    "search_fetch": ("domain", "field_names", "offset", "limit", "order"),
+    "read": ("ids", "fields"),
+    "read_group": ("domain", "fields", "groupby", "offset", "limit", "orderby"),
+}
+
+# Thread ident -> _Watch of the request the thread is serving
+_watches: Dict[int, "_Watch"] = {}
+_watchdog_lock = threading.Lock()
+_watchdog_thread = None
+
+
+class _Watch:
+    """State of one watched request, shared between its thread and the watchdog."""
+
+    __slots__ = ("deadline", "stack", "statements", "sql_count")
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.stack = None
+        # (statement, duration in ms), newest last
+        self.statements = deque(maxlen=SQL_RING_SIZE)
+        self.sql_count = 0
+
+    def query_hook(self, cr, query, params, query_start, query_time):
+        """Cursor hook (see odoo.sql_db.Cursor.execute) recording each statement."""
+        self.sql_count += 1
+        statement = query.decode(errors="replace") if isinstance(query, bytes) else str(query)
+        self.statements.append((statement[:SQL_MAX_LENGTH], round(query_time * 1000, 3)))
+
+
+def get_threshold_ms(env) -> int:
+    """
+    Read the `mcp_server.slow_request_threshold_ms` system parameter.
+
+    :return: Threshold in milliseconds, 0 when slow request detection is disabled
+    :rtype: int
+    """
+    try:
+        return int(
+            env["ir.config_parameter"].sudo().get_param("mcp_server.slow_request_threshold_ms", DEFAULT_THRESHOLD_MS)
+        )
+    except (ValueError, TypeError):
+        return DEFAULT_THRESHOLD_MS
+
+
+def _ensure_watchdog() -> None:
+    global _watchdog_thread
+    if _watchdog_thread is not None and _watchdog_thread.is_alive():
+        return
+    with _watchdog_lock:
+        if _watchdog_thread is None or not _watchdog_thread.is_alive():
+            _watchdog_thread = threading.Thread(target=_watchdog_loop, name="mcp.slow.watchdog", daemon=True)
+            _watchdog_thread.start()
+
+
+def capture_overdue(now: Optional[float] = None) -> int:
+    """
+    Take a stack snapshot of every watched request past its deadline.
+
+    Each request is captured once, while it is still running.
+
+    :param now: time.monotonic() value to compare deadlines with
+    :return: Number of captured stacks
+    :rtype: int
+    """
+    now = time.monotonic() if now is None else now
+    overdue = {
+        ident: watch for ident, watch in list(_watches.items()) if watch.stack is None and watch.deadline <= now
+    }
+    if not overdue:
+        return 0
+    frames = sys._current_frames()
+    captured = 0
+    for ident, watch in overdue.items():
+        frame = frames.get(ident)
+        if frame is None:
+            continue
+        watch.stack = "".join(traceback.format_stack(frame)[-MAX_STACK_FRAMES:])
+        captured += 1
+    return captured
+
+
+def _watchdog_loop() -> None:
+    while True:
+        time.sleep(WATCHDOG_INTERVAL_SECONDS)
+        try:
+            capture_overdue()
+        except Exception as e:
+            _logger.debug(f"MCP slow request watchdog error: {e}")
+
+
+def describe_call(method: str, args: list, kwargs: dict) -> Dict[str, Any]:
+    """
+    Extract the domain, fields and limit of an execute_kw call.
+
+    :param method: Model method name
+    :param args: Positional arguments of the call
+    :param kwargs: Keyword arguments of the call
+    :return: Dict with "domain", "requested_fields" and "query_limit" (missing ones omitted)
+    :rtype: dict
+    """
+    call = dict(zip(CALL_SIGNATURES.get(method, ()), args or []))
+    call.update(kwargs or {})
+    fields_list = call.get("fields", call.get("field_names"))
+
+    description = {}
+    if call.get("domain") is not None:
+        description["domain"] = json.dumps(call["domain"], default=str)
+    if fields_list is not None:
+        description["requested_fields"] = json.dumps(fields_list, default=str)
+    if isinstance(call.get("limit"), int):
+        description["query_limit"] = call["limit"]
+    return description
+
+
+@contextmanager
+def watch(env, endpoint: str, model_name: str, method: str, args: list, kwargs: dict, user_id=None):
+    """
+    Journal the wrapped call in mcp.slow.request if it exceeds the threshold.
+
+    While the call runs, its SQL statements are kept in a small ring buffer
+    through the cursor's query hooks, and a watchdog thread snapshots its
+    stack once the threshold is crossed. Nothing is written for calls under
+    the threshold. The entry is written with a separate cursor, so it is kept
+    even when the call fails and its transaction is rolled back.
+
+    :param env: Odoo environment of the request
+    :param endpoint: Request path
+    :param model_name: Technical model name
+    :param method: Model method
+    :param args: Positional arguments of the call
+    :param kwargs: Keyword arguments of the call
+    :param user_id: Calling user id, if known
+    """
+    threshold_ms = get_threshold_ms(env)
+    if threshold_ms <= 0:
+        yield
+        return
+
+    start = time.monotonic()
+    current = _Watch(start + threshold_ms / 1000)
+    thread = threading.current_thread()
+    if not hasattr(thread, "query_hooks"):
+        thread.query_hooks = []
+    thread.query_hooks.append(current.query_hook)
+    ident = threading.get_ident()
+    _watches[ident] = current
+    _ensure_watchdog()
+
+    error_message = None
+    try:
+        yield
+    except Exception as e:
+        error_message = str(e)
+        raise
+    finally:
+        _watches.pop(ident, None)
+        thread.query_hooks.remove(current.query_hook)
+        duration_ms = int((time.monotonic() - start) * 1000)
+        if duration_ms >= threshold_ms:
+            values = {
+                "user_id": user_id or False,
+                "endpoint": endpoint,
+                "model_name": model_name,
+                "operation": method,
+                "duration_ms": duration_ms,
+                "threshold_ms": threshold_ms,
+                "sql_count": current.sql_count,
+                "sql_statements": "\n\n".join(
+                    f"-- {duration:.3f} ms\n{statement}" for statement, duration in current.statements
+                ),
+                "stack": current.stack,
+                "error_message": error_message,
+                **describe_call(method, args, kwargs),
+            }
+            _record(env, values)
+
+
+def _record(env, values: Dict[str, Any]) -> None:
+    try:
+        with Registry(env.cr.dbname).cursor() as cr:
+            env(cr=cr)["mcp.slow.request"].sudo().record(values)
+    except Exception as e:
+        _logger.warning(f"Failed to journal slow MCP request {values.get('model_name')}.{values.get('operation')}: {e}")
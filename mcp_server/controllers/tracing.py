@@ -0,0 +1,277 @@
+"""Lightweight per-request span recording for MCP Server."""
+
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from odoo.http import request
+from odoo.tools import config
+
+from . import sampler
+
+_logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "odoo-mcp-server"
+EXPORT_QUEUE_SIZE = 1000
+EXPORT_BATCH_SIZE = 100
+EXPORT_TIMEOUT_SECONDS = 5
+
+_local = threading.local()
+_export_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+_exporter_lock = threading.Lock()
+_exporter_thread = None
+# Route -> requests currently being handled by this worker
+_in_flight: Dict[str, int] = {}
+_in_flight_lock = threading.Lock()
+
+
+class Trace:
+    """Spans of one request, recorded by the thread handling it."""
+
+    __slots__ = ("trace_id", "name", "start_ns", "end_ns", "spans", "attributes")
+
+    def __init__(self, name: str):
+        self.trace_id = "%032x" % random.getrandbits(128)
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        # (name, start_ns, end_ns, attributes)
+        self.spans: List[tuple] = []
+        self.attributes: Dict[str, Any] = {}
+
+    def server_timing(self) -> str:
+        """
+        Format the spans as a Server-Timing header value.
+
+        Spans with the same name (e.g. several log writes) are summed.
+
+        :return: Header value such as "auth;dur=1.2, dispatch;dur=8.4, total;dur=11.0"
+        :rtype: str
+        """
+        durations: Dict[str, float] = {}
+        for name, start_ns, end_ns, _attributes in self.spans:
+            durations[name] = durations.get(name, 0.0) + (end_ns - start_ns) / 1e6
+        end_ns = self.end_ns or time.time_ns()
+        durations["total"] = (end_ns - self.start_ns) / 1e6
+        return ", ".join(f"{name};dur={duration:.2f}" for name, duration in durations.items())
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace of the request handled by the calling thread, if any."""
+    return getattr(_local, "trace", None)
+
+
+@contextmanager
+def span(name: str, **attributes: Any):
+    """
+    Record the duration of a request stage.
+
+    Does nothing beyond a thread-local lookup when no trace is active.
+
+    :param name: Stage name, e.g. "auth", "acl", "dispatch"
+    :param attributes: Extra span attributes for exported traces
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        yield
+        return
+    start_ns = time.time_ns()
+    try:
+        yield
+    finally:
+        trace.spans.append((name, start_ns, time.time_ns(), attributes))
+
+
+def annotate(**attributes: Any) -> None:
+    """Attach attributes (e.g. model and method) to the current request trace."""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.attributes.update(attributes)
+
+
+def in_flight() -> Dict[str, int]:
+    """Return the number of requests this worker is currently handling, by route."""
+    with _in_flight_lock:
+        return {name: count for name, count in _in_flight.items() if count}
+
+
+def _get_param(key: str, default: str) -> str:
+    try:
+        return request.env["ir.config_parameter"].sudo().get_param(key, default)
+    except Exception:
+        return default
+
+
+def _is_sampled() -> bool:
+    try:
+        rate = float(_get_param("mcp_server.trace_sample_rate", "0"))
+    except (TypeError, ValueError):
+        return False
+    return rate > 0 and random.random() < rate
+
+
+def trace_request(name: str):
+    """
+    Decorator recording the spans of an endpoint and returning them in a Server-Timing header.
+
+    Sampled traces (see `mcp_server.trace_sample_rate`) are also exported in
+    the background, to a JSON lines file or an OTLP/HTTP collector depending
+    on `mcp_server.trace_export`.
+
+    :param name: Name of the root span, e.g. the route
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _local.trace = Trace(name)
+            if _get_param("mcp_server.sampling_profiler", "True") == "True":
+                sampler.ensure_started()
+                sampler.register(trace)
+            with _in_flight_lock:
+                _in_flight[name] = _in_flight.get(name, 0) + 1
+            try:
+                response = func(*args, **kwargs)
+                trace.end_ns = time.time_ns()
+                if hasattr(response, "headers"):
+                    response.headers["Server-Timing"] = trace.server_timing()
+                return response
+            finally:
+                _local.trace = None
+                sampler.unregister()
+                with _in_flight_lock:
+                    _in_flight[name] -= 1
+                if trace.end_ns is None:
+                    trace.end_ns = time.time_ns()
+                if _is_sampled():
+                    _submit(trace)
+
+        return wrapper
+
+    return decorator
+
+
+def _submit(trace: Trace) -> None:
+    target = _get_param("mcp_server.trace_export", "file")
+    if target == "otlp":
+        destination = _get_param("mcp_server.trace_otlp_endpoint", "http://localhost:4318/v1/traces")
+    else:
+        destination = _get_param(
+            "mcp_server.trace_export_path", os.path.join(config["data_dir"], "mcp_traces.jsonl")
+        )
+    try:
+        _export_queue.put_nowait((target, destination, trace))
+    except queue.Full:
+        return
+    _ensure_exporter()
+
+
+def _ensure_exporter() -> None:
+    global _exporter_thread
+    if _exporter_thread is not None and _exporter_thread.is_alive():
+        return
+    with _exporter_lock:
+        if _exporter_thread is None or not _exporter_thread.is_alive():
+            _exporter_thread = threading.Thread(target=_exporter_loop, name="mcp.trace.exporter", daemon=True)
+            _exporter_thread.start()
+
+
+def _exporter_loop() -> None:
+    while True:
+        batch = [_export_queue.get()]
+        while len(batch) < EXPORT_BATCH_SIZE:
+            try:
+                batch.append(_export_queue.get_nowait())
+            except queue.Empty:
+                break
+        by_destination: Dict[tuple, List[Trace]] = {}
+        for target, destination, trace in batch:
+            by_destination.setdefault((target, destination), []).append(trace)
+        for (target, destination), traces in by_destination.items():
+            try:
+                if target == "otlp":
+                    export_otlp(destination, traces)
+                else:
+                    export_file(destination, traces)
+            except Exception as e:
+                _logger.warning(f"Failed to export {len(traces)} MCP traces to {destination}: {e}")
+
+
+def _span_id() -> str:
+    return "%016x" % random.getrandbits(64)
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[dict]:
+    return [{"key": key, "value": {"stringValue": str(value)}} for key, value in attributes.items()]
+
+
+def to_otlp_spans(trace: Trace) -> List[dict]:
+    """
+    Convert a trace to OTLP/JSON span dicts: one root span and one child span per stage.
+
+    :param trace: Recorded trace
+    :return: List of OTLP span dicts
+    :rtype: list[dict]
+    """
+    root_id = _span_id()
+    spans = [
+        {
+            "traceId": trace.trace_id,
+            "spanId": root_id,
+            "name": trace.name,
+            "kind": 2,  # SERVER
+            "startTimeUnixNano": str(trace.start_ns),
+            "endTimeUnixNano": str(trace.end_ns),
+            "attributes": _otlp_attributes(trace.attributes),
+        }
+    ]
+    for name, start_ns, end_ns, attributes in trace.spans:
+        spans.append(
+            {
+                "traceId": trace.trace_id,
+                "spanId": _span_id(),
+                "parentSpanId": root_id,
+                "name": name,
+                "kind": 1,  # INTERNAL
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(end_ns),
+                "attributes": _otlp_attributes(attributes),
+            }
+        )
+    return spans
+
+
+def export_file(path: str, traces: List[Trace]) -> None:
+    """Append traces to a JSON lines file, one OTLP span per line."""
+    with open(path, "a") as trace_file:
+        for trace in traces:
+            for otlp_span in to_otlp_spans(trace):
+                trace_file.write(json.dumps(otlp_span, separators=(",", ":")) + "\n")
+
+
+def export_otlp(endpoint: str, traces: List[Trace]) -> None:
+    """Send traces to an OTLP/HTTP collector using the JSON encoding."""
+    payload = {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "mcp_server"},
+                        "spans": [otlp_span for trace in traces for otlp_span in to_otlp_spans(trace)],
+                    }
+                ],
+            }
+        ]
+    }
+    response = requests.post(endpoint, json=payload, timeout=EXPORT_TIMEOUT_SECONDS)
+    response.raise_for_status()
@@ -1,17 +1,24 @@
+import base64
+import json
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import odoo
 from odoo import fields, modules
 from odoo.api import Environment
 from odoo.http import request
+from odoo.tools.misc import consteq, hmac
+
+from . import metrics
 
 _logger = logging.getLogger(__name__)
 
 # Constants for configuration
 CACHE_TTL_SECONDS = 300  # 5 minutes
+# Oldest cached enabled flag is_mcp_enabled(allow_stale=True) still returns
+STALE_CACHE_MAX_SECONDS = CACHE_TTL_SECONDS * 10
 
 # Cache for MCP enabled status (TTL: 5 minutes)
 _mcp_enabled_cache: Dict[str, Optional[Union[datetime, bool]]] = {"timestamp": None, "value": None}
@@ -37,6 +44,24 @@ def clear_mcp_caches() -> None:
     _logger.info("MCP caches cleared")
 
 
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Describe the state of the MCP caches of this worker.
+
+    :return: Dict with the age of the cached enabled flag and the size of the ACL caches
+    :rtype: dict
+    """
+    timestamp = _mcp_enabled_cache["timestamp"]
+    return {
+        "mcp_enabled": {
+            "cached": timestamp is not None,
+            "age_seconds": int((datetime.now(timezone.utc) - timestamp).total_seconds()) if timestamp else None,
+        },
+        "model_acl_entries": len(_model_enabled_cache),
+        "operation_acl_entries": len(_operation_enabled_cache),
+    }
+
+
 def sanitize_model_name(model_name: str) -> str:
     """
     Sanitize and validate model name.
@@ -57,20 +82,24 @@ def sanitize_model_name(model_name: str) -> str:
     return model_name.strip()
 
 
-def is_mcp_enabled() -> bool:
+def is_mcp_enabled(allow_stale: bool = False) -> bool:
     """
     Check if MCP is globally enabled via `mcp_server.enabled` system parameter.
     Result is cached for 5 minutes to reduce database queries.
 
+    :param allow_stale: Return the cached value even when it has expired, up to
+        STALE_CACHE_MAX_SECONDS old, so the parameter is rarely read
+    :type allow_stale: bool
     :return: True if MCP is enabled, False otherwise.
     :rtype: bool
     """
     now = datetime.now(timezone.utc)
 
     # Check if cache is valid
+    max_age = STALE_CACHE_MAX_SECONDS if allow_stale else CACHE_TTL_SECONDS
     if (
         _mcp_enabled_cache["timestamp"] is not None
-        and (now - _mcp_enabled_cache["timestamp"]).total_seconds() < CACHE_TTL_SECONDS
+        and (now - _mcp_enabled_cache["timestamp"]).total_seconds() < max_age
     ):
         return _mcp_enabled_cache["value"]
 
@@ -118,7 +147,9 @@ def is_model_mcp_enabled(env: Environment, model_name: str) -> bool:
         model_name in _model_enabled_cache
         and (now - _model_enabled_cache[model_name]["timestamp"]).total_seconds() < CACHE_TTL_SECONDS
     ):
+        metrics.inc("mcp_acl_cache_hits_total")
         return _model_enabled_cache[model_name]["value"]
+    metrics.inc("mcp_acl_cache_misses_total")
 
     # Get fresh value
     try:
@@ -178,7 +209,9 @@ def check_model_operation_allowed(env: Environment, model_name: str, operation:
         cache_key in _operation_enabled_cache
         and (now - _operation_enabled_cache[cache_key]["timestamp"]).total_seconds() < CACHE_TTL_SECONDS
     ):
+        metrics.inc("mcp_acl_cache_hits_total")
         return _operation_enabled_cache[cache_key]["value"]
+    metrics.inc("mcp_acl_cache_misses_total")
 
     # Get fresh value
     try:
@@ -273,6 +306,7 @@ XMLRPC_METHOD_OPERATION_MAP = {
     "read": "read",
     "search": "read",
     "search_read": "read",
+    "search_read_cursor": "read",
     "search_count": "read",
     "name_search": "read",
     "fields_get": "read",
@@ -452,3 +486,51 @@ def get_system_info(env: Environment) -> Dict[str, Union[str, int]]:
         "mcp_server_version": get_mcp_server_version(),
         "server_timezone": server_timezone,
     }
+
+
+def encode_cursor(env: Environment, values: List[Any], scope: str = "mcp_server.cursor") -> str:
+    """
+    Encode keyset pagination values into an opaque, signed continuation token.
+
+    :param env: Odoo environment, used for the database secret.
+    :type env: odoo.api.Environment
+    :param values: JSON-serializable values identifying the last returned row.
+    :type values: list
+    :param scope: Signature scope, so tokens of one API are rejected by another.
+    :type scope: str
+    :return: The continuation token.
+    :rtype: str
+    """
+    payload = base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":"), default=str).encode())
+    payload = payload.decode().rstrip("=")
+    signature = hmac(env(su=True), scope, payload)[:32]
+    return f"{payload}.{signature}"
+
+
+def decode_cursor(env: Environment, token: str, scope: str = "mcp_server.cursor") -> List[Any]:
+    """
+    Decode and verify a continuation token produced by :func:`encode_cursor`.
+
+    :param env: Odoo environment, used for the database secret.
+    :type env: odoo.api.Environment
+    :param token: The continuation token.
+    :type token: str
+    :param scope: Signature scope the token must have been issued for.
+    :type scope: str
+    :return: The keyset values stored in the token.
+    :rtype: list
+    :raises ValueError: If the token is malformed or its signature does not match.
+    """
+    try:
+        payload, signature = str(token).rsplit(".", 1)
+    except ValueError as e:
+        raise ValueError("Malformed cursor") from e
+    if not consteq(hmac(env(su=True), scope, payload)[:32], signature):
+        raise ValueError("Invalid cursor signature")
+    try:
+        values = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Malformed cursor")
+    return values
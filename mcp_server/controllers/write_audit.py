@@ -0,0 +1,188 @@
+"""Field-level auditing of create/write/unlink calls made through MCP."""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from odoo import fields
+from odoo.api import Environment
+
+_logger = logging.getLogger(__name__)
+
+AUDITED_METHODS = ("create", "write", "unlink")
+
+# Fields never worth auditing: bookkeeping columns and heavy binary content
+SKIPPED_FIELDS = {"id", "create_uid", "create_date", "write_uid", "write_date", "__last_update"}
+SKIPPED_FIELD_TYPES = {"binary", "image", "html"}
+# Fields never written to the audit log, whatever their definition: credentials
+SECRET_FIELDS = {"password", "new_password"}
+
+
+def is_write_audit_enabled(env: Environment) -> bool:
+    """
+    Check the `mcp_server.audit_writes` system parameter.
+
+    :return: True if create/write/unlink calls are audited
+    :rtype: bool
+    """
+    return env["ir.config_parameter"].sudo().get_param("mcp_server.audit_writes", "True") == "True"
+
+
+def parse_call(method: str, args: list, kwargs: dict) -> Optional[Dict[str, Any]]:
+    """
+    Extract the record ids and values of an audited execute_kw call.
+
+    :param method: Model method name
+    :param args: Positional arguments of the call
+    :param kwargs: Keyword arguments of the call
+    :return: Dict with "ids" and "vals_list", or None if the call is not audited
+    :rtype: dict | None
+    """
+    if method not in AUDITED_METHODS:
+        return None
+    args = list(args or [])
+    kwargs = kwargs or {}
+
+    if method == "create":
+        vals_list = args[0] if args else kwargs.get("vals_list", kwargs.get("vals"))
+        if isinstance(vals_list, dict):
+            vals_list = [vals_list]
+        if not isinstance(vals_list, list) or not all(isinstance(vals, dict) for vals in vals_list):
+            return None
+        return {"ids": [], "vals_list": vals_list}
+
+    ids = args[0] if args else kwargs.get("ids")
+    if isinstance(ids, int):
+        ids = [ids]
+    if not isinstance(ids, list) or not all(isinstance(record_id, int) for record_id in ids):
+        return None
+    vals = {}
+    if method == "write":
+        vals = args[1] if len(args) > 1 else kwargs.get("vals")
+        if not isinstance(vals, dict):
+            return None
+    return {"ids": ids, "vals_list": [vals]}
+
+
+def _is_audited(model, name: str) -> bool:
+    """
+    Tell whether a field is audited.
+
+    Only stored fields whose value is kept as written are audited: non-stored
+    and inverse fields (e.g. res.users password) would put the raw client
+    value in the log. Fields restricted by groups the current user does not
+    have are skipped too, as mcp.log is readable by every MCP user.
+    """
+    field = model._fields.get(name)
+    return (
+        field is not None
+        and field.store
+        and not field.inverse
+        and name not in SKIPPED_FIELDS
+        and name not in SECRET_FIELDS
+        and field.type not in SKIPPED_FIELD_TYPES
+        and (not field.groups or model.env.user.has_groups(field.groups))
+    )
+
+
+def _audited_fields(model, field_names=None) -> List[str]:
+    """Return the auditable fields among field_names, or the stored scalar fields if not given."""
+    if field_names is None:
+        field_names = [name for name, field in model._fields.items() if field.type not in ("one2many", "many2many")]
+    return [name for name in field_names if _is_audited(model, name)]
+
+
+def prefetch_old_values(env: Environment, model_name: str, method: str, call: Dict[str, Any]) -> Dict[int, dict]:
+    """
+    Read the current values of the records a write or unlink call will change.
+
+    All affected records and fields are read in one batch before the call runs,
+    as the calling user, so the audit never holds values the user cannot read.
+
+    :param env: Odoo environment of the calling user
+    :param model_name: Technical model name
+    :param method: "write" or "unlink"
+    :param call: Result of :func:`parse_call`
+    :return: Dict of record id to field values (many2one values as ids)
+    :rtype: dict
+    """
+    if method == "create" or not call["ids"]:
+        return {}
+    model = env[model_name].with_context(active_test=False)
+    field_names = _audited_fields(model, list(call["vals_list"][0]) if method == "write" else None)
+    if not field_names:
+        return {}
+    rows = model.browse(call["ids"]).exists().read(field_names, load=None)
+    return {row.pop("id"): row for row in rows}
+
+
+def _normalize(field, value):
+    """Bring a read value or a client-supplied value to a comparable, JSON-friendly form."""
+    if value is None:
+        return False
+    if field.type == "many2one":
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else False
+        return value or False
+    if field.type in ("one2many", "many2many"):
+        if isinstance(value, list) and all(isinstance(item, int) for item in value):
+            return sorted(value)
+        # Replace-all command ([6, 0, ids]) is the only one resolvable without reading
+        if isinstance(value, list) and len(value) == 1 and isinstance(value[0], (list, tuple)):
+            command = list(value[0])
+            if command[:1] == [6] and len(command) == 3:
+                return sorted(command[2] or [])
+        return value
+    if field.type == "date" and value:
+        return fields.Date.to_string(fields.Date.to_date(value))
+    if field.type == "datetime" and value:
+        return fields.Datetime.to_string(fields.Datetime.to_datetime(value))
+    if field.type in ("float", "monetary") and value is not False:
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def compute_diff(
+    env: Environment, model_name: str, method: str, call: Dict[str, Any], old_values: Dict[int, dict], result: Any
+) -> Dict[str, Dict[str, list]]:
+    """
+    Compute field-level changes of an audited call, in memory.
+
+    :param env: Odoo environment
+    :param model_name: Technical model name
+    :param method: "create", "write" or "unlink"
+    :param call: Result of :func:`parse_call`
+    :param old_values: Result of :func:`prefetch_old_values`
+    :param result: Return value of the call (new ids for create)
+    :return: Dict of record id to {field: [old, new]}
+    :rtype: dict
+    """
+    model = env[model_name]
+    diff = {}
+    if method == "create":
+        new_ids = result if isinstance(result, list) else [result]
+        for record_id, vals in zip(new_ids, call["vals_list"]):
+            diff[str(record_id)] = {
+                name: [False, _normalize(model._fields[name], vals[name])]
+                for name in _audited_fields(model, list(vals))
+            }
+    elif method == "write":
+        vals = call["vals_list"][0]
+        for record_id, old in old_values.items():
+            changes = {}
+            for name, old_value in old.items():
+                field = model._fields[name]
+                old_value = _normalize(field, old_value)
+                new_value = _normalize(field, vals[name])
+                if old_value != new_value:
+                    changes[name] = [old_value, new_value]
+            if changes:
+                diff[str(record_id)] = changes
+    else:
+        for record_id, old in old_values.items():
+            diff[str(record_id)] = {
+                name: [_normalize(model._fields[name], value), False] for name, value in old.items() if value
+            }
+    return diff
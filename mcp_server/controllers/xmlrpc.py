@@ -1,6 +1,9 @@
+import json
 import logging
+import time
 import xmlrpc.client as xmlrpclib
 from datetime import datetime
+from xml.parsers.expat import ExpatError
 
 from odoo import http
 try:
@@ -9,10 +12,30 @@ try:
 except ImportError:
     # Fallback for Odoo 18
     from odoo.addons.base.controllers.rpc import dumps as odoo_dumps
-from odoo.http import request
+from odoo.exceptions import AccessDenied, AccessError, MissingError, UserError
+from odoo.http import Response, request
 from odoo.service import common as common_service_root, db as db_service_root, model as model_service_root
-
-from . import auth, utils
+from odoo.service import security
+from odoo.service.model import call_kw, get_public_method
+
+from . import (
+    auth,
+    columnar,
+    compression,
+    jsonrpc,
+    keyset,
+    log_queue,
+    metrics,
+    msgpack_rpc,
+    profiling,
+    resource_usage,
+    response_utils,
+    slow_requests,
+    tracing,
+    utils,
+    write_audit,
+    xmlrpc_stream,
+)
 from .rate_limiting import check_rate_limit, record_api_request
 
 _logger = logging.getLogger(__name__)
@@ -23,11 +46,59 @@ XMLRPC_FAULT_CODES = {
     "unauthorized": 401,
     "forbidden": 403,
     "not_found": 404,
+    "payload_too_large": 413,
     "rate_limit": 429,
     "internal_error": 500,
 }
 
 
+# Sub-calls accepted in one system.multicall or REST batch request
+MAX_BATCH_CALLS = 500
+
+
+def _fault_from_exception(exception: Exception) -> xmlrpclib.Fault:
+    """
+    Turn an exception raised by a batched sub-call into the fault returned for it.
+
+    :param exception: The exception
+    :type exception: Exception
+    :return: XML-RPC fault with a code aligned with HTTP status codes
+    :rtype: xmlrpclib.Fault
+    """
+    if isinstance(exception, xmlrpclib.Fault):
+        return exception
+    if isinstance(exception, AccessDenied):
+        code = XMLRPC_FAULT_CODES["unauthorized"]
+    elif isinstance(exception, AccessError):
+        code = XMLRPC_FAULT_CODES["forbidden"]
+    elif isinstance(exception, MissingError):
+        code = XMLRPC_FAULT_CODES["not_found"]
+    elif isinstance(exception, UserError):
+        code = XMLRPC_FAULT_CODES["bad_request"]
+    else:
+        code = XMLRPC_FAULT_CODES["internal_error"]
+    return xmlrpclib.Fault(code, str(exception))
+
+
+def _call_labels(model_name, model_method):
+    """
+    Return the model and method of a call as metric and trace labels.
+
+    Both come from the client: values that are missing or are not valid
+    names are reported as None rather than as arbitrary label values.
+
+    :return: Tuple of (model label, method label)
+    :rtype: tuple
+    """
+    labels = []
+    for value in (model_name, model_method):
+        try:
+            labels.append(utils.sanitize_model_name(value) if isinstance(value, str) else None)
+        except ValueError:
+            labels.append(None)
+    return tuple(labels)
+
+
 def _generate_xmlrpc_fault(code: int, message: str) -> str:
     """
     Helper to generate an XML-RPC fault string with standardized codes.
@@ -43,8 +114,40 @@ def _generate_xmlrpc_fault(code: int, message: str) -> str:
     return xmlrpclib.dumps(fault, methodresponse=1, allow_none=1)
 
 
+def _xmlrpc_error_response(message: str, status: int):
+    """Reject an XML-RPC request before dispatch with a fault, sent with the matching HTTP status."""
+    return request.make_response(_generate_xmlrpc_fault(status, message), [("Content-Type", "text/xml")], status=status)
+
+
+def _load_xmlrpc_request():
+    """
+    Parse the XML-RPC request body incrementally, within the configured limits.
+
+    Compressed bodies are decoded while they are parsed, and the size limit
+    applies to the decoded bytes: Content-Length only tells the size of
+    bodies sent as is.
+
+    :return: Tuple of (params, method name)
+    :rtype: tuple
+    :raises xmlrpclib.Fault: If the body is over a limit, cannot be decoded or is not valid XML
+    """
+    try:
+        return xmlrpc_stream.load_request(
+            compression.request_stream(),
+            content_length=None if compression.request_encoding() else request.httprequest.content_length,
+            **xmlrpc_stream.get_request_limits(request.env),
+        )
+    except xmlrpc_stream.RequestLimitError as e:
+        raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["payload_too_large"], str(e)) from e
+    except ExpatError as e:
+        raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], f"Invalid XML-RPC request: {e}") from e
+    except ValueError as e:
+        raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], str(e)) from e
+
+
 class MCPCommonController(http.Controller):
     @http.route("/mcp/xmlrpc/common", type="http", auth="none", methods=["POST"], csrf=False)
+    @compression.negotiate(error_response=_xmlrpc_error_response)
     def index(self, **kwargs):
         # Check if MCP is globally enabled
         if not utils.is_mcp_enabled():
@@ -54,9 +157,8 @@ class MCPCommonController(http.Controller):
             )
             return request.make_response(fault_response, [("Content-Type", "text/xml")])
 
-        data = request.httprequest.data
         try:
-            params, method = xmlrpclib.loads(data)
+            params, method = _load_xmlrpc_request()
             result = common_service_root.dispatch(method, params)
             response_data = xmlrpclib.dumps((result,), methodresponse=1, allow_none=1)
             return request.make_response(response_data, [("Content-Type", "text/xml")])
@@ -78,6 +180,7 @@ class MCPCommonController(http.Controller):
 
 class MCPDatabaseController(http.Controller):
     @http.route("/mcp/xmlrpc/db", type="http", auth="none", methods=["POST"], csrf=False)
+    @compression.negotiate(error_response=_xmlrpc_error_response)
     def index(self, **kwargs):
         # Check if MCP is globally enabled
         if not utils.is_mcp_enabled():
@@ -87,9 +190,8 @@ class MCPDatabaseController(http.Controller):
             )
             return request.make_response(fault_response, [("Content-Type", "text/xml")])
 
-        data = request.httprequest.data
         try:
-            params, method = xmlrpclib.loads(data)
+            params, method = _load_xmlrpc_request()
             result = db_service_root.dispatch(method, params)
             response_data = xmlrpclib.dumps((result,), methodresponse=1, allow_none=1)
             return request.make_response(response_data, [("Content-Type", "text/xml")])
@@ -109,16 +211,82 @@ class MCPDatabaseController(http.Controller):
             return request.make_response(fault_response, [("Content-Type", "text/xml")])
 
 
+class ObjectBatch:
+    """
+    State shared by the sub-calls of one batch request.
+
+    Each API key and each set of credentials is checked once for the whole
+    batch, and the sub-calls run in the request's transaction, each under its
+    own savepoint, so they share the environment caches and a failing
+    sub-call only rolls back its own changes.
+    """
+
+    def __init__(self, user=None, api_key=None):
+        # API key -> res.users record (or None when invalid)
+        self._users = {}
+        # (uid, password) pairs already checked by the security service
+        self._checked = set()
+        if user and api_key:
+            self._users[api_key] = user
+            self._checked.add((user.id, api_key))
+
+    def get_user(self, api_key):
+        """Return the user of an API key, validating each key once per batch."""
+        if api_key not in self._users:
+            self._users[api_key] = auth.get_user_from_api_key(api_key)
+        return self._users[api_key]
+
+    def execute(self, params):
+        """
+        Run an execute_kw call in the request's transaction.
+
+        :param params: execute_kw parameters (db, uid, password, model, method, args, kwargs)
+        :type params: list
+        :return: Result of the model method
+        """
+        db, uid, password, model_name, method = params[:5]
+        if db != request.env.cr.dbname:
+            raise xmlrpclib.Fault(
+                XMLRPC_FAULT_CODES["bad_request"], f"Batched calls must target database {request.env.cr.dbname}."
+            )
+        try:
+            uid = int(uid)
+        except (TypeError, ValueError) as e:
+            raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], f"Invalid uid: {uid!r}") from e
+        if (uid, password) not in self._checked:
+            security.check(db, uid, password)
+            self._checked.add((uid, password))
+        args = list(params[5]) if len(params) > 5 else []
+        kwargs = dict(params[6]) if len(params) > 6 else {}
+        env = request.env(user=uid)
+        # Same checks as the execute_kw service: the model must exist and the method be public
+        records = env.get(model_name)
+        if records is None:
+            raise UserError(f"Object {model_name} doesn't exist")
+        get_public_method(records, method)
+        with env.cr.savepoint():
+            return call_kw(records, method, args, kwargs)
+
+
 class MCPObjectController(http.Controller):
-    def _mcp_object_dispatch(self, xmlrpc_method: str, params: list):
+    def _mcp_object_dispatch(self, xmlrpc_method: str, params: list, serialize=None, batch=None):
         """
         Dispatch XML-RPC object calls with MCP access control.
 
+        search_read and read calls passing format="columnar" get their records
+        back as columns (see :func:`columnar.to_columnar`). search_read_cursor
+        pages through a search_read by id (see :func:`keyset.to_search_read`).
+
         :param xmlrpc_method: The XML-RPC method name
         :type xmlrpc_method: str
         :param params: The XML-RPC parameters
         :type params: list
-        :return: The result from Odoo's model service
+        :param serialize: Optional callable turning the result into the response body (bytes).
+            The body is then built before the call is logged, so its size is recorded.
+        :type serialize: callable, optional
+        :param batch: Shared state when the call is part of a batch request
+        :type batch: ObjectBatch, optional
+        :return: The result from Odoo's model service, or the response body if serialize is given
         :raises xmlrpclib.Fault: If access is denied or parameters are invalid
         """
         if xmlrpc_method != "execute_kw":
@@ -156,13 +324,26 @@ class MCPObjectController(http.Controller):
         except ValueError as e:
             raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], f"Invalid model name: {e}") from e
 
+        # Opt-in columnar results for search_read and read (format="columnar"), and keyset
+        # pagination: search_read_cursor runs as a search_read on the page after its cursor
+        keyset_page = None
+        try:
+            params, columnar_format = columnar.pop_format(model_method, params)
+            if model_method == keyset.CURSOR_METHOD:
+                params, keyset_page = keyset.to_search_read(request.env, model_name, params)
+        except ValueError as e:
+            raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], str(e)) from e
+
         # Rate Limiting: Attempt to identify user from API key for rate limiting
         user_obj_for_rate_limit = None
         user_id_for_rate_limit = None
 
         # First try to get user from API key if it looks like one
         if isinstance(auth_token, str) and len(auth_token) > 20:  # API keys are typically longer
-            user_obj_for_rate_limit = auth.get_user_from_api_key(auth_token)
+            if batch:
+                user_obj_for_rate_limit = batch.get_user(auth_token)
+            else:
+                user_obj_for_rate_limit = auth.get_user_from_api_key(auth_token)
             if user_obj_for_rate_limit:
                 user_id_for_rate_limit = user_obj_for_rate_limit.id
                 _logger.debug(f"MCP XML-RPC: Identified user {user_id_for_rate_limit} from API key for rate limiting.")
@@ -220,7 +401,9 @@ class MCPObjectController(http.Controller):
         start_time = datetime.now()
 
         # MCP Access Checks
-        if not utils.check_mcp_access(env_for_check, model_name, model_method):
+        with tracing.span("acl"):
+            access_allowed = utils.check_mcp_access(env_for_check, model_name, model_method)
+        if not access_allowed:
             # utils.check_mcp_access logs the specific reason for denial
             # Log permission denied
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -242,8 +425,55 @@ class MCPObjectController(http.Controller):
             f"MCP XML-RPC: Access GRANTED for {model_name}.{model_method} (User ID: {user_id_for_rate_limit if user_id_for_rate_limit else 'N/A'})"
         )
 
+        # Write auditing: one batched read of the values about to change
+        audit_call = None
+        old_values = {}
+        if model_method in write_audit.AUDITED_METHODS and write_audit.is_write_audit_enabled(env_for_check):
+            try:
+                audit_call = write_audit.parse_call(
+                    model_method, params[5] if len(params) > 5 else [], params[6] if len(params) > 6 else {}
+                )
+                if audit_call:
+                    old_values = write_audit.prefetch_old_values(env_for_check, model_name, model_method, audit_call)
+            except Exception as e:
+                _logger.warning(f"MCP XML-RPC: Could not prefetch audit values for {model_name}.{model_method}: {e}")
+                audit_call = None
+
         try:
-            result = model_service_root.dispatch(xmlrpc_method, params)
+            with (
+                slow_requests.watch(
+                    env_for_check,
+                    "/mcp/xmlrpc/object",
+                    model_name,
+                    model_method,
+                    params[5] if len(params) > 5 else [],
+                    params[6] if len(params) > 6 else {},
+                    user_id=user_id_for_rate_limit,
+                ),
+                resource_usage.measure(env_for_check) as usage,
+            ):
+                with profiling.profile_request(user_obj_for_rate_limit, f"{model_name}.{model_method}") as profiler:
+                    with tracing.span("dispatch"):
+                        if batch:
+                            result = batch.execute(params)
+                        else:
+                            result = model_service_root.dispatch(xmlrpc_method, params)
+                if keyset_page:
+                    result = keyset.to_page(request.env, model_name, result, keyset_page)
+                    usage.rows_returned = len(result["records"])
+                else:
+                    usage.rows_returned = resource_usage.count_rows(result)
+                if columnar_format:
+                    result = columnar.to_columnar(
+                        env_for_check[model_name], result, columnar.requested_fields(model_method, params[5], params[6])
+                    )
+                response_data = None
+                if serialize:
+                    with tracing.span("serialize"):
+                        response_data = serialize(result)
+                    if isinstance(response_data, bytes):
+                        # Streamed responses are encoded after the call is logged
+                        usage.response_bytes = len(response_data)
 
             # Log successful model access
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -254,7 +484,7 @@ class MCPObjectController(http.Controller):
                 # For methods like read, write that have record IDs in params[5]
                 record_ids = params[5] if (params[5] and isinstance(params[5][0], int)) else None
 
-            env_for_check["mcp.log"].sudo().log_model_access(
+            log = env_for_check["mcp.log"].sudo().log_model_access(
                 model_name=model_name,
                 operation=model_method,
                 user_id=user_id_for_rate_limit,
@@ -263,9 +493,17 @@ class MCPObjectController(http.Controller):
                 http_method="POST",
                 duration_ms=duration_ms,
                 ip_address=request.httprequest.remote_addr if request else None,
+                **usage.log_values(),
             )
+            if profiler:
+                profiling.save_profile(env_for_check, profiler, log)
 
-            return result
+            if audit_call:
+                self._audit_write(
+                    env_for_check, model_name, model_method, audit_call, old_values, result, user_id_for_rate_limit
+                )
+
+            return response_data if serialize else result
         except Exception as e:
             # Log error
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -280,7 +518,84 @@ class MCPObjectController(http.Controller):
             )
             raise
 
+    def _audit_write(self, env, model_name, model_method, audit_call, old_values, result, user_id):
+        """
+        Queue a write_operation log entry with the field-level changes of a call.
+
+        The diff is computed in memory from the prefetched values and the call
+        arguments; the log entry itself is written by the background log queue.
+        """
+        try:
+            diff = write_audit.compute_diff(env, model_name, model_method, audit_call, old_values, result)
+            record_ids = [int(record_id) for record_id in diff] if model_method == "create" else audit_call["ids"]
+            log_queue.submit(
+                env,
+                "write_operation",
+                model_name=model_name,
+                operation=model_method,
+                user_id=user_id,
+                record_ids=",".join(map(str, record_ids)) or None,
+                diff_data=json.dumps(diff, default=str),
+                endpoint="/mcp/xmlrpc/object",
+                http_method="POST",
+                ip_address=request.httprequest.remote_addr if request else None,
+            )
+        except Exception as e:
+            _logger.warning(f"MCP XML-RPC: Could not audit {model_name}.{model_method}: {e}")
+
+    def _mcp_multicall(self, calls, batch=None):
+        """
+        Run the sub-calls of a system.multicall request.
+
+        Every sub-call goes through the usual MCP checks (ACL, rate limiting,
+        logging), sharing one :class:`ObjectBatch`. A failing sub-call does
+        not stop the others.
+
+        :param calls: List of {"methodName": ..., "params": [...]} structs
+        :type calls: list
+        :param batch: Shared batch state (a new one if not given)
+        :type batch: ObjectBatch, optional
+        :return: Per sub-call, [result] on success or a fault struct
+        :rtype: list
+        :raises xmlrpclib.Fault: If the call list itself is invalid
+        """
+        if not isinstance(calls, list):
+            raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], "system.multicall expects an array of calls.")
+        if len(calls) > MAX_BATCH_CALLS:
+            raise xmlrpclib.Fault(
+                XMLRPC_FAULT_CODES["bad_request"], f"Too many calls in one batch (maximum {MAX_BATCH_CALLS})."
+            )
+        batch = batch or ObjectBatch()
+        results = []
+        for call in calls:
+            try:
+                if not isinstance(call, dict) or "methodName" not in call:
+                    raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], "Invalid call: methodName is required.")
+                result = self._mcp_object_dispatch(call["methodName"], list(call.get("params") or []), batch=batch)
+                results.append([result])
+            except Exception as e:
+                fault = _fault_from_exception(e)
+                results.append({"faultCode": fault.faultCode, "faultString": fault.faultString})
+        return results
+
+    def _serialize_result(self, result):
+        """
+        Encode a model method result as an XML-RPC response.
+
+        Results of at least `mcp_server.xmlrpc_stream_min_rows` rows are
+        returned as an iterator of chunks, encoded while they are sent.
+
+        :param result: Return value of the model method
+        :return: Response body, or iterator of body chunks
+        :rtype: bytes or iterator
+        """
+        if xmlrpc_stream.should_stream(request.env, result):
+            return xmlrpc_stream.stream_response(result)
+        return odoo_dumps((result,)).encode()
+
     @http.route("/mcp/xmlrpc/object", type="http", auth="none", methods=["POST"], csrf=False)
+    @tracing.trace_request("/mcp/xmlrpc/object")
+    @compression.negotiate(error_response=_xmlrpc_error_response)
     def index(self, **kwargs):
         # Check if MCP is globally enabled
         if not utils.is_mcp_enabled():
@@ -290,14 +605,31 @@ class MCPObjectController(http.Controller):
             )
             return request.make_response(fault_response, [("Content-Type", "text/xml")])
 
-        data = request.httprequest.data
+        start = time.perf_counter()
+        model_name = model_method = None
+        status = "500"
         try:
-            params, method = xmlrpclib.loads(data)
-            result = self._mcp_object_dispatch(method, params)
+            params, method = _load_xmlrpc_request()
+            if method == "system.multicall":
+                model_name, model_method = "system", "multicall"
+                tracing.annotate(model=model_name, method=model_method)
+                results = self._mcp_multicall(params[0] if params else None)
+                with tracing.span("serialize"):
+                    response_data = odoo_dumps((results,))
+                status = "200"
+                return request.make_response(response_data, [("Content-Type", "text/xml")])
+            if len(params) > 4:
+                model_name, model_method = _call_labels(params[3], params[4])
+                tracing.annotate(model=model_name, method=model_method)
             # Use Odoo's custom XML-RPC marshaller that handles date objects
-            response_data = odoo_dumps((result,))
+            response_data = self._mcp_object_dispatch(method, params, serialize=self._serialize_result)
+            status = "200"
+            if not isinstance(response_data, bytes):
+                # No Content-Length: the chunks are sent with chunked transfer encoding
+                return Response(response_data, headers=[("Content-Type", "text/xml")], direct_passthrough=True)
             return request.make_response(response_data, [("Content-Type", "text/xml")])
         except xmlrpclib.Fault as e:
+            status = str(e.faultCode)
             _logger.warning(f"MCPObjectController XML-RPC Fault: Code {e.faultCode}, String: {e.faultString}")
             return request.make_response(
                 xmlrpclib.dumps(e, methodresponse=1, allow_none=1),
@@ -315,3 +647,247 @@ class MCPObjectController(http.Controller):
                 f"Internal Server Error in MCPObjectController: {error_msg}",
             )
             return request.make_response(fault_response, [("Content-Type", "text/xml")])
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            metrics.observe_request("/mcp/xmlrpc/object", model_name, model_method, duration_ms, status)
+
+    def _jsonrpc_call(self, call, batch=None):
+        """
+        Run one JSON-RPC call through the usual MCP dispatch.
+
+        The response is encoded before the call is logged, so its size is
+        recorded, and a result that cannot be encoded is reported as an error
+        of this call.
+
+        :param call: Decoded JSON-RPC call object
+        :param batch: Shared batch state when the call is part of a batch array
+        :type batch: ObjectBatch, optional
+        :return: Tuple of (encoded response, or None for a notification; status for metrics)
+        :rtype: tuple
+        """
+        try:
+            request_id, params, notification = jsonrpc.parse_call(call)
+        except jsonrpc.JsonRpcError as e:
+            response = None if e.notification else jsonrpc.error(e.request_id, e.code, e.message)
+            return (jsonrpc.dumps(response) if response else None), "400"
+
+        try:
+            response = self._mcp_object_dispatch(
+                "execute_kw",
+                params,
+                serialize=lambda result: jsonrpc.dumps(jsonrpc.result(request_id, result)),
+                batch=batch,
+            )
+            status = "200"
+        except Exception as e:
+            fault = _fault_from_exception(e)
+            if fault.faultCode == XMLRPC_FAULT_CODES["internal_error"]:
+                _logger.error("Error in MCP JSON-RPC call: %s", e, exc_info=True)
+            response = jsonrpc.dumps(jsonrpc.error(request_id, fault.faultCode, fault.faultString))
+            status = str(fault.faultCode)
+        return (None if notification else response), status
+
+    @http.route("/mcp/jsonrpc/object", type="http", auth="none", methods=["POST"], csrf=False)
+    @tracing.trace_request("/mcp/jsonrpc/object")
+    @compression.negotiate
+    def jsonrpc_object(self, **kwargs):
+        """
+        JSON-RPC Object Endpoint
+        Path: /mcp/jsonrpc/object
+        Method: POST
+        Auth: Credentials in the call parameters, as for /mcp/xmlrpc/object
+        Description: JSON-RPC 2.0 equivalent of /mcp/xmlrpc/object, with the same access checks,
+            rate limiting and logging. The only method is execute_kw, with params given as
+            [db, uid, password, model, method, args, kwargs] or as an object with these names.
+            Batch arrays share one authentication and run in one transaction, with a savepoint
+            per call. Dates are returned as Odoo server strings, like in XML-RPC.
+        Response: JSON-RPC 2.0 response object, or array of them for a batch (204 if only notifications)
+        """
+        if not utils.is_mcp_enabled():
+            return self._jsonrpc_response(
+                jsonrpc.dumps(jsonrpc.error(None, XMLRPC_FAULT_CODES["forbidden"], "MCP Server is disabled globally."))
+            )
+
+        start = time.perf_counter()
+        model_name = model_method = None
+        status = "500"
+        try:
+            try:
+                payload = jsonrpc.loads(compression.request_data())
+            except ValueError as e:
+                status = "400"
+                response = jsonrpc.error(None, jsonrpc.PARSE_ERROR, f"Parse error: {e}")
+                return self._jsonrpc_response(jsonrpc.dumps(response))
+
+            if isinstance(payload, list):
+                model_name, model_method = "system", "batch"
+                tracing.annotate(model=model_name, method=model_method)
+                if not payload or len(payload) > MAX_BATCH_CALLS:
+                    status = "400"
+                    message = f"Invalid Request: a batch holds 1 to {MAX_BATCH_CALLS} calls."
+                    return self._jsonrpc_response(jsonrpc.dumps(jsonrpc.error(None, jsonrpc.INVALID_REQUEST, message)))
+                batch = ObjectBatch()
+                # Each response is encoded with its own call, so a result that cannot be
+                # serialized only turns that call into an error
+                responses = [self._jsonrpc_call(call, batch=batch)[0] for call in payload]
+                responses = [response for response in responses if response is not None]
+                status = "200"
+                if not responses:
+                    return Response(status=204)
+                return self._jsonrpc_response(b"[" + b",".join(responses) + b"]")
+
+            params = payload.get("params") if isinstance(payload, dict) else None
+            if isinstance(params, list) and len(params) > 4:
+                model_name, model_method = _call_labels(params[3], params[4])
+            elif isinstance(params, dict):
+                model_name, model_method = _call_labels(params.get("model") or None, params.get("method") or None)
+            if model_name:
+                tracing.annotate(model=model_name, method=model_method)
+            body, status = self._jsonrpc_call(payload)
+            if body is None:
+                return Response(status=204)
+            return self._jsonrpc_response(body)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            metrics.observe_request("/mcp/jsonrpc/object", model_name, model_method, duration_ms, status)
+
+    def _jsonrpc_response(self, body):
+        # Errors are reported in the JSON-RPC payload, so the HTTP status is always 200
+        return request.make_response(body, [("Content-Type", "application/json")])
+
+    def _serialize_msgpack(self, result):
+        """
+        Encode a model method result as a MessagePack response.
+
+        :param result: Return value of the model method
+        :return: Response body, or iterator of body chunks for results of at
+            least `mcp_server.xmlrpc_stream_min_rows` rows
+        :rtype: bytes or iterator
+        """
+        if xmlrpc_stream.should_stream(request.env, result):
+            return msgpack_rpc.stream_result(result)
+        return msgpack_rpc.dumps(msgpack_rpc.result(result))
+
+    def _msgpack_response(self, body, status=200):
+        headers = [("Content-Type", msgpack_rpc.CONTENT_TYPE)]
+        if not isinstance(body, bytes):
+            # No Content-Length: the chunks are sent with chunked transfer encoding
+            return Response(body, status=status, headers=headers, direct_passthrough=True)
+        return request.make_response(body, headers, status=status)
+
+    @http.route("/mcp/msgpack/object", type="http", auth="none", methods=["POST"], csrf=False)
+    @tracing.trace_request("/mcp/msgpack/object")
+    @compression.negotiate
+    def msgpack_object(self, **kwargs):
+        """
+        MessagePack Object Endpoint
+        Path: /mcp/msgpack/object
+        Method: POST
+        Auth: Credentials in the call parameters, as for /mcp/xmlrpc/object
+        Description: MessagePack equivalent of /mcp/xmlrpc/object for machine-to-machine traffic,
+            with the same access checks, rate limiting and logging. The body is the array of
+            execute_kw parameters [db, uid, password, model, method, args, kwargs] or a map with
+            these names. Dates and datetimes use extension types 1 and 2, holding the Odoo
+            server string. Requires the msgpack Python package.
+        Response: {"result": ...} or {"error": {"code", "message"}} with the error code as HTTP
+            status; large array results are streamed row by row
+        """
+        if msgpack_rpc.msgpack is None:
+            return response_utils.error_response(
+                "MessagePack transport requires the msgpack Python package.", "E501", status=501
+            )
+        if not utils.is_mcp_enabled():
+            forbidden = XMLRPC_FAULT_CODES["forbidden"]
+            body = msgpack_rpc.dumps(msgpack_rpc.error(forbidden, "MCP Server is disabled globally."))
+            return self._msgpack_response(body, status=forbidden)
+
+        start = time.perf_counter()
+        model_name = model_method = None
+        status = "500"
+        try:
+            try:
+                params = msgpack_rpc.parse_call(msgpack_rpc.loads(compression.request_data()))
+            except ValueError as e:
+                raise xmlrpclib.Fault(XMLRPC_FAULT_CODES["bad_request"], f"Invalid MessagePack request: {e}") from e
+            if len(params) > 4:
+                model_name, model_method = _call_labels(params[3], params[4])
+                tracing.annotate(model=model_name, method=model_method)
+            body = self._mcp_object_dispatch("execute_kw", params, serialize=self._serialize_msgpack)
+            status = "200"
+            return self._msgpack_response(body)
+        except Exception as e:
+            fault = _fault_from_exception(e)
+            if fault.faultCode == XMLRPC_FAULT_CODES["internal_error"]:
+                _logger.error("Error in MCP MessagePack call: %s", e, exc_info=True)
+            status = str(fault.faultCode)
+            body = msgpack_rpc.dumps(msgpack_rpc.error(fault.faultCode, fault.faultString))
+            return self._msgpack_response(body, status=fault.faultCode)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            metrics.observe_request("/mcp/msgpack/object", model_name, model_method, duration_ms, status)
+
+    @http.route("/mcp/object/batch", type="http", auth="none", methods=["POST"], csrf=False)
+    @tracing.trace_request("/mcp/object/batch")
+    @compression.negotiate
+    @metrics.track_request("/mcp/object/batch")
+    @auth.require_api_key
+    def batch(self, **kwargs):
+        """
+        Batch Endpoint
+        Path: /mcp/object/batch
+        Method: POST
+        Auth: API key required
+        Description: REST equivalent of system.multicall. Runs several model method calls with one
+            authentication, each with the usual MCP access checks and rate limiting, in one
+            transaction with a savepoint per call.
+        Body: {"calls": [{"model": "res.partner", "method": "search_read", "args": [...], "kwargs": {...}}]}
+        Response: {"results": [{"success": true, "result": ...} or {"success": false, "error": {...}}]}
+        """
+        if not utils.is_mcp_enabled():
+            return response_utils.error_response(message="MCP Server is disabled globally.", code="E503", status=503)
+
+        try:
+            body = json.loads(compression.request_data() or b"{}")
+        except ValueError as e:
+            return response_utils.error_response(f"Invalid JSON body: {e}", "E400", status=400)
+        calls = body.get("calls") if isinstance(body, dict) else None
+        if not isinstance(calls, list):
+            return response_utils.error_response('Body must be {"calls": [...]}.', "E400", status=400)
+
+        user = kwargs["user"]
+        api_key = request.httprequest.headers.get("X-API-Key")
+        xmlrpc_calls = [
+            {
+                "methodName": "execute_kw",
+                "params": [
+                    request.env.cr.dbname,
+                    user.id,
+                    api_key,
+                    call.get("model"),
+                    call.get("method"),
+                    call.get("args") or [],
+                    call.get("kwargs") or {},
+                ],
+            }
+            if isinstance(call, dict)
+            else call
+            for call in calls
+        ]
+        try:
+            results = self._mcp_multicall(xmlrpc_calls, batch=ObjectBatch(user=user, api_key=api_key))
+        except xmlrpclib.Fault as e:
+            return response_utils.error_response(e.faultString, f"E{e.faultCode}", status=e.faultCode)
+
+        return response_utils.success_response(
+            {
+                "results": [
+                    {"success": True, "result": result[0]}
+                    if isinstance(result, list)
+                    else {
+                        "success": False,
+                        "error": {"code": f"E{result['faultCode']}", "message": result["faultString"]},
+                    }
+                    for result in results
+                ]
+            }
+        )
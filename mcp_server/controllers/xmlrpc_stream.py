@@ -0,0 +1,191 @@
+"""Streaming XML-RPC encoding of large results and incremental parsing of requests."""
+
+import itertools
+import xmlrpc.client as xmlrpclib
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+try:
+    # Odoo 19: rpc module
+    from odoo.addons.rpc.controllers.xmlrpc import OdooMarshaller, dumps as odoo_dumps
+except ImportError:
+    # Fallback for Odoo 18
+    from odoo.addons.base.controllers.rpc import OdooMarshaller, dumps as odoo_dumps
+
+DEFAULT_STREAM_MIN_ROWS = 1000
+# Characters of encoded XML gathered before a chunk is sent
+CHUNK_SIZE = 64 * 1024
+
+# Request limits (mcp_server.xmlrpc_max_body_size, _max_depth, _max_elements; 0 disables)
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_DEPTH = 100
+DEFAULT_MAX_ELEMENTS = 2000000
+# Bytes of request body fed to the parser at a time
+READ_SIZE = 64 * 1024
+
+# Envelope of odoo_dumps((result,)) around the rows of an array result, cut out
+# of its own output so streamed responses stay byte-identical to it
+_RESPONSE_HEAD, _RESPONSE_TAIL = odoo_dumps((["rows"],)).split("<value><string>rows</string></value>\n")
+
+
+class RequestLimitError(ValueError):
+    """XML-RPC request body over one of the configured limits."""
+
+
+def _get_int_param(env, key: str, default: int) -> int:
+    try:
+        return int(env["ir.config_parameter"].sudo().get_param(key, default))
+    except (ValueError, TypeError):
+        return default
+
+
+def get_stream_min_rows(env) -> int:
+    """
+    Read the `mcp_server.xmlrpc_stream_min_rows` system parameter.
+
+    :return: Number of rows from which results are streamed, 0 when streaming is disabled
+    :rtype: int
+    """
+    return _get_int_param(env, "mcp_server.xmlrpc_stream_min_rows", DEFAULT_STREAM_MIN_ROWS)
+
+
+def get_request_limits(env) -> Dict[str, int]:
+    """
+    Read the XML-RPC request limits from the system parameters.
+
+    :return: Keyword arguments for :func:`load_request`
+    :rtype: dict
+    """
+    return {
+        "max_body_size": _get_int_param(env, "mcp_server.xmlrpc_max_body_size", DEFAULT_MAX_BODY_SIZE),
+        "max_depth": _get_int_param(env, "mcp_server.xmlrpc_max_depth", DEFAULT_MAX_DEPTH),
+        "max_elements": _get_int_param(env, "mcp_server.xmlrpc_max_elements", DEFAULT_MAX_ELEMENTS),
+    }
+
+
+def should_stream(env, result: Any) -> bool:
+    """
+    Tell whether a result is large enough to be streamed.
+
+    :param env: Odoo environment, used to read the threshold
+    :param result: Return value of the model method
+    :rtype: bool
+    """
+    if not isinstance(result, (list, tuple)):
+        return False
+    min_rows = get_stream_min_rows(env)
+    return 0 < min_rows <= len(result)
+
+
+def iter_response(result: list, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode an array result as an XML-RPC response, one chunk at a time.
+
+    Rows are encoded one by one with Odoo's marshaller, so the output is the
+    same as odoo_dumps((result,)) but the complete document is never held in
+    memory.
+
+    :param result: List returned by the model method
+    :param chunk_size: Approximate size of the yielded chunks, in characters
+    :return: Iterator of UTF-8 encoded chunks
+    """
+    marshaller = OdooMarshaller(allow_none=False)
+    # Marshaller.dumps only takes a complete params tuple; its per-value dump
+    # method is what dump_array calls for each element
+    dump = marshaller._Marshaller__dump
+    buffer = []
+    buffered = 0
+
+    def write(text):
+        nonlocal buffered
+        buffer.append(text)
+        buffered += len(text)
+
+    write(_RESPONSE_HEAD)
+    for row in result:
+        dump(row, write)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            buffered = 0
+    write(_RESPONSE_TAIL)
+    yield "".join(buffer).encode()
+
+
+def stream_response(result: list, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Start encoding a result and return the chunk iterator to send.
+
+    The first chunk is encoded right away, so a value the marshaller cannot
+    encode in the first rows is still raised before the response starts.
+
+    :param result: List returned by the model method
+    :param chunk_size: Approximate size of the yielded chunks, in characters
+    :return: Iterator of UTF-8 encoded chunks
+    """
+    chunks = iter_response(result, chunk_size)
+    return itertools.chain([next(chunks)], chunks)
+
+
+class _LimitedUnmarshaller(xmlrpclib.Unmarshaller):
+    """Unmarshaller rejecting documents nested too deeply or with too many elements."""
+
+    def __init__(self, max_depth: int, max_elements: int):
+        super().__init__()
+        self._max_depth = max_depth
+        self._max_elements = max_elements
+        self._depth = 0
+        self._elements = 0
+
+    def start(self, tag, attrs):
+        self._depth += 1
+        self._elements += 1
+        if self._max_depth and self._depth > self._max_depth:
+            raise RequestLimitError(f"XML-RPC request nested deeper than {self._max_depth} elements")
+        if self._max_elements and self._elements > self._max_elements:
+            raise RequestLimitError(f"XML-RPC request has more than {self._max_elements} elements")
+        super().start(tag, attrs)
+
+    def end(self, tag):
+        self._depth -= 1
+        super().end(tag)
+
+
+def load_request(
+    stream: BinaryIO,
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+    content_length: Optional[int] = None,
+) -> Tuple[tuple, str]:
+    """
+    Parse an XML-RPC request while reading it, like xmlrpclib.loads.
+
+    The body is fed to expat in READ_SIZE blocks, so a request over a limit
+    is rejected as soon as the limit is crossed, without reading the rest.
+    A limit of 0 disables it.
+
+    :param stream: Request body stream
+    :param max_body_size: Maximum body size in bytes
+    :param max_depth: Maximum element nesting depth
+    :param max_elements: Maximum number of elements
+    :param content_length: Declared body size, checked before reading
+    :return: Tuple of (params, method name)
+    :rtype: tuple
+    :raises RequestLimitError: If the body exceeds one of the limits
+    :raises xml.parsers.expat.ExpatError: If the body is not well-formed XML
+    """
+    if max_body_size and content_length and content_length > max_body_size:
+        raise RequestLimitError(f"XML-RPC request body exceeds {max_body_size} bytes")
+    target = _LimitedUnmarshaller(max_depth, max_elements)
+    parser = xmlrpclib.ExpatParser(target)
+    size = 0
+    while True:
+        block = stream.read(READ_SIZE)
+        if not block:
+            break
+        size += len(block)
+        if max_body_size and size > max_body_size:
+            raise RequestLimitError(f"XML-RPC request body exceeds {max_body_size} bytes")
+        parser.feed(block)
+    parser.close()
+    return target.close(), target.getmethodname()
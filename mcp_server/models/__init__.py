@@ -1,3 +1,6 @@
 from . import mcp_enabled_models
 from . import mcp_log
+from . import mcp_log_archive
+from . import mcp_log_stats
 from . import res_config_settings
+from . import mcp_slow_request
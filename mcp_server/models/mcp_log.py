@@ -2,64 +2,442 @@
 
 import json
 import logging
+import zlib
 from datetime import datetime, timedelta
 
+import psycopg2
+
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+from ..controllers import tracing
+from ..controllers.utils import decode_cursor, encode_cursor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 _logger = logging.getLogger(__name__)
 
+# Payload compression: the first byte of the stored value tells how the rest is encoded
+CODEC_RAW = b"\x00"
+CODEC_ZLIB = b"\x01"
+CODEC_ZSTD = b"\x02"
+COMPRESSION_MIN_BYTES = 256
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Truncation limits applied in log_event
+DEFAULT_MAX_PAYLOAD_LENGTH = 100000
+MAX_TEXT_LENGTH = 10000
+
+
+def compress_text(value):
+    """
+    Encode a text value for a compressed bytea column.
+
+    Short values are stored as-is, longer ones with zstd when available, zlib otherwise.
+
+    :param value: Text to encode
+    :type value: str
+    :return: Codec byte followed by the encoded payload
+    :rtype: bytes
+    """
+    data = value.encode("utf-8")
+    if len(data) < COMPRESSION_MIN_BYTES:
+        return CODEC_RAW + data
+    if zstandard is not None:
+        return CODEC_ZSTD + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return CODEC_ZLIB + zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_text(value):
+    """
+    Decode a value produced by :func:`compress_text`.
+
+    :param value: Stored column value
+    :type value: bytes
+    :return: The original text
+    :rtype: str
+    """
+    codec, data = value[:1], value[1:]
+    if codec == CODEC_ZLIB:
+        data = zlib.decompress(data)
+    elif codec == CODEC_ZSTD:
+        if zstandard is None:
+            return "[zstd-compressed content, install the zstandard package to view it]"
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+class CompressedText(fields.Text):
+    """Text field stored compressed in a bytea column.
+
+    Values are compressed when written and decompressed when loaded into the
+    cache. Declare it with ``prefetch=False`` so the payload is only fetched
+    and decompressed when the field is actually read. The column cannot be
+    searched with text operators.
+    """
+
+    column_type = ("bytea", "bytea")
+    _description_searchable = False
+
+    def convert_to_column(self, value, record, values=None, validate=True):
+        if value is None or value is False:
+            return None
+        return psycopg2.Binary(compress_text(str(value)))
+
+    def convert_to_cache(self, value, record, validate=True):
+        if isinstance(value, (bytes, memoryview)):
+            return decompress_text(bytes(value))
+        return super().convert_to_cache(value, record, validate=validate)
+
+
+# Log rows are physically stored in a table range-partitioned by day on
+# create_date. The ORM reads and writes through the auto-updatable "mcp_log"
+# view, so retention can drop whole partitions instead of deleting rows.
+STORAGE_TABLE = "mcp_log_data"
+DEFAULT_PARTITION = "mcp_log_data_default"
+PARTITION_PREFIX = "mcp_log_data_p"
+PARTITION_PRECREATE_DAYS = 3
+# Longest wait for the lock on the log table when detaching an expired partition; log
+# inserts queue behind a pending ACCESS EXCLUSIVE request, so the wait is kept short
+PARTITION_DETACH_LOCK_TIMEOUT = "2s"
+LOG_SEQUENCE = "mcp_log_id_seq"
+
+# Indexes on the partitioned storage (propagated to every partition). The
+# composite indexes match the log views: filter column first, then the
+# (create_date, id) ordering used for sorting and keyset pagination. The BRIN
+# index serves date-range scans (retention, archival) at a negligible size.
+LOG_INDEXES = {
+    "mcp_log_data_create_date_id_index": "(create_date DESC, id DESC)",
+    "mcp_log_data_event_type_create_date_index": "(event_type, create_date DESC, id DESC)",
+    "mcp_log_data_user_id_create_date_index": "(user_id, create_date DESC, id DESC)",
+    "mcp_log_data_model_name_create_date_index": "(model_name, create_date DESC, id DESC)",
+    "mcp_log_data_create_date_brin": "USING brin (create_date)",
+    "mcp_log_data_record_id_array_gin": "USING gin (record_id_array)",
+}
+# Single-column indexes of previous versions, superseded by the composites above
+LEGACY_INDEXES = (
+    "mcp_log_data_event_type_index",
+    "mcp_log_data_user_id_index",
+    "mcp_log_data_model_name_index",
+)
+
+# Integer array copy of the comma-separated record_ids, computed by PostgreSQL
+# so the write path is unchanged. Non-numeric values yield NULL instead of
+# failing the insert.
+RECORD_ID_ARRAY_EXPRESSION = (
+    "CASE WHEN record_ids ~ '^[0-9]+(,[0-9]+)*$' THEN string_to_array(record_ids, ',')::int4[] END"
+)
+
+# Error storms: identical events within the window are coalesced into one row
+DEDUP_EVENT_TYPES = ("error", "permission_denied", "rate_limit")
+DEFAULT_DEDUP_WINDOW_SECONDS = 60
+DEDUP_HINT_CACHE_SIZE = 1024
+
+# Per-worker hints of the latest row for each dedup key: key -> (log id, create_date).
+# Saves the lookup query while a storm is going on; the database stays authoritative.
+_dedup_hints = {}
+
+EXPORT_CURSOR_SCOPE = "mcp_server.log_export"
+EXPORT_FETCH_SIZE = 2000
+# Seconds an entry must be old before it is exported (mcp_server.log_export_safety_lag)
+DEFAULT_EXPORT_SAFETY_LAG = 300
+
+KEYSET_CURSOR_SCOPE = "mcp_server.log_keyset"
+KEYSET_MAX_LIMIT = 1000
+
+EVENT_TYPES = [
+    ("auth_success", "Authentication Success"),
+    ("auth_failure", "Authentication Failure"),
+    ("model_access", "Model Access"),
+    ("resource_retrieval", "Resource Retrieval"),
+    ("write_operation", "Write Operation"),
+    ("error", "Error"),
+    ("rate_limit", "Rate Limit Exceeded"),
+    ("permission_denied", "Permission Denied"),
+]
+# Built once instead of per record in _compute_display_name
+EVENT_TYPE_LABELS = dict(EVENT_TYPES)
+
 
 class MCPLog(models.Model):
     _name = "mcp.log"
     _description = "MCP Server Activity Log"
-    _order = "create_date desc"
+    _order = "create_date desc, id desc"
     _rec_name = "event_type"
+    # Storage is managed in init(): the ORM must not create a plain table
+    _auto = False
+    _log_access = True
 
     # Basic fields
-    event_type = fields.Selection(
-        [
-            ("auth_success", "Authentication Success"),
-            ("auth_failure", "Authentication Failure"),
-            ("model_access", "Model Access"),
-            ("resource_retrieval", "Resource Retrieval"),
-            ("write_operation", "Write Operation"),
-            ("error", "Error"),
-            ("rate_limit", "Rate Limit Exceeded"),
-            ("permission_denied", "Permission Denied"),
-        ],
-        string="Event Type",
-        required=True,
-        index=True,
-    )
+    # event_type, user_id and model_name are covered by the composite LOG_INDEXES
+    event_type = fields.Selection(EVENT_TYPES, string="Event Type", required=True)
 
     # User and authentication info
-    user_id = fields.Many2one("res.users", string="User", index=True)
+    user_id = fields.Many2one("res.users", string="User")
     api_key_used = fields.Boolean(string="API Key Used", default=False)
     ip_address = fields.Char(string="IP Address", size=45)  # Size 45 for IPv6
 
     # Request details
     endpoint = fields.Char(string="Endpoint", index=True)
     http_method = fields.Char(string="HTTP Method")
-    model_name = fields.Char(string="Model", index=True)
+    model_name = fields.Char(string="Model")
     operation = fields.Char(string="Operation")
     record_ids = fields.Char(string="Record IDs")
+    accessed_record_id = fields.Integer(
+        string="Accessed Record ID",
+        compute="_compute_accessed_record_id",
+        search="_search_accessed_record_id",
+        help="Search entries whose record IDs contain this ID (uses the GIN-indexed record_id_array column)",
+    )
 
-    # Request and response data
-    request_data = fields.Text(string="Request Data")
-    response_data = fields.Text(string="Response Data")
+    # Request and response data, stored compressed and loaded only when read
+    request_data = CompressedText(string="Request Data", prefetch=False)
+    response_data = CompressedText(string="Response Data", prefetch=False)
+    diff_data = CompressedText(
+        string="Changes", prefetch=False, help="Field changes as JSON: {record id: {field: [old, new]}}"
+    )
 
     # Error details
-    error_message = fields.Text(string="Error Message")
+    error_message = CompressedText(string="Error Message", prefetch=False)
     error_code = fields.Char(string="Error Code")
 
     # Performance metrics
     duration_ms = fields.Integer(string="Duration (ms)")
+    sql_count = fields.Integer(string="SQL Queries")
+    sql_time_ms = fields.Float(string="SQL Time (ms)", digits=(16, 3))
+    rows_returned = fields.Integer(string="Rows Returned")
+    response_bytes = fields.Integer(string="Response Size (bytes)")
+    peak_memory_kb = fields.Integer(
+        string="Peak Memory (KiB)", help="Peak Python allocation, measured on a sample of requests"
+    )
+
+    # Opt-in request profile (X-MCP-Profile header)
+    profile_attachment_id = fields.Many2one("ir.attachment", string="Profile", readonly=True)
+
+    # Error storm deduplication (create_date is the first occurrence)
+    occurrence_count = fields.Integer(string="Occurrences", default=1)
+    last_occurrence = fields.Datetime(string="Last Occurrence")
 
     # Additional metadata
     session_id = fields.Char(string="Session ID")
     user_agent = fields.Text(string="User Agent")
 
+    def init(self):
+        cr = self.env.cr
+        columns = self._storage_columns()
+
+        # Dropped first: column type changes are refused while the view depends on them
+        if self._relation_exists("mcp_log", kind="v"):
+            cr.execute("DROP VIEW mcp_log")
+
+        cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {LOG_SEQUENCE}")
+        if not self._relation_exists(STORAGE_TABLE):
+            column_defs = ",\n".join(
+                f'"{name}" {column_type}' for name, column_type in columns.items() if name != "create_date"
+            )
+            cr.execute(
+                f"""
+                CREATE TABLE {STORAGE_TABLE} (
+                    id int4 NOT NULL DEFAULT nextval('{LOG_SEQUENCE}'),
+                    create_date timestamp NOT NULL DEFAULT (now() AT TIME ZONE 'UTC'),
+                    {column_defs},
+                    PRIMARY KEY (id, create_date)
+                ) PARTITION BY RANGE (create_date)
+                """
+            )
+            cr.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {STORAGE_TABLE} DEFAULT")
+        else:
+            # New fields on upgrade: adding a column to the parent adds it to all partitions
+            for name, column_type in columns.items():
+                cr.execute(f'ALTER TABLE {STORAGE_TABLE} ADD COLUMN IF NOT EXISTS "{name}" {column_type}')
+
+        cr.execute(
+            f"ALTER TABLE {STORAGE_TABLE} ADD COLUMN IF NOT EXISTS record_id_array int4[] "
+            f"GENERATED ALWAYS AS ({RECORD_ID_ARRAY_EXPRESSION}) STORED"
+        )
+        self._convert_text_columns()
+
+        self._migrate_legacy_table(columns)
+
+        # The view must be rebuilt to expose newly added columns
+        column_list = ", ".join(f'"{name}"' for name in ["id", *columns])
+        cr.execute(f"CREATE VIEW mcp_log AS SELECT {column_list} FROM {STORAGE_TABLE}")
+        cr.execute(f"ALTER VIEW mcp_log ALTER COLUMN id SET DEFAULT nextval('{LOG_SEQUENCE}')")
+
+        for name, field in self._fields.items():
+            if name in columns and field.index:
+                cr.execute(f'CREATE INDEX IF NOT EXISTS {STORAGE_TABLE}_{name}_index ON {STORAGE_TABLE} ("{name}")')
+        for index_name in LEGACY_INDEXES:
+            cr.execute(f"DROP INDEX IF EXISTS {index_name}")
+        for index_name, definition in LOG_INDEXES.items():
+            cr.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {STORAGE_TABLE} {definition}")
+        for name in ("user_id", "create_uid", "write_uid"):
+            constraint = f"{STORAGE_TABLE}_{name}_fkey"
+            cr.execute("SELECT 1 FROM pg_constraint WHERE conname = %s", (constraint,))
+            if not cr.fetchone():
+                cr.execute(
+                    f'ALTER TABLE {STORAGE_TABLE} ADD CONSTRAINT {constraint} FOREIGN KEY ("{name}") '
+                    f"REFERENCES res_users (id) ON DELETE SET NULL"
+                )
+
+        self._ensure_partitions()
+
+    def _storage_columns(self):
+        """Return the SQL column types of the stored fields, keyed by field name."""
+        columns = {}
+        for name, field in self._fields.items():
+            if name == "id" or not field.store or not field.column_type:
+                continue
+            columns[name] = field.column_type[1]
+        return columns
+
+    def _compressed_columns(self):
+        """Return the names of the fields stored compressed."""
+        return [name for name, field in self._fields.items() if isinstance(field, CompressedText)]
+
+    def _column_select_expression(self, name, source_type):
+        """SQL expression reading a legacy column into its current storage type."""
+        if name in self._compressed_columns() and source_type != "bytea":
+            return f"('\\x00'::bytea || convert_to(\"{name}\", 'UTF8'))"
+        return f'"{name}"'
+
+    def _convert_text_columns(self):
+        """Convert payload columns stored as plain text by previous versions to compressed bytea."""
+        cr = self.env.cr
+        cr.execute(
+            """
+            SELECT column_name, data_type FROM information_schema.columns
+             WHERE table_name = %s AND table_schema = current_schema AND column_name IN %s
+            """,
+            (STORAGE_TABLE, tuple(self._compressed_columns())),
+        )
+        for name, data_type in cr.fetchall():
+            if data_type == "bytea":
+                continue
+            # Existing values are kept uncompressed (raw codec); new values get compressed
+            cr.execute(
+                f'ALTER TABLE {STORAGE_TABLE} ALTER COLUMN "{name}" TYPE bytea '
+                f"USING {self._column_select_expression(name, data_type)}"
+            )
+
+    def _relation_exists(self, name, kind=None):
+        """Check whether a relation exists in the current schema, optionally of a given relkind."""
+        self.env.cr.execute(
+            """
+            SELECT c.relkind
+              FROM pg_class c
+              JOIN pg_namespace n ON n.oid = c.relnamespace
+             WHERE c.relname = %s AND n.nspname = current_schema
+            """,
+            (name,),
+        )
+        row = self.env.cr.fetchone()
+        return bool(row) and (kind is None or row[0] == kind)
+
+    def _migrate_legacy_table(self, columns):
+        """Move rows from the plain mcp_log table of previous versions into partitioned storage."""
+        cr = self.env.cr
+        if not self._relation_exists("mcp_log", kind="r"):
+            return
+
+        _logger.info("Migrating MCP log entries to partitioned storage")
+        cr.execute("ALTER TABLE mcp_log RENAME TO mcp_log_legacy")
+        cr.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'mcp_log_legacy' "
+            "AND table_schema = current_schema"
+        )
+        legacy_columns = dict(cr.fetchall())
+        common = [name for name in ["id", *columns] if name in legacy_columns and name != "create_date"]
+        column_list = ", ".join(f'"{name}"' for name in common)
+        select_list = ", ".join(self._column_select_expression(name, legacy_columns[name]) for name in common)
+        cr.execute(
+            f"""
+            INSERT INTO {STORAGE_TABLE} ({column_list}, create_date)
+            SELECT {select_list}, COALESCE(create_date, now() AT TIME ZONE 'UTC') FROM mcp_log_legacy
+            """
+        )
+        _logger.info("Migrated %s MCP log entries to partitioned storage", cr.rowcount)
+        # The ORM-created sequence is owned by the legacy table and must survive it
+        cr.execute(f"ALTER SEQUENCE {LOG_SEQUENCE} OWNED BY NONE")
+        cr.execute(f"SELECT setval('{LOG_SEQUENCE}', GREATEST((SELECT MAX(id) FROM {STORAGE_TABLE}), 1))")
+        cr.execute("DROP TABLE mcp_log_legacy")
+
+    @api.model
+    def _list_partitions(self):
+        """
+        List the daily partitions of the log storage.
+
+        :return: List of (partition name, day) tuples, oldest first
+        :rtype: list[tuple[str, date]]
+        """
+        self.env.cr.execute(
+            """
+            SELECT c.relname
+              FROM pg_inherits i
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = %s::regclass
+            """,
+            (STORAGE_TABLE,),
+        )
+        partitions = []
+        for (name,) in self.env.cr.fetchall():
+            if not name.startswith(PARTITION_PREFIX):
+                continue
+            try:
+                day = datetime.strptime(name[len(PARTITION_PREFIX) :], "%Y%m%d").date()
+            except ValueError:
+                continue
+            partitions.append((name, day))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    @api.model
+    def _create_partition(self, day):
+        """
+        Create the partition holding the logs of a given (UTC) day.
+
+        Rows already written to the default partition for that day are moved
+        into the new partition before it is attached.
+
+        :param day: Day to create the partition for
+        :type day: datetime.date
+        :return: True if a partition was created
+        :rtype: bool
+        """
+        cr = self.env.cr
+        name = f"{PARTITION_PREFIX}{day:%Y%m%d}"
+        if self._relation_exists(name):
+            return False
+
+        lower, upper = day, day + timedelta(days=1)
+        column_list = ", ".join(f'"{column}"' for column in ["id", *self._storage_columns()])
+        cr.execute(f'CREATE TABLE "{name}" (LIKE {STORAGE_TABLE} INCLUDING DEFAULTS INCLUDING GENERATED)')
+        cr.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION} WHERE create_date >= %s AND create_date < %s RETURNING *
+            )
+            INSERT INTO "{name}" ({column_list}) SELECT {column_list} FROM moved
+            """,
+            (lower, upper),
+        )
+        cr.execute(
+            f'ALTER TABLE {STORAGE_TABLE} ATTACH PARTITION "{name}" FOR VALUES FROM (%s) TO (%s)',
+            (lower, upper),
+        )
+        return True
+
+    @api.model
+    def _ensure_partitions(self, days_ahead=PARTITION_PRECREATE_DAYS):
+        """Make sure partitions exist for today and the next few days."""
+        today = self.env.cr.now().date()
+        for offset in range(days_ahead + 1):
+            self._create_partition(today + timedelta(days=offset))
+
     @api.model
     def log_event(self, event_type, **kwargs):
         """
@@ -104,26 +482,173 @@ class MCPLog(models.Model):
             "error_message": kwargs.get("error_message"),
             "error_code": kwargs.get("error_code"),
             "duration_ms": kwargs.get("duration_ms"),
+            "sql_count": kwargs.get("sql_count"),
+            "sql_time_ms": kwargs.get("sql_time_ms"),
+            "rows_returned": kwargs.get("rows_returned"),
+            "response_bytes": kwargs.get("response_bytes"),
+            "peak_memory_kb": kwargs.get("peak_memory_kb"),
             "session_id": kwargs.get("session_id"),
             "user_agent": kwargs.get("user_agent"),
+            "diff_data": kwargs.get("diff_data"),
         }
 
-        # Truncate large data fields to prevent database issues
-        max_text_length = 10000
-        for field in ["request_data", "response_data", "error_message", "user_agent"]:
+        if event_type in DEDUP_EVENT_TYPES:
+            duplicate = self._coalesce_duplicate(log_data)
+            if duplicate:
+                self._record_stats(log_data)
+                return duplicate
+
+        # Truncate large data fields to prevent database issues. Payload fields
+        # are stored compressed, so they get a higher (configurable) limit.
+        try:
+            max_payload_length = int(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param("mcp_server.log_max_payload_length", DEFAULT_MAX_PAYLOAD_LENGTH)
+            )
+        except (ValueError, TypeError):
+            max_payload_length = DEFAULT_MAX_PAYLOAD_LENGTH
+        compressed_fields = self._compressed_columns()
+        for field in ["request_data", "response_data", "error_message", "diff_data", "user_agent"]:
+            max_text_length = max_payload_length if field in compressed_fields else MAX_TEXT_LENGTH
             if log_data.get(field) and len(str(log_data[field])) > max_text_length:
                 log_data[field] = str(log_data[field])[:max_text_length] + "... [truncated]"
 
         try:
-            # Create log entry with sudo to ensure it's always created
-            return self.sudo().create(log_data)
+            # Create log entry with sudo to ensure it's always created; the savepoint
+            # keeps a failed insert from aborting the caller's transaction
+            with tracing.span("log_write"), self.env.cr.savepoint():
+                log = self.sudo().create(log_data)
         except Exception as e:
+            if self.env.context.get("mcp_log_raise_errors"):
+                raise
             # In test mode, this is expected - don't spam the logs
             in_test_mode = hasattr(self.env.registry, "test_cr") and self.env.registry.test_cr is not None
             if not in_test_mode:
                 _logger.error(f"Failed to create MCP log entry: {e}")
             return self.env["mcp.log"]
 
+        if event_type in DEDUP_EVENT_TYPES:
+            self._remember_duplicate_hint(log_data, log)
+        self._record_stats(log_data)
+        return log
+
+    @api.model
+    def _record_stats(self, log_data):
+        """Fold an event into the hourly rollups; never let analytics break logging."""
+        try:
+            # Only buffered here, the rollup rows are written once the transaction commits
+            self.env["mcp.log.stats"].sudo().record_event(
+                log_data["event_type"],
+                model_name=log_data["model_name"],
+                operation=log_data["operation"],
+                user_id=log_data["user_id"],
+                duration_ms=log_data["duration_ms"],
+                ip_address=log_data["ip_address"],
+            )
+        except Exception as e:
+            _logger.warning(f"Failed to update MCP log rollups: {e}")
+
+    @api.model
+    def _dedup_key(self, log_data):
+        return (
+            self.env.cr.dbname,
+            log_data["event_type"],
+            log_data["user_id"] or None,
+            log_data["model_name"] or None,
+            log_data["operation"] or None,
+            log_data["error_code"] or None,
+        )
+
+    @api.model
+    def _dedup_window(self):
+        try:
+            return int(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param("mcp_server.log_dedup_window_seconds", DEFAULT_DEDUP_WINDOW_SECONDS)
+            )
+        except (ValueError, TypeError):
+            return DEFAULT_DEDUP_WINDOW_SECONDS
+
+    @api.model
+    def _coalesce_duplicate(self, log_data):
+        """
+        Fold an event into an identical one logged within the dedup window.
+
+        Events are identical when they share event type, user, model,
+        operation and error code. The window starts at the first occurrence.
+
+        :param log_data: Values of the event being logged
+        :type log_data: dict
+        :return: The updated log record, or an empty recordset if there is none to coalesce with
+        """
+        window = self._dedup_window()
+        if window <= 0:
+            return self.env["mcp.log"]
+
+        cr = self.env.cr
+        now = cr.now()
+        since = now - timedelta(seconds=window)
+        key = self._dedup_key(log_data)
+        self.env.flush_all()
+
+        log_id = None
+        hint = _dedup_hints.get(key)
+        if hint and hint[1] >= since:
+            cr.execute(
+                f"""
+                UPDATE {STORAGE_TABLE}
+                   SET occurrence_count = COALESCE(occurrence_count, 1) + 1, last_occurrence = %s
+                 WHERE id = %s AND create_date >= %s
+             RETURNING id
+                """,
+                (now, hint[0], since),
+            )
+            row = cr.fetchone()
+            log_id = row and row[0]
+        if not log_id:
+            _event_type, user_id, model_name, operation, error_code = key[1:]
+            cr.execute(
+                f"""
+                UPDATE {STORAGE_TABLE}
+                   SET occurrence_count = COALESCE(occurrence_count, 1) + 1, last_occurrence = %s
+                 WHERE create_date >= %s
+                   AND id = (
+                        SELECT id FROM {STORAGE_TABLE}
+                         WHERE event_type = %s AND create_date >= %s
+                           AND user_id IS NOT DISTINCT FROM %s
+                           AND model_name IS NOT DISTINCT FROM %s
+                           AND operation IS NOT DISTINCT FROM %s
+                           AND error_code IS NOT DISTINCT FROM %s
+                      ORDER BY create_date DESC, id DESC
+                         LIMIT 1
+                   )
+             RETURNING id, create_date
+                """,
+                (now, since, log_data["event_type"], since, user_id, model_name, operation, error_code),
+            )
+            row = cr.fetchone()
+            if row:
+                log_id = row[0]
+                self._store_hint(key, row[0], row[1])
+        if not log_id:
+            return self.env["mcp.log"]
+
+        log = self.sudo().browse(log_id)
+        log.invalidate_recordset(["occurrence_count", "last_occurrence"])
+        return log
+
+    @api.model
+    def _remember_duplicate_hint(self, log_data, log):
+        self._store_hint(self._dedup_key(log_data), log.id, log.create_date)
+
+    @api.model
+    def _store_hint(self, key, log_id, create_date):
+        if len(_dedup_hints) >= DEDUP_HINT_CACHE_SIZE:
+            _dedup_hints.clear()
+        _dedup_hints[key] = (log_id, create_date)
+
     @api.model
     def log_authentication(self, success, user_id=None, api_key_used=False, ip_address=None, error_message=None):
         """Log authentication attempts."""
@@ -146,8 +671,13 @@ class MCPLog(models.Model):
         http_method=None,
         duration_ms=None,
         ip_address=None,
+        sql_count=None,
+        sql_time_ms=None,
+        rows_returned=None,
+        response_bytes=None,
+        peak_memory_kb=None,
     ):
-        """Log model access operations."""
+        """Log model access operations, with the resources they used when measured."""
         record_ids_str = ",".join(map(str, record_ids)) if record_ids else None
         return self.log_event(
             "model_access",
@@ -159,6 +689,11 @@ class MCPLog(models.Model):
             http_method=http_method,
             duration_ms=duration_ms,
             ip_address=ip_address,
+            sql_count=sql_count,
+            sql_time_ms=sql_time_ms,
+            rows_returned=rows_returned,
+            response_bytes=response_bytes,
+            peak_memory_kb=peak_memory_kb,
         )
 
     @api.model
@@ -216,6 +751,9 @@ class MCPLog(models.Model):
         :param days: Number of days to retain logs (overrides config if provided)
         :return: Number of deleted records
         """
+        # Partitions for the coming days are needed whatever the retention
+        self._ensure_partitions()
+
         if days is None:
             # Get retention days from config, default to 30
             days = int(self.env["ir.config_parameter"].sudo().get_param("mcp_server.log_retention_days", "30"))
@@ -226,35 +764,102 @@ class MCPLog(models.Model):
 
         # Calculate cutoff date
         cutoff_date = datetime.now() - timedelta(days=days)
+        cr = self.env.cr
+        self.env.flush_all()
 
-        # Find and delete old logs
-        old_logs = self.search([("create_date", "<", cutoff_date)])
-        count = len(old_logs)
-        old_logs.unlink()
+        # Keep expired entries for audit before they leave the database
+        if self.env["ir.config_parameter"].sudo().get_param("mcp_server.log_archive_enabled", "False") == "True":
+            try:
+                self.env["mcp.log.archive"].sudo().archive_logs(cutoff_date)
+            except Exception as e:
+                _logger.error(f"Failed to archive MCP log entries, skipping cleanup: {e}")
+                return 0
+
+        # Expired rows left in the partition straddling the cutoff or in the
+        # default partition; partition pruning keeps this delete local.
+        cr.execute(
+            f"DELETE FROM {STORAGE_TABLE} WHERE create_date < %s AND create_date >= %s",
+            (cutoff_date, cutoff_date.date()),
+        )
+        count = cr.rowcount
+        cr.execute(f"DELETE FROM {DEFAULT_PARTITION} WHERE create_date < %s", (cutoff_date,))
+        count += cr.rowcount
+
+        # Drop whole partitions that only hold expired logs, last: detaching
+        # locks the log table until the end of the transaction
+        count += self._drop_expired_partitions(cutoff_date.date())
+        self.env.invalidate_all()
 
         _logger.info(f"Cleaned up {count} MCP log entries older than {days} days")
         return count
 
+    @api.model
+    def _drop_expired_partitions(self, cutoff_day):
+        """
+        Detach and drop the partitions holding only logs from before a day.
+
+        PostgreSQL cannot detach a partition CONCURRENTLY while the table has
+        a default partition, so detaching takes an ACCESS EXCLUSIVE lock on
+        the log table. The lock is requested with a short lock_timeout so log
+        inserts never wait long behind it; partitions that could not be
+        detached are left for the next run.
+
+        :param cutoff_day: Partitions of days before this one are dropped
+        :type cutoff_day: datetime.date
+        :return: Number of deleted records
+        :rtype: int
+        """
+        cr = self.env.cr
+        cr.execute("SELECT current_setting('lock_timeout')")
+        lock_timeout = cr.fetchone()[0]
+        expired = [name for name, day in self._list_partitions() if day < cutoff_day]
+        # Counted before the first detach: once it holds the lock on the log table, scans would block inserts
+        rows = {}
+        for name in expired:
+            cr.execute(f'SELECT count(*) FROM "{name}"')
+            rows[name] = cr.fetchone()[0]
+        count = 0
+        for name in expired:
+            try:
+                with cr.savepoint():
+                    cr.execute("SELECT set_config('lock_timeout', %s, true)", (PARTITION_DETACH_LOCK_TIMEOUT,))
+                    cr.execute(f'ALTER TABLE {STORAGE_TABLE} DETACH PARTITION "{name}"')
+            except psycopg2.errors.LockNotAvailable:
+                _logger.info(f"MCP log table busy, dropping partition {name} at the next cleanup")
+                break
+            finally:
+                cr.execute("SELECT set_config('lock_timeout', %s, true)", (lock_timeout,))
+            # Detached, the partition is a plain table: dropping it no longer involves the log table
+            cr.execute(f'DROP TABLE "{name}"')
+            count += rows[name]
+        return count
+
     @api.model
     def _register_hook(self):
-        """Register cleanup cron job on module installation."""
+        """Register the log cleanup and partition maintenance cron jobs on module installation."""
         super()._register_hook()
-        # Create or update the cron job for log cleanup
-        cron_vals = {
-            "name": "MCP Log Cleanup",
-            "model_id": self.env["ir.model"].search([("model", "=", "mcp.log")]).id,
-            "state": "code",
-            "code": "model.cleanup_old_logs()",
-            "interval_type": "days",
-            "interval_number": 1,
-            # 'numbercall': -1,  # This field doesn't exist in Odoo 18
-            "active": True,
-        }
-        cron = self.env["ir.cron"].search([("name", "=", "MCP Log Cleanup")])
-        if cron:
-            cron.write(cron_vals)
-        else:
-            self.env["ir.cron"].create(cron_vals)
+        model_id = self.env["ir.model"].search([("model", "=", "mcp.log")]).id
+        crons = [
+            ("MCP Log Cleanup", "model.cleanup_old_logs()"),
+            # Separate from the cleanup so partitions are created when retention is disabled or cleanup fails
+            ("MCP Log Partition Maintenance", "model._ensure_partitions()"),
+        ]
+        for name, code in crons:
+            cron_vals = {
+                "name": name,
+                "model_id": model_id,
+                "state": "code",
+                "code": code,
+                "interval_type": "days",
+                "interval_number": 1,
+                # 'numbercall': -1,  # This field doesn't exist in Odoo 18
+                "active": True,
+            }
+            cron = self.env["ir.cron"].search([("name", "=", name)])
+            if cron:
+                cron.write(cron_vals)
+            else:
+                self.env["ir.cron"].create(cron_vals)
 
     def get_summary(self):
         """Get a summary of the log entry for display."""
@@ -268,11 +873,225 @@ class MCPLog(models.Model):
             summary += f" - {self.error_message[:50]}..."
         return summary
 
+    def _compute_accessed_record_id(self):
+        for record in self:
+            record.accessed_record_id = 0
+
+    def _search_accessed_record_id(self, operator, value):
+        """
+        Search entries whose record_ids contain one of the given IDs.
+
+        The condition is returned as a subquery on the GIN-indexed array
+        column, so it is evaluated in the database. Record IDs only mean
+        something within a model: the `mcp_accessed_model` context key
+        restricts the subquery to the entries of that model.
+        """
+        if operator not in ("=", "in"):
+            raise UserError(_("Unsupported operator %s for searching accessed records.", operator))
+        record_ids = [int(v) for v in (value if isinstance(value, (list, tuple)) else [value]) if v]
+        if not record_ids:
+            return [("id", "=", False)]
+        conditions = [SQL("record_id_array && %s::int4[]", record_ids)]
+        if self.env.context.get("mcp_accessed_model"):
+            conditions.append(SQL("model_name = %s", self.env.context["mcp_accessed_model"]))
+        return [
+            (
+                "id",
+                "in",
+                SQL("SELECT id FROM %s WHERE %s", SQL.identifier(STORAGE_TABLE), SQL(" AND ").join(conditions)),
+            )
+        ]
+
+    @api.model
+    def get_record_access_history(self, model_name, record_id, limit=80, cursor=None):
+        """
+        Return the MCP log entries that touched a given record, newest first.
+
+        :param model_name: Technical name of the record's model
+        :param record_id: ID of the record
+        :param limit: Page size
+        :param cursor: Continuation token from a previous page
+        :return: Dict with "records" and "next_cursor", see search_read_keyset
+        :rtype: dict
+        """
+        domain = [("model_name", "=", model_name), ("accessed_record_id", "=", int(record_id))]
+        fields_to_read = ["create_date", "event_type", "user_id", "operation", "endpoint", "ip_address", "record_ids"]
+        log_model = self.with_context(mcp_accessed_model=model_name)
+        return log_model.search_read_keyset(domain, fields_to_read, limit=limit, cursor=cursor)
+
+    @api.model
+    def search_read_keyset(self, domain=None, fields=None, limit=80, cursor=None):
+        """
+        Read log entries page by page using keyset pagination.
+
+        Entries are ordered like the log views (newest first, by create_date
+        then id). Instead of an offset, each page resumes strictly after the
+        last row of the previous one, so every page costs the same index scan.
+
+        :param domain: Search domain
+        :param fields: Fields to read (all readable fields if empty)
+        :param limit: Page size, capped at KEYSET_MAX_LIMIT
+        :param cursor: Continuation token returned by the previous page
+        :return: Dict with "records" and "next_cursor" (False on the last page)
+        :rtype: dict
+        :raises UserError: If the cursor is invalid
+        """
+        limit = max(1, min(int(limit or 80), KEYSET_MAX_LIMIT))
+        query = self._search(domain or [])
+        if cursor:
+            try:
+                last_create_date, last_id = decode_cursor(self.env, cursor, scope=KEYSET_CURSOR_SCOPE)
+            except ValueError as e:
+                raise UserError(_("Invalid log cursor: %s", e)) from e
+            query.add_where(
+                SQL(
+                    "(%s, %s) < (%s::timestamp, %s)",
+                    SQL.identifier(self._table, "create_date"),
+                    SQL.identifier(self._table, "id"),
+                    last_create_date,
+                    int(last_id),
+                )
+            )
+        query.order = SQL(
+            "%s DESC, %s DESC",
+            SQL.identifier(self._table, "create_date"),
+            SQL.identifier(self._table, "id"),
+        )
+        query.limit = limit
+        # create_date is taken from SQL so the cursor keeps full precision
+        self.env.cr.execute(
+            query.select(SQL.identifier(self._table, "id"), SQL.identifier(self._table, "create_date"))
+        )
+        rows = self.env.cr.fetchall()
+
+        records = self.browse([row[0] for row in rows]).read(fields or [])
+        next_cursor = False
+        if len(rows) == limit:
+            last_id, last_create_date = rows[-1]
+            next_cursor = encode_cursor(self.env, [last_create_date.isoformat(), last_id], scope=KEYSET_CURSOR_SCOPE)
+        return {"records": records, "next_cursor": next_cursor}
+
+    @api.model
+    def iter_export_rows(self, after_id=0, date_from=None, event_types=None, limit=None):
+        """
+        Stream log entries in id order, for export to external systems.
+
+        Rows are read through a server-side cursor in batches, so memory use
+        does not depend on the number of exported entries. Payload columns
+        are decompressed on the fly.
+
+        Ids are drawn when a row is inserted but become visible when its
+        transaction commits, so they do not commit in order. The export stops
+        before the first entry that is still recent (see
+        :meth:`_export_upper_id`), so a resume cursor never passes an entry
+        that may not be committed yet.
+
+        Delivery is at least once: a stream interrupted before its trailer is
+        resumed from an earlier cursor and repeats entries, consumers should
+        deduplicate on id. An entry is exported once; later updates by error
+        deduplication (occurrence_count, last_occurrence) are not exported
+        again, so exported counts are lower bounds.
+
+        :param after_id: Only entries with a greater id are returned
+        :param date_from: Only entries created at or after this date
+        :param event_types: Only entries of these event types
+        :param limit: Maximum number of entries to return
+        :return: Generator of dicts with the stored column values
+        """
+        columns = ["id", *self._storage_columns()]
+        compressed = set(self._compressed_columns())
+        conditions = [SQL("id > %s", int(after_id or 0))]
+        upper_id = self._export_upper_id(after_id)
+        if upper_id:
+            conditions.append(SQL("id < %s", upper_id))
+        if date_from:
+            conditions.append(SQL("create_date >= %s", fields.Datetime.to_datetime(date_from)))
+        if event_types:
+            conditions.append(SQL("event_type = ANY(%s)", list(event_types)))
+        query = SQL(
+            "SELECT %s FROM %s WHERE %s ORDER BY id %s",
+            SQL(", ").join(SQL.identifier(name) for name in columns),
+            SQL.identifier(STORAGE_TABLE),
+            SQL(" AND ").join(conditions),
+            SQL("LIMIT %s", int(limit)) if limit else SQL(),
+        )
+
+        self.env.flush_all()
+        with self.env.cr._cnx.cursor(name="mcp_log_export") as server_cursor:
+            server_cursor.itersize = EXPORT_FETCH_SIZE
+            server_cursor.execute(query.code, query.params)
+            for row in server_cursor:
+                values = dict(zip(columns, row))
+                for name in compressed:
+                    if values[name] is not None:
+                        values[name] = decompress_text(bytes(values[name]))
+                yield values
+
+    @api.model
+    def _export_upper_id(self, after_id=0):
+        """
+        Return the id an export must stop before, None when every entry can be exported.
+
+        Entries created in the last `mcp_server.log_export_safety_lag` seconds
+        (default 300), or since the start of the oldest other transaction that
+        is still writing, may have neighbours with lower ids that are not
+        committed yet. The export stops at the first of them.
+
+        :param after_id: Id the export starts after
+        :rtype: int or None
+        """
+        try:
+            lag = int(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param("mcp_server.log_export_safety_lag", DEFAULT_EXPORT_SAFETY_LAG)
+            )
+        except (ValueError, TypeError):
+            lag = DEFAULT_EXPORT_SAFETY_LAG
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT min(id) FROM %s
+                 WHERE id > %s
+                   AND create_date >= LEAST(
+                       (now() AT TIME ZONE 'UTC') - make_interval(secs => %s),
+                       (SELECT min(xact_start) AT TIME ZONE 'UTC'
+                          FROM pg_stat_activity
+                         WHERE datname = current_database()
+                           AND backend_xid IS NOT NULL
+                           AND pid <> pg_backend_pid())
+                   )
+                """,
+                SQL.identifier(STORAGE_TABLE),
+                int(after_id or 0),
+                max(lag, 0),
+            )
+        )
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def encode_export_cursor(self, last_id):
+        """Return the signed token resuming an export after the given log id."""
+        return encode_cursor(self.env, [int(last_id)], scope=EXPORT_CURSOR_SCOPE)
+
+    @api.model
+    def decode_export_cursor(self, token):
+        """
+        Return the log id an export token resumes after.
+
+        :raises UserError: If the token is invalid
+        """
+        try:
+            (last_id,) = decode_cursor(self.env, token, scope=EXPORT_CURSOR_SCOPE)
+            return int(last_id)
+        except (ValueError, TypeError) as e:
+            raise UserError(_("Invalid export cursor: %s", e)) from e
+
     @api.depends("event_type", "model_name", "operation")
     def _compute_display_name(self):
         """Compute display name for tree views."""
         for record in self:
-            parts = [dict(record._fields["event_type"].selection).get(record.event_type, "")]
+            parts = [EVENT_TYPE_LABELS.get(record.event_type, "")]
             if record.model_name:
                 parts.append(record.model_name)
             if record.operation:
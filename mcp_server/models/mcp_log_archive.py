@@ -0,0 +1,305 @@
+"""MCP Log Archive Model for keeping expired log entries outside the database."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+
+from odoo import api, fields, models
+from odoo.tools import config
+
+from .mcp_log import decompress_text
+
+_logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRECTORY = "mcp_log_archive"
+ARCHIVE_ROWS_PER_FILE = 100000
+ARCHIVE_FETCH_SIZE = 2000
+ARCHIVE_FORMAT = "ndjson+gzip"
+
+
+def _json_default(value):
+    """Serialize values json does not handle natively (dates, memoryviews)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value).decode("utf-8", errors="replace")
+    return str(value)
+
+
+class MCPLogArchive(models.Model):
+    _name = "mcp.log.archive"
+    _description = "MCP Log Archive File"
+    _order = "date_from desc, id desc"
+
+    name = fields.Char(string="File Name", required=True, readonly=True)
+    file_path = fields.Char(string="Path", required=True, readonly=True, help="Path relative to the filestore")
+    date_from = fields.Datetime(string="First Entry", readonly=True, index=True)
+    date_to = fields.Datetime(string="Last Entry", readonly=True, index=True)
+    first_log_id = fields.Integer(string="First Log ID", readonly=True)
+    last_log_id = fields.Integer(string="Last Log ID", readonly=True)
+    row_count = fields.Integer(string="Entries", readonly=True)
+    file_size = fields.Integer(string="File Size (bytes)", readonly=True)
+    checksum = fields.Char(string="SHA-256", readonly=True)
+    archive_format = fields.Char(string="Format", readonly=True, default=ARCHIVE_FORMAT)
+
+    @api.model
+    def _archive_root(self):
+        """Return the absolute directory holding the archives of the current database."""
+        return os.path.join(config.filestore(self.env.cr.dbname), ARCHIVE_DIRECTORY)
+
+    def _full_path(self):
+        self.ensure_one()
+        return os.path.join(config.filestore(self.env.cr.dbname), self.file_path)
+
+    @api.model
+    def archive_logs(self, cutoff_date):
+        """
+        Stream log entries older than the cutoff into compressed NDJSON files.
+
+        Rows are read in id order, ARCHIVE_FETCH_SIZE at a time, and written
+        one by one, so memory use does not depend on the number of archived
+        entries. Each file gets a JSON manifest next to it and an
+        mcp.log.archive record.
+
+        The files only count once the transaction deleting the archived rows
+        commits: they are removed if it rolls back, and files left behind by
+        an interrupted run (a manifest without archive record) are removed
+        before archiving, so reruns archive each entry once.
+
+        :param cutoff_date: Entries created before this date are archived
+        :type cutoff_date: datetime
+        :return: Number of archived entries
+        :rtype: int
+        """
+        log_model = self.env["mcp.log"]
+        columns = ["id", *log_model._storage_columns()]
+        column_list = ", ".join(f'"{name}"' for name in columns)
+        compressed = set(log_model._compressed_columns())
+
+        self.env.flush_all()
+        self._remove_orphan_files()
+        cr = self.env.cr
+        written_files = []
+        # The rows stay in the database if the transaction rolls back, so must the archive files not
+        cr.postrollback.add(lambda: self._remove_files(written_files))
+        total = 0
+        last_id = 0
+        writer = None
+        try:
+            while True:
+                cr.execute(
+                    f"SELECT {column_list} FROM mcp_log_data WHERE create_date < %s AND id > %s ORDER BY id LIMIT %s",
+                    (cutoff_date, last_id, ARCHIVE_FETCH_SIZE),
+                )
+                rows = cr.fetchall()
+                if not rows:
+                    break
+                for row in rows:
+                    if writer is None:
+                        writer = self._open_archive_file(columns)
+                        written_files.extend(writer["paths"])
+                    values = dict(zip(columns, row))
+                    for name in compressed:
+                        if values[name] is not None:
+                            values[name] = decompress_text(bytes(values[name]))
+                    self._write_archive_row(writer, values)
+                    total += 1
+                    if writer["manifest"]["rows"] >= ARCHIVE_ROWS_PER_FILE:
+                        self._close_archive_file(writer)
+                        writer = None
+                last_id = rows[-1][0]
+            if writer is not None:
+                self._close_archive_file(writer)
+                writer = None
+        except Exception:
+            # Rows will not be deleted if archiving fails; drop partial files
+            if writer is not None:
+                writer["stream"].close()
+                writer["raw"].close()
+            self._remove_files(written_files)
+            raise
+
+        if total:
+            _logger.info(f"Archived {total} MCP log entries older than {cutoff_date}")
+        return total
+
+    def unlink(self):
+        # The files go with their records, once the deletion commits; otherwise the
+        # next archiving run would remove them anyway, as files of an uncommitted run
+        paths = [path for archive in self for path in (archive._full_path(), archive._full_path() + ".manifest.json")]
+        result = super().unlink()
+        self.env.cr.postcommit.add(lambda: self._remove_files(paths))
+        return result
+
+    @api.model
+    def _remove_files(self, paths):
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    @api.model
+    def _remove_orphan_files(self):
+        """
+        Remove the archive files (and manifests) written by runs whose transaction never committed.
+
+        Files of unlinked archive records are removed with them, so a file
+        without record can only come from such a run.
+        """
+        filestore = config.filestore(self.env.cr.dbname)
+        root = self._archive_root()
+        if not os.path.isdir(root):
+            return
+        known = set(self.sudo().with_context(active_test=False).search([]).mapped("file_path"))
+        for directory, _subdirectories, names in os.walk(root):
+            for name in names:
+                if not name.endswith(".ndjson.gz"):
+                    continue
+                path = os.path.join(directory, name)
+                if os.path.relpath(path, filestore) not in known:
+                    _logger.warning(f"Removing MCP log archive file of an uncommitted run: {path}")
+                    self._remove_files([path, path + ".manifest.json"])
+
+    @api.model
+    def _open_archive_file(self, columns):
+        now = datetime.utcnow()
+        relative_dir = os.path.join(ARCHIVE_DIRECTORY, f"{now:%Y}")
+        absolute_dir = os.path.join(config.filestore(self.env.cr.dbname), relative_dir)
+        os.makedirs(absolute_dir, exist_ok=True)
+
+        name = f"mcp_log_{now:%Y%m%d_%H%M%S_%f}.ndjson.gz"
+        path = os.path.join(absolute_dir, name)
+        raw = open(path, "wb")
+        return {
+            "name": name,
+            "file_path": os.path.join(relative_dir, name),
+            "paths": [path, path + ".manifest.json"],
+            "raw": raw,
+            "stream": gzip.GzipFile(fileobj=raw, mode="wb"),
+            "sha256": hashlib.sha256(),
+            "manifest": {
+                "format": ARCHIVE_FORMAT,
+                "columns": columns,
+                "rows": 0,
+                "first_log_id": None,
+                "last_log_id": None,
+                "date_from": None,
+                "date_to": None,
+            },
+        }
+
+    @api.model
+    def _write_archive_row(self, writer, values):
+        line = (json.dumps(values, default=_json_default, separators=(",", ":")) + "\n").encode()
+        writer["stream"].write(line)
+
+        manifest = writer["manifest"]
+        manifest["rows"] += 1
+        if manifest["first_log_id"] is None:
+            manifest["first_log_id"] = values["id"]
+        manifest["last_log_id"] = values["id"]
+        created = values.get("create_date")
+        if created:
+            if manifest["date_from"] is None or created < manifest["date_from"]:
+                manifest["date_from"] = created
+            if manifest["date_to"] is None or created > manifest["date_to"]:
+                manifest["date_to"] = created
+
+    @api.model
+    def _close_archive_file(self, writer):
+        writer["stream"].close()
+        writer["raw"].close()
+        path = writer["paths"][0]
+
+        # Checksum of the compressed file, computed in blocks
+        sha256 = writer["sha256"]
+        with open(path, "rb") as archive:
+            for block in iter(lambda: archive.read(1024 * 1024), b""):
+                sha256.update(block)
+
+        manifest = dict(writer["manifest"])
+        manifest.update(
+            {
+                "file": writer["name"],
+                "file_size": os.path.getsize(path),
+                "sha256": sha256.hexdigest(),
+                "created_at": datetime.utcnow().isoformat(),
+                "database": self.env.cr.dbname,
+            }
+        )
+        with open(writer["paths"][1], "w") as manifest_file:
+            json.dump(manifest, manifest_file, default=_json_default, indent=2)
+
+        return self.sudo().create(
+            {
+                "name": writer["name"],
+                "file_path": writer["file_path"],
+                "date_from": manifest["date_from"],
+                "date_to": manifest["date_to"],
+                "first_log_id": manifest["first_log_id"],
+                "last_log_id": manifest["last_log_id"],
+                "row_count": manifest["rows"],
+                "file_size": manifest["file_size"],
+                "checksum": manifest["sha256"],
+            }
+        )
+
+    def iter_entries(self):
+        """
+        Iterate over the archived entries of these archive files.
+
+        Files are decompressed on the fly, one line at a time.
+
+        :return: Generator of log entry dicts
+        """
+        for archive in self:
+            path = archive._full_path()
+            if not os.path.exists(path):
+                _logger.warning(f"MCP log archive file missing: {archive.file_path}")
+                continue
+            with gzip.open(path, "rt", encoding="utf-8") as stream:
+                for line in stream:
+                    if line.strip():
+                        yield json.loads(line)
+
+    @api.model
+    def search_entries(self, date_from=None, date_to=None, filters=None, limit=None):
+        """
+        Query archived log entries without loading them back into PostgreSQL.
+
+        Archive files are selected by their manifest date range, then scanned
+        sequentially.
+
+        :param date_from: Only entries created at or after this date
+        :param date_to: Only entries created before this date
+        :param filters: Dict of field name to expected value (e.g. {"event_type": "error"})
+        :param limit: Maximum number of entries to return
+        :return: List of matching log entry dicts
+        :rtype: list[dict]
+        """
+        date_from = fields.Datetime.to_datetime(date_from)
+        date_to = fields.Datetime.to_datetime(date_to)
+        domain = []
+        if date_from:
+            domain.append(("date_to", ">=", date_from))
+        if date_to:
+            domain.append(("date_from", "<", date_to))
+        filters = filters or {}
+        lower = date_from.isoformat() if date_from else None
+        upper = date_to.isoformat() if date_to else None
+
+        result = []
+        for entry in self.search(domain, order="date_from, id").iter_entries():
+            created = entry.get("create_date") or ""
+            if lower and created < lower:
+                continue
+            if upper and created >= upper:
+                continue
+            if any(entry.get(key) != value for key, value in filters.items()):
+                continue
+            result.append(entry)
+            if limit and len(result) >= limit:
+                break
+        return result
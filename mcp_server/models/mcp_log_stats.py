@@ -0,0 +1,354 @@
+"""MCP Log Stats Model for incrementally maintained activity rollups."""
+
+import hashlib
+import logging
+import math
+
+from odoo import SUPERUSER_ID, api, fields, models
+from odoo.modules.registry import Registry
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+# Upper bounds (inclusive, in ms) of the fixed latency histogram buckets.
+# Durations above the last bound are counted in the overflow bucket.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+LATENCY_COLUMNS = tuple(f"latency_le_{bound}" for bound in LATENCY_BUCKETS_MS) + ("latency_overflow",)
+
+# Event types counted as errors in the rollups
+ERROR_EVENT_TYPES = ("auth_failure", "error", "rate_limit", "permission_denied")
+
+# Width of the linear-counting bitmap used to estimate distinct IP addresses;
+# estimates stay within a few percent up to about 20000 distinct values
+SKETCH_BITS = 4096
+
+# Key of the increments buffered until the current transaction commits
+PENDING_ROLLUPS_KEY = "mcp.log.stats.pending"
+
+ROLLUP_COUNTERS = ("request_count", "error_count", "duration_total_ms") + LATENCY_COLUMNS
+
+
+def latency_column(duration_ms):
+    """
+    Return the histogram column a duration falls into.
+
+    :param duration_ms: Request duration in milliseconds
+    :type duration_ms: int
+    :return: Name of the histogram column
+    :rtype: str
+    """
+    for bound, column in zip(LATENCY_BUCKETS_MS, LATENCY_COLUMNS):
+        if duration_ms <= bound:
+            return column
+    return LATENCY_COLUMNS[-1]
+
+
+def sketch_bit(value):
+    """
+    Hash a value onto a single bit of a SKETCH_BITS wide sketch.
+
+    :param value: Value to hash (e.g. an IP address)
+    :type value: str
+    :return: Integer with exactly one bit set, or 0 for empty values
+    :rtype: int
+    """
+    if not value:
+        return 0
+    digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+    return 1 << (int.from_bytes(digest, "big") % SKETCH_BITS)
+
+
+def estimate_cardinality(sketch):
+    """
+    Estimate the number of distinct values hashed into a sketch (linear counting).
+
+    :param sketch: Bitmap built from :func:`sketch_bit` values
+    :type sketch: int
+    :return: Estimated number of distinct values
+    :rtype: int
+    """
+    bits_set = bin(sketch or 0).count("1")
+    zero_bits = SKETCH_BITS - bits_set
+    if zero_bits == 0:
+        # Saturated sketch, report the upper bound it can represent
+        zero_bits = 1
+    return int(round(-SKETCH_BITS * math.log(zero_bits / SKETCH_BITS)))
+
+
+def histogram_percentile(counts, percentile):
+    """
+    Approximate a latency percentile from histogram bucket counts.
+
+    :param counts: Bucket counts, ordered like LATENCY_COLUMNS
+    :type counts: list[int]
+    :param percentile: Percentile to compute, between 0 and 100
+    :type percentile: float
+    :return: Upper bound (ms) of the bucket holding the percentile, None if empty
+    :rtype: int | None
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    threshold = total * percentile / 100.0
+    running = 0
+    for index, count in enumerate(counts):
+        running += count
+        if running >= threshold:
+            if index < len(LATENCY_BUCKETS_MS):
+                return LATENCY_BUCKETS_MS[index]
+            break
+    # Overflow bucket has no upper bound, report twice the last bound
+    return LATENCY_BUCKETS_MS[-1] * 2
+
+
+def _rollup_sort_key(key):
+    bucket_start, model_name, operation, user_id = key
+    return bucket_start, model_name or "", operation or "", user_id or 0
+
+
+def _flush_rollups(dbname, pending):
+    """Write the increments of a committed transaction in a short transaction of their own."""
+    if not pending:
+        return
+    try:
+        with Registry(dbname).cursor() as cr:
+            api.Environment(cr, SUPERUSER_ID, {})["mcp.log.stats"]._upsert_rollups(pending)
+    except Exception as e:
+        _logger.warning(f"Failed to update MCP log rollups: {e}")
+
+
+class SketchBits(fields.Integer):
+    """Integer bitmap of SKETCH_BITS bits stored in a PostgreSQL bit string column.
+
+    The column can be merged with the ``|`` operator and the ``bit_or``
+    aggregate, values are plain Python integers in the cache.
+    """
+
+    column_type = ("bit", f"bit({SKETCH_BITS})")
+
+    def convert_to_column(self, value, record, values=None, validate=True):
+        return format(int(value or 0), f"0{SKETCH_BITS}b")
+
+    def convert_to_cache(self, value, record, validate=True):
+        if isinstance(value, str):
+            return int(value, 2)
+        return super().convert_to_cache(value, record, validate=validate)
+
+
+class MCPLogStats(models.Model):
+    _name = "mcp.log.stats"
+    _description = "MCP Activity Rollup"
+    _order = "bucket_start desc, model_name, operation"
+
+    # Rollup key: one row per hour, model, operation and user
+    bucket_start = fields.Datetime(string="Hour", required=True, index=True, readonly=True)
+    model_name = fields.Char(string="Model", readonly=True)
+    operation = fields.Char(string="Operation", readonly=True)
+    user_id = fields.Many2one("res.users", string="User", readonly=True, ondelete="set null")
+
+    # Counters
+    request_count = fields.Integer(string="Requests", readonly=True, aggregator="sum")
+    error_count = fields.Integer(string="Errors", readonly=True, aggregator="sum")
+    duration_total_ms = fields.Integer(string="Total Duration (ms)", readonly=True, aggregator="sum")
+    duration_max_ms = fields.Integer(string="Max Duration (ms)", readonly=True, aggregator="max")
+
+    # Fixed-bucket latency histogram
+    latency_le_5 = fields.Integer(string="<= 5 ms", readonly=True, aggregator="sum")
+    latency_le_10 = fields.Integer(string="<= 10 ms", readonly=True, aggregator="sum")
+    latency_le_25 = fields.Integer(string="<= 25 ms", readonly=True, aggregator="sum")
+    latency_le_50 = fields.Integer(string="<= 50 ms", readonly=True, aggregator="sum")
+    latency_le_100 = fields.Integer(string="<= 100 ms", readonly=True, aggregator="sum")
+    latency_le_250 = fields.Integer(string="<= 250 ms", readonly=True, aggregator="sum")
+    latency_le_500 = fields.Integer(string="<= 500 ms", readonly=True, aggregator="sum")
+    latency_le_1000 = fields.Integer(string="<= 1 s", readonly=True, aggregator="sum")
+    latency_le_2500 = fields.Integer(string="<= 2.5 s", readonly=True, aggregator="sum")
+    latency_le_5000 = fields.Integer(string="<= 5 s", readonly=True, aggregator="sum")
+    latency_overflow = fields.Integer(string="> 5 s", readonly=True, aggregator="sum")
+
+    # Approximate distinct IP addresses (linear-counting bitmap)
+    ip_sketch = SketchBits(string="IP Sketch", readonly=True, aggregator=False)
+
+    # Derived values
+    avg_duration_ms = fields.Integer(string="Avg Duration (ms)", compute="_compute_latency")
+    p50_ms = fields.Integer(string="p50 (ms)", compute="_compute_latency")
+    p95_ms = fields.Integer(string="p95 (ms)", compute="_compute_latency")
+    distinct_ips = fields.Integer(string="Distinct IPs (approx.)", compute="_compute_distinct_ips")
+
+    def init(self):
+        # The rollup key allows NULL model/operation/user, so the upsert target
+        # has to be an expression index rather than a plain unique constraint.
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS mcp_log_stats_rollup_key_uniq
+                ON mcp_log_stats (bucket_start, COALESCE(model_name, ''), COALESCE(operation, ''), COALESCE(user_id, 0))
+            """
+        )
+
+    @api.depends("request_count", "duration_total_ms", *LATENCY_COLUMNS)
+    def _compute_latency(self):
+        for record in self:
+            counts = [record[column] for column in LATENCY_COLUMNS]
+            timed = sum(counts)
+            record.avg_duration_ms = int(record.duration_total_ms / timed) if timed else 0
+            record.p50_ms = histogram_percentile(counts, 50) or 0
+            record.p95_ms = histogram_percentile(counts, 95) or 0
+
+    @api.depends("ip_sketch")
+    def _compute_distinct_ips(self):
+        for record in self:
+            record.distinct_ips = estimate_cardinality(record.ip_sketch)
+
+    @api.model
+    def record_event(
+        self, event_type, model_name=None, operation=None, user_id=None, duration_ms=None, ip_address=None
+    ):
+        """
+        Fold a single MCP event into its hourly rollup row.
+
+        Increments are summed per rollup key in memory and written once the
+        current transaction commits, in a short transaction of their own, so
+        requests never hold locks on the rollup rows and events of rolled
+        back transactions are not counted.
+
+        :param event_type: Event type of the mcp.log entry
+        :param model_name: Technical model name, if any
+        :param operation: Operation name, if any
+        :param user_id: ID of the user, if any
+        :param duration_ms: Request duration in milliseconds, if measured
+        :param ip_address: Client IP address, if known
+        """
+        cr = self.env.cr
+        pending = cr.postcommit.data.get(PENDING_ROLLUPS_KEY)
+        if pending is None:
+            pending = cr.postcommit.data[PENDING_ROLLUPS_KEY] = {}
+            dbname = cr.dbname
+            cr.postcommit.add(lambda: _flush_rollups(dbname, pending))
+
+        bucket_start = cr.now().replace(minute=0, second=0, microsecond=0)
+        key = (bucket_start, model_name or None, operation or None, user_id or None)
+        row = pending.get(key)
+        if row is None:
+            row = pending[key] = dict.fromkeys(ROLLUP_COUNTERS + ("duration_max_ms", "ip_sketch"), 0)
+        row["request_count"] += 1
+        if event_type in ERROR_EVENT_TYPES:
+            row["error_count"] += 1
+        if duration_ms is not None:
+            duration_ms = max(int(duration_ms), 0)
+            row["duration_total_ms"] += duration_ms
+            row["duration_max_ms"] = max(row["duration_max_ms"], duration_ms)
+            row[latency_column(duration_ms)] += 1
+        row["ip_sketch"] |= sketch_bit(ip_address)
+
+    @api.model
+    def _flush_pending(self):
+        """Write the increments buffered in the current transaction right away, in it."""
+        pending = self.env.cr.postcommit.data.get(PENDING_ROLLUPS_KEY)
+        if pending:
+            self._upsert_rollups(dict(pending))
+            pending.clear()
+
+    @api.model
+    def _upsert_rollups(self, pending):
+        """
+        Add buffered increments to their rollup rows.
+
+        Rows are upserted in key order, so concurrent flushes lock them in the
+        same order and cannot deadlock.
+
+        :param pending: Increments by (bucket_start, model_name, operation, user_id)
+        :type pending: dict
+        """
+        columns = ", ".join(ROLLUP_COUNTERS)
+        placeholders = ", ".join(["%s"] * len(ROLLUP_COUNTERS))
+        updates = ",\n".join(f"{column} = mcp_log_stats.{column} + EXCLUDED.{column}" for column in ROLLUP_COUNTERS)
+        uid = self.env.uid
+        now = self.env.cr.now()
+        for key in sorted(pending, key=_rollup_sort_key):
+            row = pending[key]
+            self.env.cr.execute(
+                f"""
+                INSERT INTO mcp_log_stats (
+                    bucket_start, model_name, operation, user_id,
+                    {columns}, duration_max_ms, ip_sketch,
+                    create_uid, create_date, write_uid, write_date
+                )
+                VALUES (%s, %s, %s, %s, {placeholders}, %s, %s::bit({SKETCH_BITS}), %s, %s, %s, %s)
+                ON CONFLICT (bucket_start, COALESCE(model_name, ''), COALESCE(operation, ''), COALESCE(user_id, 0))
+                DO UPDATE SET
+                    {updates},
+                    duration_max_ms = GREATEST(mcp_log_stats.duration_max_ms, EXCLUDED.duration_max_ms),
+                    ip_sketch = mcp_log_stats.ip_sketch | EXCLUDED.ip_sketch,
+                    write_uid = EXCLUDED.write_uid,
+                    write_date = EXCLUDED.write_date
+                """,
+                (
+                    *key,
+                    *(row[column] for column in ROLLUP_COUNTERS),
+                    row["duration_max_ms"],
+                    format(row["ip_sketch"], f"0{SKETCH_BITS}b"),
+                    uid,
+                    now,
+                    uid,
+                    now,
+                ),
+            )
+
+    def _read_group_select(self, aggregate_spec, query):
+        # Sketches are merged in the database, which has no generic bit_or aggregate spec
+        if aggregate_spec == "ip_sketch:bit_or":
+            return SQL("bit_or(%s)", self._field_to_sql(self._table, "ip_sketch", query))
+        return super()._read_group_select(aggregate_spec, query)
+
+    @api.model
+    def get_rollup(self, date_from=None, date_to=None, groupby=("model_name", "operation"), domain=None):
+        """
+        Aggregate rollup rows over a time range without touching mcp.log.
+
+        :param date_from: Inclusive lower bound on the bucket hour
+        :param date_to: Exclusive upper bound on the bucket hour
+        :param groupby: Rollup key columns to group by (subset of
+                        bucket_start, model_name, operation, user_id)
+        :param domain: Additional domain applied to rollup rows
+        :return: List of dicts with counts, latency percentiles and distinct users/IPs
+        :rtype: list[dict]
+        """
+        allowed_groupby = ("bucket_start", "model_name", "operation", "user_id")
+        groupby = [name for name in groupby if name in allowed_groupby]
+
+        search_domain = list(domain or [])
+        if date_from:
+            search_domain.append(("bucket_start", ">=", date_from))
+        if date_to:
+            search_domain.append(("bucket_start", "<", date_to))
+
+        aggregates = [
+            "__count",
+            *(f"{column}:sum" for column in ROLLUP_COUNTERS),
+            "duration_max_ms:max",
+            "user_id:count_distinct",
+            "ip_sketch:bit_or",
+        ]
+        specs = ["bucket_start:hour" if name == "bucket_start" else name for name in groupby]
+        result = []
+        for values in self._read_group(search_domain, specs, aggregates, order=", ".join(specs) or None):
+            keys = values[: len(groupby)]
+            count, *sums, duration_max_ms, distinct_users, ip_sketch = values[len(groupby) :]
+            if not count:
+                continue
+            group = dict(zip(groupby, (key.id if name == "user_id" else key for name, key in zip(groupby, keys))))
+            totals = dict(zip(ROLLUP_COUNTERS, (value or 0 for value in sums)))
+            histogram = [totals[column] for column in LATENCY_COLUMNS]
+            timed = sum(histogram)
+            group.update(
+                request_count=totals["request_count"],
+                error_count=totals["error_count"],
+                duration_total_ms=totals["duration_total_ms"],
+                duration_max_ms=duration_max_ms or 0,
+                avg_duration_ms=int(totals["duration_total_ms"] / timed) if timed else 0,
+                p50_ms=histogram_percentile(histogram, 50),
+                p95_ms=histogram_percentile(histogram, 95),
+                distinct_users=distinct_users or 0,
+                distinct_ips=estimate_cardinality(int(ip_sketch, 2) if ip_sketch else 0),
+            )
+            result.append(group)
+        return result
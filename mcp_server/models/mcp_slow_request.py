@@ -0,0 +1,71 @@
+"""MCP Slow Request Journal Model for diagnosing expensive client calls."""
+
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_SIZE = 1000
+
+
+class MCPSlowRequest(models.Model):
+    _name = "mcp.slow.request"
+    _description = "MCP Slow Request"
+    _order = "create_date desc, id desc"
+    _rec_name = "operation"
+
+    user_id = fields.Many2one("res.users", string="User", readonly=True, ondelete="set null")
+    endpoint = fields.Char(string="Endpoint", readonly=True)
+    model_name = fields.Char(string="Model", readonly=True, index=True)
+    operation = fields.Char(string="Operation", readonly=True)
+    duration_ms = fields.Integer(string="Duration (ms)", readonly=True)
+    threshold_ms = fields.Integer(string="Threshold (ms)", readonly=True)
+
+    # Call arguments that usually explain a slow query
+    domain = fields.Text(string="Domain", readonly=True)
+    requested_fields = fields.Text(string="Fields", readonly=True)
+    query_limit = fields.Integer(string="Limit", readonly=True)
+
+    sql_count = fields.Integer(string="SQL Queries", readonly=True)
+    sql_statements = fields.Text(
+        string="SQL Statements", readonly=True, help="Most recent statements of the request, with their duration"
+    )
+    stack = fields.Text(
+        string="Stack Snapshot", readonly=True, help="Stack of the request when it crossed the threshold"
+    )
+    error_message = fields.Text(string="Error", readonly=True)
+
+    @api.model
+    def _journal_size(self):
+        try:
+            return int(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param("mcp_server.slow_request_journal_size", DEFAULT_JOURNAL_SIZE)
+            )
+        except (ValueError, TypeError):
+            return DEFAULT_JOURNAL_SIZE
+
+    @api.model
+    def record(self, values):
+        """
+        Add a slow request to the journal and drop the entries beyond the journal size.
+
+        :param values: Field values of the entry
+        :type values: dict
+        :return: Created record
+        """
+        entry = self.sudo().create(values)
+        self.env.flush_all()
+        # Bounded journal: keep the N most recent entries (mcp_server.slow_request_journal_size)
+        self.env.cr.execute(
+            """
+            DELETE FROM mcp_slow_request
+             WHERE id <= (SELECT id FROM mcp_slow_request ORDER BY id DESC OFFSET %s LIMIT 1)
+            """,
+            (max(self._journal_size(), 1),),
+        )
+        if self.env.cr.rowcount:
+            self.invalidate_model()
+        return entry
@@ -62,6 +62,22 @@ class ResConfigSettings(models.TransientModel):
         config_parameter="mcp_server.log_retention_days",
         default=30,
     )
+    mcp_log_archive_enabled = fields.Boolean(
+        string="Archive Expired Logs",
+        help="When enabled, log entries are written to compressed NDJSON files in the "
+        "filestore before the retention cleanup removes them from the database. "
+        "Archived entries can still be queried from MCP Log Archives.",
+        config_parameter="mcp_server.log_archive_enabled",
+        default=False,
+    )
+    mcp_audit_writes = fields.Boolean(
+        string="Audit Record Changes",
+        help="When enabled, create, write and unlink calls made through MCP are logged "
+        "with their field-level changes (old and new values). The previous values are "
+        "read in one batch before the call and the log entry is written in the background.",
+        config_parameter="mcp_server.audit_writes",
+        default=True,
+    )
 
     @api.model
     def get_values(self):
@@ -76,6 +92,8 @@ class ResConfigSettings(models.TransientModel):
             mcp_use_api_keys=params.get_param("mcp_server.use_api_keys", "True") == "True",
             mcp_enable_rate_limiting=params.get_param("mcp_server.enable_rate_limiting", "False") == "True",
             mcp_log_retention_days=int(params.get_param("mcp_server.log_retention_days", "30")),
+            mcp_log_archive_enabled=params.get_param("mcp_server.log_archive_enabled", "False") == "True",
+            mcp_audit_writes=params.get_param("mcp_server.audit_writes", "True") == "True",
         )
         return res
 
@@ -90,3 +108,5 @@ class ResConfigSettings(models.TransientModel):
         params.set_param("mcp_server.use_api_keys", str(self.mcp_use_api_keys))
         params.set_param("mcp_server.enable_rate_limiting", str(self.mcp_enable_rate_limiting))
         params.set_param("mcp_server.log_retention_days", str(self.mcp_log_retention_days))
+        params.set_param("mcp_server.log_archive_enabled", str(self.mcp_log_archive_enabled))
+        params.set_param("mcp_server.audit_writes", str(self.mcp_audit_writes))
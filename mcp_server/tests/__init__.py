@@ -8,3 +8,25 @@ from . import test_model_selection_ui
 from . import test_rate_limiting
 from . import test_security
 from . import test_xmlrpc_controller
+from . import test_log_stats
+from . import test_log_partitions
+from . import test_log_archive
+from . import test_log_browsing
+from . import test_log_dedup
+from . import test_log_export
+from . import test_write_audit
+from . import test_metrics
+from . import test_tracing
+from . import test_profiling
+from . import test_sampler
+from . import test_resource_usage
+from . import test_slow_requests
+from . import test_health
+from . import test_batch
+from . import test_jsonrpc
+from . import test_xmlrpc_stream
+from . import test_compression
+from . import test_msgpack
+from . import test_columnar
+from . import test_keyset
+from . import test_record_export
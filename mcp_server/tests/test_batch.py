@@ -0,0 +1,132 @@
+"""Tests for system.multicall and the REST batch endpoint."""
+
+import json
+import xmlrpc.client as xmlrpclib
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from odoo.exceptions import AccessError, UserError
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import auth, xmlrpc
+from ..controllers.xmlrpc import MAX_BATCH_CALLS, ObjectBatch
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestObjectBatch(TransactionCase):
+    def _execute(self, uid, model, method):
+        batch = ObjectBatch(self.env.user, "api-key")
+        with patch.object(xmlrpc, "request", SimpleNamespace(env=self.env)):
+            return batch.execute([self.env.cr.dbname, uid, "api-key", model, method, [[]], {}])
+
+    def test_execute_validates_calls(self):
+        """Test batched calls are checked like execute_kw calls before running."""
+        self.assertIsInstance(self._execute(self.env.uid, "res.partner", "search_count"), int)
+        with self.assertRaises(xmlrpclib.Fault) as context:
+            self._execute("not-a-uid", "res.partner", "search_count")
+        self.assertEqual(context.exception.faultCode, 400)
+        with self.assertRaises(UserError):
+            self._execute(self.env.uid, "no.such.model", "search_count")
+        with self.assertRaises(AccessError):
+            self._execute(self.env.uid, "res.partner", "_search")
+
+
+@tagged("post_install", "-at_install")
+class TestBatchCalls(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env, allow_create=True, disabled_models=["res.users"])
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Batch User", "mcp_batch_user")
+
+    def _call(self, model, method, *args, **kwargs):
+        return {
+            "methodName": "execute_kw",
+            "params": [self.env.cr.dbname, self.user.id, self.api_key, model, method, list(args), kwargs],
+        }
+
+    def _multicall(self, calls):
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps((calls,), "system.multicall", allow_none=1),
+            headers={"Content-Type": "text/xml"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return xmlrpclib.loads(response.content)[0][0]
+
+    def test_multicall_results_and_faults(self):
+        """Test each sub-call gets its own result or fault, in order."""
+        results = self._multicall(
+            [
+                self._call("res.partner", "search_count", []),
+                self._call("res.users", "search_count", []),
+                self._call("res.partner", "search_read", [], fields=["name"], limit=1),
+            ]
+        )
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0][0], int)
+        self.assertEqual(results[1]["faultCode"], 403)
+        self.assertEqual(list(results[2][0][0]), ["id", "name"])
+
+    def test_multicall_invalid_uid(self):
+        """Test a non-numeric uid fails its own sub-call as a bad request."""
+        call = self._call("res.partner", "search_count", [])
+        call["params"][1] = "not-a-uid"
+        results = self._multicall([call, self._call("res.partner", "search_count", [])])
+        self.assertEqual(results[0]["faultCode"], 400)
+        self.assertIsInstance(results[1][0], int)
+
+    def test_multicall_authenticates_once(self):
+        """Test the API key is validated once for the whole batch."""
+        with patch.object(auth, "get_user_from_api_key", wraps=auth.get_user_from_api_key) as get_user:
+            self._multicall([self._call("res.partner", "search_count", []) for _index in range(5)])
+        self.assertEqual(get_user.call_count, 1)
+
+    def test_failing_sub_call_rolls_back_alone(self):
+        """Test a failing sub-call does not undo the changes of the others."""
+        results = self._multicall(
+            [
+                self._call("res.partner", "create", {"name": "Batch Partner"}),
+                self._call("res.partner", "create", {"name": "Broken", "no_such_field": 1}),
+            ]
+        )
+        self.assertIsInstance(results[0][0], int)
+        self.assertIn("faultCode", results[1])
+        self.assertTrue(self.env["res.partner"].browse(results[0][0]).exists())
+
+    def test_multicall_size_limit(self):
+        """Test oversized batches are rejected as a whole."""
+        calls = [self._call("res.partner", "search_count", [])] * (MAX_BATCH_CALLS + 1)
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps((calls,), "system.multicall", allow_none=1),
+            headers={"Content-Type": "text/xml"},
+        )
+        with self.assertRaises(xmlrpclib.Fault) as context:
+            xmlrpclib.loads(response.content)
+        self.assertEqual(context.exception.faultCode, 400)
+
+    def test_rest_batch(self):
+        """Test the REST batch endpoint returns per-call results and errors."""
+        response = self.url_open(
+            "/mcp/object/batch",
+            data=json.dumps(
+                {
+                    "calls": [
+                        {"model": "res.partner", "method": "search_count", "args": [[]]},
+                        {"model": "res.users", "method": "search_count", "args": [[]]},
+                    ]
+                }
+            ),
+            headers={"Content-Type": "application/json", "X-API-Key": self.api_key},
+        )
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)["data"]["results"]
+        self.assertTrue(results[0]["success"])
+        self.assertIsInstance(results[0]["result"], int)
+        self.assertFalse(results[1]["success"])
+        self.assertEqual(results[1]["error"]["code"], "E403")
+
+    def test_rest_batch_requires_api_key(self):
+        """Test the REST batch endpoint requires an API key."""
+        response = self.url_open("/mcp/object/batch", data=json.dumps({"calls": []}))
+        self.assertEqual(response.status_code, 401)
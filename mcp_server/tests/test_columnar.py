@@ -0,0 +1,99 @@
+"""Tests for the columnar result format."""
+
+import xmlrpc.client as xmlrpclib
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import columnar
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestColumnarFormat(TransactionCase):
+    def test_pop_format(self):
+        """Test the format option is removed from search_read and read calls only."""
+        params = ["db", 2, "key", "res.partner", "search_read", [[]], {"fields": ["name"], "format": "columnar"}]
+        dispatched, requested = columnar.pop_format("search_read", params)
+        self.assertTrue(requested)
+        self.assertEqual(dispatched[6], {"fields": ["name"]})
+        self.assertIn("format", params[6])
+
+        params = ["db", 2, "key", "res.partner", "search_count", [[]], {"format": "columnar"}]
+        self.assertEqual(columnar.pop_format("search_count", params), (params, False))
+        with self.assertRaises(ValueError):
+            columnar.pop_format("read", ["db", 2, "key", "res.partner", "read", [[1]], {"format": "csv"}])
+
+    def test_to_columnar(self):
+        """Test rows become columns, with many2one values split into ids and names."""
+        rows = [
+            {"id": 7, "name": "Azure", "parent_id": [3, "Parent"], "category_id": [1, 2]},
+            {"id": 8, "name": "Deco", "parent_id": False, "category_id": []},
+        ]
+        result = columnar.to_columnar(self.env["res.partner"], rows)
+        self.assertEqual(result["fields"], ["name", "parent_id", "parent_id.display_name", "category_id"])
+        self.assertEqual(result["ids"], [7, 8])
+        self.assertEqual(
+            result["columns"],
+            {
+                "name": ["Azure", "Deco"],
+                "parent_id": [3, False],
+                "parent_id.display_name": ["Parent", False],
+                "category_id": [[1, 2], []],
+            },
+        )
+
+    def test_to_columnar_without_rows(self):
+        """Test empty results keep the requested columns."""
+        result = columnar.to_columnar(self.env["res.partner"], [], ["id", "name", "parent_id"])
+        self.assertEqual(result["fields"], ["name", "parent_id", "parent_id.display_name"])
+        self.assertEqual(result["ids"], [])
+        self.assertEqual(result["columns"], {"name": [], "parent_id": [], "parent_id.display_name": []})
+
+
+@tagged("post_install", "-at_install")
+class TestColumnarEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env)
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Columnar User", "mcp_columnar_user")
+        self.parent = self.env["res.partner"].create({"name": "Columnar Parent", "is_company": True})
+        self.children = self.env["res.partner"].create(
+            [{"name": f"Columnar Child {index}", "parent_id": self.parent.id} for index in range(3)]
+        )
+
+    def _execute(self, method, *args, **kwargs):
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps(
+                (self.env.cr.dbname, self.user.id, self.api_key, "res.partner", method, list(args), kwargs),
+                "execute_kw",
+            ),
+            headers={"Content-Type": "text/xml"},
+        )
+        return xmlrpclib.loads(response.content)[0][0]
+
+    def test_search_read_columnar(self):
+        """Test search_read returns columns matching the row format."""
+        domain = [("id", "in", self.children.ids)]
+        rows = self._execute("search_read", domain, fields=["name", "parent_id"], order="id")
+        result = self._execute("search_read", domain, fields=["name", "parent_id"], order="id", format="columnar")
+        self.assertEqual(result["ids"], [row["id"] for row in rows])
+        self.assertEqual(result["columns"]["name"], [row["name"] for row in rows])
+        self.assertEqual(result["columns"]["parent_id"], [self.parent.id] * 3)
+        self.assertEqual(result["columns"]["parent_id.display_name"], [self.parent.display_name] * 3)
+
+        log = self.env["mcp.log"].search(
+            [("event_type", "=", "model_access"), ("user_id", "=", self.user.id)], order="id desc", limit=1
+        )
+        self.assertEqual(log.rows_returned, 3)
+
+    def test_read_columnar(self):
+        """Test read supports the columnar format with positional fields."""
+        result = self._execute("read", self.children[:2].ids, ["name"], format="columnar")
+        self.assertEqual(result["fields"], ["name"])
+        self.assertEqual(result["ids"], self.children[:2].ids)
+
+    def test_unsupported_format(self):
+        """Test an unknown format is rejected with a 400 fault."""
+        with self.assertRaises(xmlrpclib.Fault) as fault:
+            self._execute("search_read", [], fields=["name"], format="csv")
+        self.assertEqual(fault.exception.faultCode, 400)
@@ -0,0 +1,165 @@
+"""Tests for request and response compression."""
+
+import gzip
+import io
+import xmlrpc.client as xmlrpclib
+from unittest.mock import patch
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import compression
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestCompressionCodecs(TransactionCase):
+    def test_choose_encoding(self):
+        """Test the coding is picked from Accept-Encoding weights."""
+        with patch.object(compression, "zstandard", None):
+            self.assertEqual(compression.choose_encoding("gzip, deflate, zstd"), "gzip")
+            self.assertEqual(compression.choose_encoding("*"), "gzip")
+            self.assertIsNone(compression.choose_encoding("gzip;q=0, br"))
+            self.assertIsNone(compression.choose_encoding(None))
+        if compression.zstandard is not None:
+            self.assertEqual(compression.choose_encoding("gzip, zstd"), "zstd")
+            self.assertEqual(compression.choose_encoding("gzip, zstd;q=0.5"), "gzip")
+
+    def test_round_trip(self):
+        """Test complete and chunked compression decode to the original body."""
+        body = b"<value><string>Partner</string></value>\n" * 2000
+        for encoding in compression.supported_encodings():
+            with self.subTest(encoding=encoding):
+                self.assertEqual(compression.decompress(compression.compress(body, encoding), encoding), body)
+                chunks = [body[index : index + 4096] for index in range(0, len(body), 4096)]
+                streamed = b"".join(compression.compress_chunks(iter(chunks), encoding))
+                self.assertEqual(compression.decompress(streamed, encoding), body)
+                self.assertLess(len(streamed), len(body) // 10)
+
+    def test_gzip_output_is_standard(self):
+        """Test gzip bodies can be read by the gzip module."""
+        self.assertEqual(gzip.decompress(compression.compress(b"hello" * 100, "gzip")), b"hello" * 100)
+        self.assertEqual(compression.decompress(gzip.compress(b"hello"), "x-gzip"), b"hello")
+
+    def test_decompress_rejects_invalid_bodies(self):
+        """Test unsupported codings, corrupt, truncated and oversized bodies raise ValueError."""
+        body = gzip.compress(b"a" * 10000)
+        with self.assertRaises(ValueError):
+            compression.decompress(body, "br")
+        with self.assertRaises(ValueError):
+            compression.decompress(b"not gzip", "gzip")
+        with self.assertRaises(ValueError):
+            compression.decompress(body[:-12], "gzip")
+        with self.assertRaises(ValueError):
+            compression.decompress(body, "gzip", max_size=1000)
+
+    def test_decoded_stream_reads_in_bounded_chunks(self):
+        """Test a stream decodes a large body in reads of at most the requested size."""
+        stream = compression.DecodedStream(io.BytesIO(gzip.compress(b"a" * 1000000)), "gzip", max_size=2000000)
+        sizes = list(iter(lambda: len(stream.read(4096)), 0))
+        self.assertEqual(sum(sizes), 1000000)
+        self.assertLessEqual(max(sizes), 4096)
+        stream = compression.DecodedStream(io.BytesIO(gzip.compress(b"a" * 1000000)), "gzip", max_size=10000)
+        with self.assertRaises(ValueError):
+            while stream.read(4096):
+                pass
+
+    def test_decompress_multiple_members_and_frames(self):
+        """Test bodies made of several gzip members or zstd frames are decoded completely."""
+        body = gzip.compress(b"first,") + gzip.compress(b"second")
+        self.assertEqual(compression.decompress(body, "gzip"), b"first,second")
+        with self.assertRaises(ValueError):
+            compression.decompress(body + b"garbage", "gzip")
+        if compression.zstandard is not None:
+            compressor = compression.zstandard.ZstdCompressor()
+            body = compressor.compress(b"first,") + compressor.compress(b"second")
+            self.assertEqual(compression.decompress(body, "zstd"), b"first,second")
+
+
+@tagged("post_install", "-at_install")
+class TestCompressionEndpoints(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env)
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.compression_min_size", "64")
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Compression User", "mcp_compression_user")
+
+    def _search_read_body(self):
+        return xmlrpclib.dumps(
+            (self.env.cr.dbname, self.user.id, self.api_key, "res.partner", "search_read", [[]], {"fields": ["name"]}),
+            "execute_kw",
+        ).encode()
+
+    def test_gzip_request_and_response(self):
+        """Test a gzip request body is decoded and the response gzip-encoded."""
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=gzip.compress(self._search_read_body()),
+            headers={"Content-Type": "text/xml", "Content-Encoding": "gzip", "Accept-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        rows = xmlrpclib.loads(response.content)[0][0]
+        self.assertTrue(rows)
+
+    def test_no_compression_without_accept_encoding(self):
+        """Test responses stay uncompressed when the client does not accept any coding."""
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=self._search_read_body(),
+            headers={"Content-Type": "text/xml", "Accept-Encoding": "identity"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_compression_disabled(self):
+        """Test level 0 disables response compression."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.compression_level", "0")
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=self._search_read_body(),
+            headers={"Content-Type": "text/xml", "Accept-Encoding": "gzip"},
+        )
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_invalid_request_encoding(self):
+        """Test unsupported and corrupt request bodies are rejected with XML-RPC faults."""
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=self._search_read_body(),
+            headers={"Content-Type": "text/xml", "Content-Encoding": "br"},
+        )
+        self.assertEqual(response.status_code, 415)
+        with self.assertRaises(xmlrpclib.Fault) as context:
+            xmlrpclib.loads(response.content)
+        self.assertEqual(context.exception.faultCode, 415)
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=b"not gzip",
+            headers={"Content-Type": "text/xml", "Content-Encoding": "gzip"},
+        )
+        with self.assertRaises(xmlrpclib.Fault) as context:
+            xmlrpclib.loads(response.content)
+        self.assertEqual(context.exception.faultCode, 400)
+
+    def test_compressed_request_over_body_limit(self):
+        """Test the XML-RPC body limit applies to the decoded size of a compressed body."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_max_body_size", "100000")
+        body = self._search_read_body().replace(b"search_read", b"search_read" + b" " * 1000000)
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=gzip.compress(body),
+            headers={"Content-Type": "text/xml", "Content-Encoding": "gzip"},
+        )
+        with self.assertRaises(xmlrpclib.Fault) as context:
+            xmlrpclib.loads(response.content)
+        self.assertEqual(context.exception.faultCode, 413)
+
+    def test_invalid_request_encoding_json_endpoint(self):
+        """Test endpoints without an error format of their own reject bad bodies with JSON errors."""
+        response = self.url_open(
+            "/mcp/object/batch",
+            data=b"{}",
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+        self.assertEqual(response.status_code, 415)
+        self.assertIn("application/json", response.headers["Content-Type"])
@@ -0,0 +1,68 @@
+"""Tests for the liveness and readiness modes of the health endpoint."""
+
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo.tests import common
+
+from ..controllers import health, log_queue, utils
+
+
+class TestHealth(common.HttpCase):
+    def setUp(self):
+        super().setUp()
+        utils.clear_mcp_caches()
+        health.reset()
+        self.addCleanup(health.reset)
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+
+    def test_liveness_uses_cached_enabled_flag(self):
+        """Test liveness keeps answering from the worker's cache for a while after it has expired."""
+        response = self.url_open("/mcp/health")
+        data = json.loads(response.content)["data"]
+        self.assertEqual(data["status"], "ok")
+        self.assertIn("uptime_seconds", data)
+
+        utils._mcp_enabled_cache["timestamp"] -= timedelta(seconds=utils.CACHE_TTL_SECONDS * 2)
+        with patch.object(utils, "request") as mocked_request:
+            self.assertTrue(utils.is_mcp_enabled(allow_stale=True))
+            mocked_request.env.__getitem__.assert_not_called()
+
+    def test_liveness_stale_flag_is_bounded(self):
+        """Test a cached enabled flag older than the staleness cap is read again."""
+        self.assertTrue(utils.is_mcp_enabled())
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "False")
+        utils._mcp_enabled_cache["timestamp"] -= timedelta(seconds=utils.STALE_CACHE_MAX_SECONDS + 1)
+
+        response = self.url_open("/mcp/health")
+        self.assertEqual(response.status_code, 503)
+
+    def test_readiness_report(self):
+        """Test the deep mode reports database, worker, cache and log queue state."""
+        response = self.url_open("/mcp/health?deep=1")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)["data"]
+        self.assertEqual(data["status"], "ok")
+        self.assertTrue(data["database"]["ok"])
+        self.assertIn("latency_ms", data["database"])
+        self.assertIn("in_flight", data["worker"])
+        self.assertIn("acl_hit_ratio", data["caches"])
+        self.assertEqual(data["log_queue"]["capacity"], log_queue.QUEUE_MAX_SIZE)
+        self.assertFalse(data["cached"])
+
+    def test_readiness_is_rate_limited(self):
+        """Test probes within the interval are served the previous report."""
+        self.url_open("/mcp/health?deep=1")
+        with patch.object(health, "_compute_readiness") as compute:
+            data = json.loads(self.url_open("/mcp/health?deep=1").content)["data"]
+        compute.assert_not_called()
+        self.assertTrue(data["cached"])
+
+    def test_readiness_degraded_when_disabled(self):
+        """Test readiness fails when MCP is disabled."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "False")
+        response = self.url_open("/mcp/health?deep=1")
+        self.assertEqual(response.status_code, 503)
+        data = json.loads(response.content)
+        self.assertEqual(data["meta"]["health"]["status"], "degraded")
@@ -6,6 +6,9 @@ and provides safe defaults.
 """
 
 import logging
+from datetime import datetime, timedelta
+
+from ..controllers import utils
 
 _logger = logging.getLogger(__name__)
 
@@ -172,6 +175,52 @@ def create_test_user(env, name, login, **kwargs):
     return TestHelpers.create_test_user(env, name, login, **kwargs)
 
 
+def enable_model_for_mcp(env, model_name="res.partner", disabled_models=(), **access):
+    """Enable the MCP server with API key authentication and expose a model through it.
+
+    Args:
+        env: Odoo environment
+        model_name: Model to enable (e.g. 'res.partner')
+        disabled_models: Models that must not be MCP-enabled
+        **access: allow_read/allow_create/allow_write/... values, read-only by default
+
+    Returns:
+        mcp.enabled.model: The enabled model record
+    """
+    env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+    env["ir.config_parameter"].sudo().set_param("mcp_server.use_api_keys", "True")
+    utils.clear_mcp_caches()
+
+    EnabledModel = env["mcp.enabled.model"].sudo()
+    model_id = env["ir.model"]._get_id(model_name)
+    values = {"allow_read": True, "allow_create": False, "allow_write": False, "active": True, **access}
+    enabled = EnabledModel.search([("model_id", "=", model_id)], limit=1)
+    if enabled:
+        enabled.write(values)
+    else:
+        enabled = EnabledModel.create({"model_id": model_id, **values})
+    for disabled_model in disabled_models:
+        EnabledModel.search([("model_id", "=", env["ir.model"]._get_id(disabled_model))]).unlink()
+    return enabled
+
+
+def create_api_key_user(env, name, login, groups=("mcp_server.group_mcp_user", "base.group_user")):
+    """Create a test user in the given groups with an RPC API key valid for a day.
+
+    Args:
+        env: Odoo environment
+        name: User name
+        login: User login
+        groups: XML ids of the user's groups
+
+    Returns:
+        tuple: (res.users record, API key)
+    """
+    user = create_test_user(env, name, login, groups_id=[(6, 0, [env.ref(xmlid).id for xmlid in groups])])
+    api_key = env(user=user)["res.users.apikeys"]._generate("rpc", f"{name} Key", datetime.now() + timedelta(days=1))
+    return user, api_key
+
+
 def create_test_config_settings(env, **kwargs):
     """Create test config settings with all required fields filled.
 
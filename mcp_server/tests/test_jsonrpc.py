@@ -0,0 +1,152 @@
+"""Tests for the JSON-RPC 2.0 object endpoint."""
+
+import json
+from datetime import date, datetime
+from unittest.mock import patch
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import jsonrpc, metrics
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestJsonRpcEncoding(TransactionCase):
+    def test_dates_use_odoo_format(self):
+        """Test dates and datetimes are encoded like in XML-RPC responses."""
+        payload = jsonrpc.result(1, {"when": datetime(2024, 3, 1, 12, 30, 5), "day": date(2024, 3, 1)})
+        decoded = json.loads(jsonrpc.dumps(payload))
+        self.assertEqual(decoded["result"], {"when": "2024-03-01 12:30:05", "day": "2024-03-01"})
+
+    def test_parse_call_positional_and_named_params(self):
+        """Test params are accepted as an array or as an object."""
+        positional = ["db", 2, "key", "res.partner", "search_count", [[]], {}]
+        self.assertEqual(
+            jsonrpc.parse_call({"jsonrpc": "2.0", "id": 7, "method": "execute_kw", "params": positional}),
+            (7, positional, False),
+        )
+        named = {"db": "db", "uid": 2, "password": "key", "model": "res.partner", "method": "search_count"}
+        request_id, params, notification = jsonrpc.parse_call(
+            {"jsonrpc": "2.0", "method": "execute_kw", "params": named}
+        )
+        self.assertIsNone(request_id)
+        self.assertEqual(params, ["db", 2, "key", "res.partner", "search_count", [], {}])
+        self.assertTrue(notification)
+
+    def test_parse_call_rejects_invalid_calls(self):
+        """Test invalid calls raise the matching JSON-RPC error codes."""
+        cases = [
+            ([], jsonrpc.INVALID_REQUEST),
+            ({"id": 1, "method": "execute_kw"}, jsonrpc.INVALID_REQUEST),
+            ({"jsonrpc": "2.0", "id": 1, "method": "unlink_all"}, jsonrpc.METHOD_NOT_FOUND),
+            ({"jsonrpc": "2.0", "id": 1, "method": "execute_kw", "params": "x"}, jsonrpc.INVALID_PARAMS),
+        ]
+        for call, code in cases:
+            with self.subTest(call=call), self.assertRaises(jsonrpc.JsonRpcError) as error:
+                jsonrpc.parse_call(call)
+            self.assertEqual(error.exception.code, code)
+
+
+@tagged("post_install", "-at_install")
+class TestJsonRpcEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env, disabled_models=["res.users"])
+        self.user, self.api_key = create_api_key_user(self.env, "MCP JSON-RPC User", "mcp_jsonrpc_user")
+
+    def _call(self, request_id, model, method, *args, **kwargs):
+        call = {
+            "jsonrpc": "2.0",
+            "method": "execute_kw",
+            "params": [self.env.cr.dbname, self.user.id, self.api_key, model, method, list(args), kwargs],
+        }
+        if request_id is not None:
+            call["id"] = request_id
+        return call
+
+    def _post(self, body):
+        data = body if isinstance(body, (str, bytes)) else json.dumps(body)
+        return self.url_open("/mcp/jsonrpc/object", data=data, headers={"Content-Type": "application/json"})
+
+    def test_single_call(self):
+        """Test a call returns the same result as the XML-RPC endpoint."""
+        response = self._post(self._call(1, "res.partner", "search_read", [], fields=["name", "write_date"], limit=1))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        body = response.json()
+        self.assertEqual(body["id"], 1)
+        self.assertEqual(sorted(body["result"][0]), ["id", "name", "write_date"])
+        # Odoo server format, as in XML-RPC
+        datetime.strptime(body["result"][0]["write_date"], "%Y-%m-%d %H:%M:%S")
+
+        log = self.env["mcp.log"].search(
+            [("event_type", "=", "model_access"), ("user_id", "=", self.user.id)], order="id desc", limit=1
+        )
+        self.assertEqual(log.response_bytes, len(response.content))
+
+    def test_batch_with_per_call_errors(self):
+        """Test each call of a batch gets its own result or error, in order."""
+        response = self._post(
+            [
+                self._call(1, "res.partner", "search_count", []),
+                self._call(2, "res.users", "search_count", []),
+                {"jsonrpc": "2.0", "id": 3, "method": "execute"},
+                self._call(None, "res.partner", "search_count", []),
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        # The notification gets no response
+        self.assertEqual([item["id"] for item in results], [1, 2, 3])
+        self.assertIsInstance(results[0]["result"], int)
+        self.assertEqual(results[1]["error"]["code"], 403)
+        self.assertEqual(results[2]["error"]["code"], jsonrpc.METHOD_NOT_FOUND)
+
+    def test_batch_with_unserializable_result(self):
+        """Test a result that cannot be encoded fails its own call only."""
+
+        def search_read(records, *args, **kwargs):
+            return [{"id": 1, "value": object()}]
+
+        with patch.object(type(self.env["res.partner"]), "search_read", search_read):
+            response = self._post(
+                [self._call(1, "res.partner", "search_read", []), self._call(2, "res.partner", "search_count", [])]
+            )
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual(results[0]["error"]["code"], 500)
+        self.assertIsInstance(results[1]["result"], int)
+
+    def test_notification_only(self):
+        """Test a notification is answered with an empty response."""
+        response = self._post(self._call(None, "res.partner", "search_count", []))
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(response.content)
+
+    def test_parse_error_and_empty_batch(self):
+        """Test malformed bodies and empty batches are rejected."""
+        body = self._post("{not json").json()
+        self.assertEqual(body["error"]["code"], jsonrpc.PARSE_ERROR)
+        self.assertIsNone(body["id"])
+        body = self._post([]).json()
+        self.assertEqual(body["error"]["code"], jsonrpc.INVALID_REQUEST)
+
+    def test_invalid_credentials(self):
+        """Test a wrong API key is reported as a 401 error."""
+        call = self._call(5, "res.partner", "search_count", [])
+        call["params"][2] = "wrong-key"
+        body = self._post(call).json()
+        self.assertEqual(body["id"], 5)
+        self.assertEqual(body["error"]["code"], 401)
+
+    def test_metric_labels_from_client_input(self):
+        """Test missing or malformed model and method names are not used as metric labels."""
+        metrics.reset()
+        params = {"db": self.env.cr.dbname, "uid": self.user.id, "password": self.api_key}
+        self._post({"jsonrpc": "2.0", "id": 1, "method": "execute_kw", "params": params})
+        call = self._call(2, 'res.partner"} evil', "search_count", [])
+        self._post(call)
+
+        series = {labels[:3] for (name, labels) in metrics.snapshot()["counters"] if name == "mcp_requests_total"}
+        self.assertIn(("/mcp/jsonrpc/object", "", ""), series)
+        self.assertNotIn(("/mcp/jsonrpc/object", "None", "None"), series)
+        self.assertIn(("/mcp/jsonrpc/object", "", "search_count"), series)
@@ -0,0 +1,114 @@
+"""Tests for keyset pagination with search_read_cursor."""
+
+import xmlrpc.client as xmlrpclib
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import keyset
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestKeysetPagination(TransactionCase):
+    def _params(self, *args, **kwargs):
+        return ["db", 2, "key", "res.partner", keyset.CURSOR_METHOD, list(args), kwargs]
+
+    def test_first_page(self):
+        """Test the first page is a search_read by id without offset."""
+        params, page = keyset.to_search_read(
+            self.env, "res.partner", self._params([("is_company", "=", True)], ["name"], 50)
+        )
+        self.assertEqual(params[4], "search_read")
+        self.assertEqual(
+            params[6],
+            {"domain": [("is_company", "=", True)], "fields": ["name"], "limit": 51, "order": "id"},
+        )
+        self.assertEqual(page, {"limit": 50, "descending": False})
+
+    def test_next_page(self):
+        """Test the cursor of a full page selects the rows after its last id."""
+        rows = [{"id": record_id} for record_id in (3, 5, 9)]
+        result = keyset.to_page(self.env, "res.partner", rows, {"limit": 2, "descending": False})
+        self.assertEqual(result["records"], rows[:2])
+        params, _page = keyset.to_search_read(
+            self.env, "res.partner", self._params([], limit=2, cursor=result["next_cursor"])
+        )
+        self.assertEqual(params[6]["domain"], [("id", ">", 5)])
+
+        last = keyset.to_page(self.env, "res.partner", rows[:2], {"limit": 2, "descending": False})
+        self.assertFalse(last["next_cursor"])
+
+    def test_descending_order(self):
+        """Test descending pages select the rows before the last id."""
+        cursor = keyset.to_page(
+            self.env, "res.partner", [{"id": 9}, {"id": 5}], {"limit": 1, "descending": True}
+        )["next_cursor"]
+        params, _page = keyset.to_search_read(self.env, "res.partner", self._params(order="id desc", cursor=cursor))
+        self.assertEqual(params[6]["domain"], [("id", "<", 9)])
+        self.assertEqual(params[6]["order"], "id desc")
+
+    def test_invalid_calls(self):
+        """Test bad orders, limits and cursors of other models or orders are rejected."""
+        cursor = keyset.to_page(self.env, "res.partner", [{"id": 1}, {"id": 2}], {"limit": 1, "descending": False})[
+            "next_cursor"
+        ]
+        invalid = [
+            ("res.partner", self._params(order="name")),
+            ("res.partner", self._params(limit=-1)),
+            ("res.partner", self._params(offset=10)),
+            ("res.partner", self._params(cursor="tampered.cursor")),
+            ("res.partner", self._params(cursor=cursor, order="id desc")),
+            ("res.users", self._params(cursor=cursor)),
+        ]
+        for model_name, params in invalid:
+            with self.subTest(params=params[6]), self.assertRaises(ValueError):
+                keyset.to_search_read(self.env, model_name, params)
+
+
+@tagged("post_install", "-at_install")
+class TestKeysetEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env)
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Keyset User", "mcp_keyset_user")
+        self.partners = self.env["res.partner"].create([{"name": f"Keyset Partner {index}"} for index in range(7)])
+
+    def _execute(self, *args, **kwargs):
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps(
+                (
+                    self.env.cr.dbname,
+                    self.user.id,
+                    self.api_key,
+                    "res.partner",
+                    keyset.CURSOR_METHOD,
+                    list(args),
+                    kwargs,
+                ),
+                "execute_kw",
+            ),
+            headers={"Content-Type": "text/xml"},
+        )
+        return xmlrpclib.loads(response.content)[0][0]
+
+    def test_pages_cover_all_records(self):
+        """Test following the cursors returns every record once, in id order."""
+        domain = [("name", "like", "Keyset Partner")]
+        ids = []
+        cursor = False
+        pages = 0
+        while True:
+            page = self._execute(domain, ["name"], 3, cursor)
+            ids += [row["id"] for row in page["records"]]
+            pages += 1
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, self.partners.sorted("id").ids)
+
+    def test_invalid_cursor(self):
+        """Test a tampered cursor is rejected with a 400 fault."""
+        with self.assertRaises(xmlrpclib.Fault) as fault:
+            self._execute([], ["name"], 3, "tampered.cursor")
+        self.assertEqual(fault.exception.faultCode, 400)
@@ -0,0 +1,107 @@
+"""Tests for archiving expired MCP log entries to compressed files."""
+
+import gzip
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+
+from odoo.tests.common import TransactionCase
+
+
+class TestMCPLogArchive(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.Archive = self.env["mcp.log.archive"]
+        self.addCleanup(self._remove_archive_files)
+
+    def _remove_archive_files(self):
+        root = self.Archive._archive_root()
+        if os.path.isdir(root):
+            shutil.rmtree(root, ignore_errors=True)
+
+    def _create_old_logs(self, count, days=40):
+        create_date = datetime.now() - timedelta(days=days)
+        return self.MCPLog.create(
+            [
+                {"event_type": "error", "model_name": "res.partner", "operation": f"op{i}", "create_date": create_date}
+                for i in range(count)
+            ]
+        )
+
+    def test_archive_logs_writes_file_and_manifest(self):
+        """Test expired entries are streamed to a gzip NDJSON file with a manifest."""
+        logs = self._create_old_logs(3)
+        recent = self.MCPLog.create({"event_type": "auth_success"})
+
+        count = self.Archive.archive_logs(datetime.now() - timedelta(days=30))
+
+        self.assertEqual(count, 3)
+        archive = self.Archive.search([("first_log_id", "=", min(logs.ids))])
+        self.assertEqual(len(archive), 1)
+        self.assertEqual(archive.row_count, 3)
+        self.assertEqual(archive.last_log_id, max(logs.ids))
+
+        path = archive._full_path()
+        with gzip.open(path, "rt") as stream:
+            ids = [json.loads(line)["id"] for line in stream]
+        self.assertEqual(ids, sorted(logs.ids))
+        self.assertNotIn(recent.id, ids)
+
+        with open(path + ".manifest.json") as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest["rows"], 3)
+        self.assertEqual(manifest["sha256"], archive.checksum)
+
+    def test_search_entries(self):
+        """Test archived entries can be queried from the files."""
+        self._create_old_logs(4)
+        self.Archive.archive_logs(datetime.now() - timedelta(days=30))
+
+        entries = self.Archive.search_entries(filters={"operation": "op2"})
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["model_name"], "res.partner")
+
+        self.assertEqual(len(self.Archive.search_entries(limit=2)), 2)
+        self.assertFalse(self.Archive.search_entries(date_from=datetime.now() - timedelta(days=1)))
+
+    def test_cleanup_archives_before_deleting(self):
+        """Test retention archives expired entries when archiving is enabled."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.log_archive_enabled", "True")
+        logs = self._create_old_logs(2)
+
+        self.MCPLog.cleanup_old_logs(days=30)
+
+        self.assertFalse(logs.exists())
+        archived_ids = {entry["id"] for entry in self.Archive.search_entries()}
+        self.assertTrue(set(logs.ids) <= archived_ids)
+
+    def test_rerun_removes_uncommitted_files(self):
+        """Test files of a run whose transaction did not commit are removed before archiving again."""
+        self._create_old_logs(2)
+        self.Archive.archive_logs(datetime.now() - timedelta(days=30))
+        archive = self.Archive.search([], limit=1)
+        orphan = archive._full_path()
+        # Same state as after a rollback: the files exist, the archive record does not
+        archive.unlink()
+
+        self.Archive.archive_logs(datetime.now() - timedelta(days=30))
+
+        self.assertFalse(os.path.exists(orphan))
+        self.assertFalse(os.path.exists(orphan + ".manifest.json"))
+        self.assertEqual(self.Archive.search_count([]), 1)
+
+    def test_unlink_removes_files_on_commit(self):
+        """Test unlinking an archive record removes its files once the deletion commits."""
+        self._create_old_logs(1)
+        self.Archive.archive_logs(datetime.now() - timedelta(days=30))
+        archive = self.Archive.search([], limit=1)
+        path = archive._full_path()
+
+        archive.unlink()
+        self.assertTrue(os.path.exists(path))
+
+        self.env.cr.postcommit.run()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(path + ".manifest.json"))
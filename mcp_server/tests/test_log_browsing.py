@@ -0,0 +1,72 @@
+"""Tests for log browsing: indexes, display names and keyset pagination."""
+
+from odoo.exceptions import UserError
+from odoo.tests.common import TransactionCase
+
+from ..models.mcp_log import LOG_INDEXES
+
+
+class TestMCPLogBrowsing(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.logs = self.MCPLog.create(
+            [{"event_type": "model_access", "model_name": "res.partner", "operation": f"op{i}"} for i in range(7)]
+        )
+        self.domain = [("id", "in", self.logs.ids)]
+
+    def test_indexes_exist(self):
+        """Test composite and BRIN indexes are created on the log storage."""
+        self.env.cr.execute("SELECT indexname FROM pg_indexes WHERE indexname IN %s", (tuple(LOG_INDEXES),))
+        self.assertEqual({row[0] for row in self.env.cr.fetchall()}, set(LOG_INDEXES))
+
+    def test_keyset_pages_cover_all_rows(self):
+        """Test pages follow each other without gaps or duplicates."""
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = self.MCPLog.search_read_keyset(self.domain, ["operation"], limit=3, cursor=cursor)
+            seen.extend(record["id"] for record in page["records"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, self.MCPLog.search(self.domain).ids)
+
+    def test_keyset_rejects_tampered_cursor(self):
+        """Test forged continuation tokens are rejected."""
+        page = self.MCPLog.search_read_keyset(self.domain, ["operation"], limit=2)
+        payload, signature = page["next_cursor"].rsplit(".", 1)
+        with self.assertRaises(UserError):
+            self.MCPLog.search_read_keyset(self.domain, limit=2, cursor=f"{payload}.{'0' * len(signature)}")
+
+    def test_display_name_uses_label_map(self):
+        """Test display names use the selection labels."""
+        self.assertEqual(self.logs[0].display_name, "Model Access - res.partner - op0")
+
+    def test_search_accessed_record_id(self):
+        """Test per-record lookups through the record_ids integer array."""
+        first = self.MCPLog.log_model_access(model_name="res.partner", operation="read", record_ids=[4711, 12])
+        second = self.MCPLog.log_model_access(model_name="res.partner", operation="write", record_ids=[47110])
+        third = self.MCPLog.log_model_access(model_name="res.users", operation="read", record_ids=[4711])
+
+        found = self.MCPLog.search([("accessed_record_id", "=", 4711)])
+        self.assertIn(first, found)
+        self.assertIn(third, found)
+        self.assertNotIn(second, found)
+
+        history = self.MCPLog.get_record_access_history("res.partner", 4711)
+        self.assertEqual([record["id"] for record in history["records"]], [first.id])
+
+        scoped = self.MCPLog.with_context(mcp_accessed_model="res.users").search([("accessed_record_id", "=", 4711)])
+        self.assertIn(third, scoped)
+        self.assertNotIn(first, scoped)
+
+    def test_record_id_array_ignores_non_numeric(self):
+        """Test non-numeric record_ids are stored without breaking the array column."""
+        log = self.MCPLog.log_event("model_access", record_ids="abc")
+        self.assertTrue(log)
+        self.assertFalse(self.MCPLog.search([("accessed_record_id", "=", 1), ("id", "=", log.id)]))
@@ -0,0 +1,75 @@
+"""Tests for error storm deduplication in MCP logging."""
+
+from odoo.tests.common import TransactionCase
+
+
+class TestMCPLogDedup(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.log_dedup_window_seconds", "60")
+
+    def _log_error(self, **kwargs):
+        values = {
+            "error_message": "Boom",
+            "error_code": "E500",
+            "model_name": "res.partner",
+            "operation": "write",
+            "user_id": self.env.user.id,
+        }
+        values.update(kwargs)
+        return self.MCPLog.log_error(**values)
+
+    def test_identical_errors_are_coalesced(self):
+        """Test repeated identical errors update a single row."""
+        first = self._log_error()
+        second = self._log_error()
+        third = self._log_error(error_message="Boom again")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(first.occurrence_count, 3)
+        self.assertTrue(first.last_occurrence)
+        self.assertEqual(self.MCPLog.search_count([("error_code", "=", "E500")]), 1)
+
+    def test_different_keys_are_not_coalesced(self):
+        """Test errors differing in code, model or operation get their own rows."""
+        base = self._log_error()
+        others = (
+            self._log_error(error_code="E403")
+            | self._log_error(model_name="res.users")
+            | self._log_error(operation="unlink")
+        )
+        self.assertEqual(len(others), 3)
+        self.assertNotIn(base, others)
+        self.assertEqual(base.occurrence_count, 1)
+
+    def test_other_event_types_are_not_coalesced(self):
+        """Test only error-like events are deduplicated."""
+        first = self.MCPLog.log_model_access(model_name="res.partner", operation="read", record_ids=[1])
+        second = self.MCPLog.log_model_access(model_name="res.partner", operation="read", record_ids=[1])
+        self.assertNotEqual(first, second)
+
+    def test_window_disabled(self):
+        """Test a zero window turns deduplication off."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.log_dedup_window_seconds", "0")
+        self.assertNotEqual(self._log_error(), self._log_error())
+
+    def test_expired_window(self):
+        """Test an error outside the window starts a new row."""
+        first = self._log_error()
+        self.env.cr.execute(
+            "UPDATE mcp_log_data SET create_date = create_date - interval '2 minutes' WHERE id = %s",
+            (first.id,),
+        )
+        second = self._log_error()
+        self.assertNotEqual(first, second)
+        self.assertEqual(second.occurrence_count, 1)
+
+    def test_rollups_count_every_occurrence(self):
+        """Test coalesced occurrences are still counted in the activity rollups."""
+        for _i in range(3):
+            self._log_error(model_name="mcp.dedup.test")
+        self.env["mcp.log.stats"]._flush_pending()
+        stats = self.env["mcp.log.stats"].search([("model_name", "=", "mcp.dedup.test")])
+        self.assertEqual(sum(stats.mapped("error_count")), 3)
@@ -0,0 +1,159 @@
+"""Tests for the streaming MCP log export."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+from odoo.tests import common
+
+from ..controllers import utils
+from .test_helpers import create_test_user
+
+
+class TestMCPLogExportRows(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        # Older than the export safety lag
+        create_date = datetime.now() - timedelta(hours=1)
+        self.logs = self.MCPLog.create(
+            [
+                {
+                    "event_type": "model_access",
+                    "model_name": "res.partner",
+                    "request_data": "x" * 1000,
+                    "create_date": create_date,
+                },
+                {"event_type": "error", "error_message": "Boom", "create_date": create_date},
+                {"event_type": "model_access", "model_name": "res.users", "create_date": create_date},
+            ]
+        )
+        self.after_id = self.logs[0].id - 1
+
+    def test_rows_in_id_order(self):
+        """Test rows are exported in id order with decompressed payloads."""
+        rows = list(self.MCPLog.iter_export_rows(self.after_id))
+        self.assertEqual([row["id"] for row in rows][:3], sorted(self.logs.ids))
+        self.assertEqual(rows[0]["request_data"], "x" * 1000)
+        self.assertEqual(rows[1]["error_message"], "Boom")
+
+    def test_filters_and_limit(self):
+        """Test event type, date and limit filters."""
+        rows = list(self.MCPLog.iter_export_rows(self.after_id, event_types=["error"]))
+        self.assertEqual([row["id"] for row in rows], [self.logs[1].id])
+
+        rows = list(self.MCPLog.iter_export_rows(self.after_id, limit=2))
+        self.assertEqual(len(rows), 2)
+
+        future = datetime.now() + timedelta(days=1)
+        self.assertFalse(list(self.MCPLog.iter_export_rows(self.after_id, date_from=future)))
+
+    def test_recent_rows_held_back(self):
+        """Test the export stops before entries recent enough to have uncommitted neighbours."""
+        recent = self.MCPLog.create({"event_type": "error", "error_message": "Recent"})
+        older = self.MCPLog.create(
+            {"event_type": "error", "error_message": "Older", "create_date": datetime.now() - timedelta(hours=1)}
+        )
+
+        ids = [row["id"] for row in self.MCPLog.iter_export_rows(self.after_id)]
+        self.assertIn(self.logs[2].id, ids)
+        # older is stable, but comes after an entry that is not yet
+        self.assertNotIn(recent.id, ids)
+        self.assertNotIn(older.id, ids)
+
+        # Without lag, entries created at the current transaction time are still held back
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.log_export_safety_lag", "0")
+        self.assertEqual(self.MCPLog._export_upper_id(self.after_id), recent.id)
+
+    def test_export_cursor_roundtrip(self):
+        """Test export cursors are signed and resume after the right id."""
+        token = self.MCPLog.encode_export_cursor(self.logs[1].id)
+        self.assertEqual(self.MCPLog.decode_export_cursor(token), self.logs[1].id)
+        with self.assertRaises(UserError):
+            self.MCPLog.decode_export_cursor(token[:-1] + ("0" if token[-1] != "0" else "1"))
+
+
+class TestMCPLogExportEndpoint(common.HttpCase):
+    def setUp(self):
+        super().setUp()
+        utils.clear_mcp_caches()
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.use_api_keys", "True")
+
+        self.admin = create_test_user(
+            self.env,
+            "MCP Export Admin",
+            "mcp_export_admin",
+            groups_id=[(6, 0, [self.env.ref("mcp_server.group_mcp_admin").id])],
+        )
+        self.api_key = self.env(user=self.admin)["res.users.apikeys"]._generate(
+            "rpc", "Export Key", datetime.now() + timedelta(days=1)
+        )
+        self.logs = self.env["mcp.log"].create(
+            [
+                {
+                    "event_type": "model_access",
+                    "model_name": "res.partner",
+                    "operation": f"op{i}",
+                    "create_date": datetime.now() - timedelta(hours=1),
+                }
+                for i in range(3)
+            ]
+        )
+        self.after_id = self.logs[0].id - 1
+
+    def _export(self, **params):
+        params.setdefault("after_id", self.after_id)
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return self.url_open(f"/mcp/logs/export?{query}", headers={"X-API-Key": self.api_key})
+
+    def test_ndjson_export_and_resume(self):
+        """Test NDJSON export with a resumable trailer line."""
+        response = self._export(limit=2, event_type="model_access")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers["Content-Type"])
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        trailer = lines.pop()
+        self.assertEqual([line["id"] for line in lines], self.logs.ids[:2])
+        self.assertEqual(trailer["rows"], 2)
+        self.assertFalse(trailer["complete"])
+
+        response = self._export(cursor=trailer["next_cursor"], event_type="model_access")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        trailer = lines.pop()
+        self.assertEqual(lines[0]["id"], self.logs[2].id)
+        self.assertTrue(trailer["complete"])
+
+    def test_csv_export(self):
+        """Test CSV export has a header row and trailer lines ending with the cursor."""
+        response = self._export(format="csv", event_type="model_access")
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.reader(io.StringIO(response.text)))
+        self.assertEqual(rows[0][0], "id")
+        self.assertEqual(rows[-3:-1], [["#rows", str(len(self.logs))], ["#complete", "true"]])
+        self.assertEqual(rows[-1][0], "#next_cursor")
+        self.assertEqual([int(row[0]) for row in rows[1:-3]], self.logs.ids)
+
+    def test_csv_export_interrupted(self):
+        """Test an interrupted CSV export reports the error in its trailer."""
+        with patch.object(type(self.env["mcp.log"]), "iter_export_rows", side_effect=ValueError("boom")):
+            response = self._export(format="csv")
+        trailer = dict(row for row in csv.reader(io.StringIO(response.text)))
+        self.assertEqual(trailer["#error"], "Export interrupted")
+        self.assertEqual(trailer["#rows"], "0")
+        self.assertEqual(trailer["#complete"], "false")
+        self.assertIn("#next_cursor", trailer)
+
+    def test_invalid_cursor(self):
+        """Test a forged cursor is rejected."""
+        response = self._export(cursor="forged.0000")
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_mcp_admin(self):
+        """Test non-admin users cannot export logs."""
+        self.admin.groups_id = [(6, 0, [self.env.ref("mcp_server.group_mcp_user").id])]
+        response = self._export()
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,82 @@
+"""Tests for the time-partitioned MCP log storage."""
+
+from datetime import datetime, timedelta
+
+from odoo.tests.common import TransactionCase
+
+from ..models.mcp_log import DEFAULT_PARTITION, PARTITION_PREFIX, STORAGE_TABLE
+
+
+class TestMCPLogPartitions(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+
+    def _partition_of(self, log):
+        self.env.flush_all()
+        self.env.cr.execute(f"SELECT tableoid::regclass::text FROM {STORAGE_TABLE} WHERE id = %s", (log.id,))
+        return self.env.cr.fetchone()[0]
+
+    def test_storage_is_partitioned(self):
+        """Test mcp_log is a view over a range-partitioned table."""
+        self.env.cr.execute(
+            "SELECT relkind FROM pg_class WHERE relname IN ('mcp_log', %s) ORDER BY relname", (STORAGE_TABLE,)
+        )
+        self.assertEqual([row[0] for row in self.env.cr.fetchall()], ["v", "p"])
+
+    def test_partitions_precreated(self):
+        """Test partitions exist for today and the following days."""
+        self.MCPLog._ensure_partitions()
+        days = {day for _name, day in self.MCPLog._list_partitions()}
+        today = self.env.cr.now().date()
+        self.assertIn(today, days)
+        self.assertIn(today + timedelta(days=1), days)
+
+    def test_new_log_routed_to_daily_partition(self):
+        """Test new rows land in the partition of the current day."""
+        self.MCPLog._ensure_partitions()
+        log = self.MCPLog.create({"event_type": "auth_success"})
+        expected = f"{PARTITION_PREFIX}{self.env.cr.now().date():%Y%m%d}"
+        self.assertEqual(self._partition_of(log), expected)
+
+    def test_partition_creation_moves_default_rows(self):
+        """Test rows written before their partition existed are moved into it."""
+        day = (datetime.now() - timedelta(days=100)).date()
+        log = self.MCPLog.create({"event_type": "error", "create_date": datetime.combine(day, datetime.min.time())})
+        self.assertEqual(self._partition_of(log), DEFAULT_PARTITION)
+
+        self.assertTrue(self.MCPLog._create_partition(day))
+        self.assertEqual(self._partition_of(log), f"{PARTITION_PREFIX}{day:%Y%m%d}")
+        self.assertTrue(log.exists())
+
+    def test_cleanup_drops_expired_partitions(self):
+        """Test retention drops partitions that only hold expired logs."""
+        day = (datetime.now() - timedelta(days=40)).date()
+        self.MCPLog._create_partition(day)
+        old_log = self.MCPLog.create({"event_type": "error", "create_date": datetime.combine(day, datetime.min.time())})
+        recent_log = self.MCPLog.create({"event_type": "error"})
+
+        self.assertEqual(self.MCPLog.cleanup_old_logs(days=30), 1)
+
+        partition_days = {partition_day for _name, partition_day in self.MCPLog._list_partitions()}
+        self.assertNotIn(day, partition_days)
+        self.assertFalse(old_log.exists())
+        self.assertTrue(recent_log.exists())
+
+    def test_cleanup_creates_partitions_without_retention(self):
+        """Test partitions are created even when retention is disabled."""
+        today = self.env.cr.now().date()
+        name = f"{PARTITION_PREFIX}{today + timedelta(days=1):%Y%m%d}"
+        if self.MCPLog._relation_exists(name):
+            self.env.cr.execute(f'ALTER TABLE {STORAGE_TABLE} DETACH PARTITION "{name}"')
+            self.env.cr.execute(f'DROP TABLE "{name}"')
+
+        self.assertEqual(self.MCPLog.cleanup_old_logs(days=0), 0)
+
+        self.assertIn(today + timedelta(days=1), {day for _name, day in self.MCPLog._list_partitions()})
+
+    def test_partition_maintenance_cron(self):
+        """Test partitions are maintained by their own cron."""
+        cron = self.env["ir.cron"].search([("name", "=", "MCP Log Partition Maintenance")])
+        self.assertEqual(len(cron), 1)
+        self.assertIn("_ensure_partitions", cron.code)
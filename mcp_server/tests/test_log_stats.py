@@ -0,0 +1,132 @@
+"""Tests for the incrementally maintained MCP activity rollups."""
+
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+from ..models.mcp_log_stats import (
+    LATENCY_COLUMNS,
+    PENDING_ROLLUPS_KEY,
+    estimate_cardinality,
+    histogram_percentile,
+    latency_column,
+    sketch_bit,
+)
+from .test_helpers import create_test_user
+
+
+class TestMCPLogStats(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.Stats = self.env["mcp.log.stats"]
+        self.test_user = create_test_user(self.env, "Stats User", "test_mcp_stats_user")
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enable_logging", "True")
+
+    def _rollup(self, model_name, operation):
+        self.Stats._flush_pending()
+        return self.Stats.search(
+            [("model_name", "=", model_name), ("operation", "=", operation), ("user_id", "=", self.test_user.id)]
+        )
+
+    def test_latency_column(self):
+        """Test durations map onto the expected histogram buckets."""
+        self.assertEqual(latency_column(0), "latency_le_5")
+        self.assertEqual(latency_column(5), "latency_le_5")
+        self.assertEqual(latency_column(6), "latency_le_10")
+        self.assertEqual(latency_column(100000), "latency_overflow")
+
+    def test_histogram_percentile(self):
+        """Test percentiles are derived from bucket counts."""
+        counts = [0] * len(LATENCY_COLUMNS)
+        counts[LATENCY_COLUMNS.index("latency_le_10")] = 90
+        counts[LATENCY_COLUMNS.index("latency_le_500")] = 10
+        self.assertEqual(histogram_percentile(counts, 50), 10)
+        self.assertEqual(histogram_percentile(counts, 95), 500)
+        self.assertIsNone(histogram_percentile([0] * len(LATENCY_COLUMNS), 50))
+
+    def test_sketch_estimate(self):
+        """Test the distinct value sketch gives sensible estimates."""
+        sketch = 0
+        for i in range(5):
+            sketch |= sketch_bit(f"10.0.0.{i}")
+        self.assertGreaterEqual(estimate_cardinality(sketch), 3)
+        self.assertLessEqual(estimate_cardinality(sketch), 7)
+        self.assertEqual(estimate_cardinality(0), 0)
+        self.assertEqual(sketch_bit(None), 0)
+
+        sketch = 0
+        for i in range(5000):
+            sketch |= sketch_bit(f"10.{i // 65536}.{i // 256 % 256}.{i % 256}")
+        self.assertAlmostEqual(estimate_cardinality(sketch), 5000, delta=250)
+
+    def test_increments_buffered_until_commit(self):
+        """Test rollup rows are only written once the buffered increments are flushed."""
+        for _i in range(2):
+            self.MCPLog.log_model_access(model_name="res.partner", operation="read", user_id=self.test_user.id)
+        self.assertFalse(self.Stats.search_count([("user_id", "=", self.test_user.id)]))
+        self.assertEqual(len(self.env.cr.postcommit.data[PENDING_ROLLUPS_KEY]), 1)
+
+        self.assertEqual(self._rollup("res.partner", "read").request_count, 2)
+        self.assertFalse(self.env.cr.postcommit.data[PENDING_ROLLUPS_KEY])
+
+    def test_rollup_updated_incrementally(self):
+        """Test log entries are folded into a single hourly rollup row."""
+        for duration, ip in ((3, "10.0.0.1"), (40, "10.0.0.2"), (700, "10.0.0.1")):
+            self.MCPLog.log_model_access(
+                model_name="res.partner",
+                operation="search_read",
+                user_id=self.test_user.id,
+                duration_ms=duration,
+                ip_address=ip,
+            )
+        self.MCPLog.log_error(
+            error_message="boom",
+            model_name="res.partner",
+            operation="search_read",
+            user_id=self.test_user.id,
+        )
+
+        rollup = self._rollup("res.partner", "search_read")
+        self.assertEqual(len(rollup), 1)
+        self.assertEqual(rollup.request_count, 4)
+        self.assertEqual(rollup.error_count, 1)
+        self.assertEqual(rollup.duration_total_ms, 743)
+        self.assertEqual(rollup.duration_max_ms, 700)
+        self.assertEqual(rollup.latency_le_5, 1)
+        self.assertEqual(rollup.latency_le_50, 1)
+        self.assertEqual(rollup.latency_le_1000, 1)
+        self.assertIn(rollup.distinct_ips, (1, 2, 3))
+
+    def test_rollup_survives_log_cleanup(self):
+        """Test rollups are independent from raw log retention."""
+        self.MCPLog.log_model_access(
+            model_name="res.partner", operation="read", user_id=self.test_user.id, duration_ms=10
+        )
+        self.env["mcp.log"].search([]).unlink()
+        self.assertEqual(self._rollup("res.partner", "read").request_count, 1)
+
+    def test_failed_rollup_keeps_log(self):
+        """Test a failing rollup update does not prevent the log entry."""
+        with patch.object(type(self.Stats), "record_event", side_effect=ValueError("boom")):
+            log = self.MCPLog.log_model_access(model_name="res.partner", operation="read", user_id=self.test_user.id)
+        self.assertTrue(log.exists())
+        self.assertTrue(self.env["mcp.log"].search_count([("id", "=", log.id)]))
+
+    def test_get_rollup(self):
+        """Test rollup aggregation across rows."""
+        self.MCPLog.log_model_access(
+            model_name="res.partner", operation="read", user_id=self.test_user.id, duration_ms=20
+        )
+        self.MCPLog.log_model_access(
+            model_name="res.partner", operation="write", user_id=self.test_user.id, duration_ms=80
+        )
+        self.Stats._flush_pending()
+
+        rows = self.Stats.get_rollup(groupby=("model_name",), domain=[("user_id", "=", self.test_user.id)])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["model_name"], "res.partner")
+        self.assertEqual(rows[0]["request_count"], 2)
+        self.assertEqual(rows[0]["distinct_users"], 1)
+        self.assertEqual(rows[0]["p95_ms"], 100)
+        self.assertEqual(rows[0]["duration_total_ms"], 100)
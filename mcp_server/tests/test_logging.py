@@ -125,7 +125,7 @@ class TestMCPLogging(TransactionCase):
 
     def test_data_truncation(self):
         """Test that large data fields are truncated."""
-        large_data = "x" * 15000  # Larger than max_text_length (10000)
+        large_data = "x" * 150000  # Larger than the compressed payload limit (100000)
 
         log = self.MCPLog.log_event(
             "error", error_message=large_data, request_data=large_data, response_data=large_data, user_agent=large_data
@@ -135,7 +135,21 @@ class TestMCPLogging(TransactionCase):
         self.assertTrue(log.request_data.endswith("... [truncated]"))
         self.assertTrue(log.response_data.endswith("... [truncated]"))
         self.assertTrue(log.user_agent.endswith("... [truncated]"))
-        self.assertLessEqual(len(log.error_message), 10020)  # 10000 + '... [truncated]'
+        self.assertLessEqual(len(log.error_message), 100020)  # 100000 + '... [truncated]'
+        self.assertLessEqual(len(log.user_agent), 10020)  # Not compressed, keeps the 10000 limit
+
+    def test_payload_fields_stored_compressed(self):
+        """Test that payload fields are compressed in storage and read back transparently."""
+        payload = '{"domain": [["active", "=", true]]}' * 500
+        log = self.MCPLog.log_event("model_access", request_data=payload, error_message="short")
+
+        self.env.flush_all()
+        self.env.cr.execute("SELECT octet_length(request_data) FROM mcp_log_data WHERE id = %s", (log.id,))
+        self.assertLess(self.env.cr.fetchone()[0], len(payload) / 10)
+
+        log.invalidate_recordset()
+        self.assertEqual(log.request_data, payload)
+        self.assertEqual(log.error_message, "short")
 
     def test_cleanup_old_logs(self):
         """Test cleanup of old log entries."""
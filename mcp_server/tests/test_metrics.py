@@ -0,0 +1,106 @@
+"""Tests for the in-process metrics and the /mcp/metrics endpoint."""
+
+import threading
+from datetime import datetime, timedelta
+
+from odoo.tests import common
+
+from ..controllers import metrics, utils
+from .test_helpers import create_test_user
+
+
+class TestMetricsCollection(common.BaseCase):
+    def setUp(self):
+        super().setUp()
+        metrics.reset()
+
+    def test_observe_request_histogram(self):
+        """Test requests are counted and bucketed cumulatively."""
+        metrics.observe_request("/mcp/xmlrpc/object", "res.partner", "read", 3, "200")
+        metrics.observe_request("/mcp/xmlrpc/object", "res.partner", "read", 40, "200")
+        metrics.observe_request("/mcp/xmlrpc/object", "res.partner", "read", 9000, "403")
+
+        text = metrics.render(metrics.snapshot())
+        labels = 'endpoint="/mcp/xmlrpc/object",model="res.partner",method="read"'
+        self.assertIn(f'mcp_requests_total{{{labels},status="200"}} 2', text)
+        self.assertIn(f'mcp_requests_total{{{labels},status="403"}} 1', text)
+        self.assertIn(f'mcp_request_duration_ms_bucket{{{labels},le="5"}} 1', text)
+        self.assertIn(f'mcp_request_duration_ms_bucket{{{labels},le="50"}} 2', text)
+        self.assertIn(f'mcp_request_duration_ms_bucket{{{labels},le="+Inf"}} 3', text)
+        self.assertIn(f"mcp_request_duration_ms_sum{{{labels}}} 9043", text)
+        self.assertIn(f"mcp_request_duration_ms_count{{{labels}}} 3", text)
+
+    def test_cache_hit_ratio(self):
+        """Test hit ratios are derived from hit and miss counters."""
+        metrics.inc("mcp_acl_cache_hits_total", value=3)
+        metrics.inc("mcp_acl_cache_misses_total")
+        text = metrics.render(metrics.snapshot())
+        self.assertIn("mcp_acl_cache_hit_ratio 0.75", text)
+        self.assertIn("# TYPE mcp_log_queue_depth gauge", text)
+
+    def test_label_values_are_escaped(self):
+        """Test client-supplied label values cannot break the exposition format."""
+        metrics.observe_request("/mcp/xmlrpc/object", 'bad"model\n', "read", 1, "400")
+        text = metrics.render(metrics.snapshot())
+        self.assertIn('model="bad\\"model\\n"', text)
+
+    def test_series_overflow(self):
+        """Test the number of label combinations per thread is bounded."""
+        for index in range(metrics.MAX_SERIES_PER_SHARD + 5):
+            metrics.observe_request("/mcp/xmlrpc/object", f"model.{index}", "read", 1, "200")
+        histograms = metrics.snapshot()["histograms"]
+        self.assertEqual(len(histograms), metrics.MAX_SERIES_PER_SHARD + 1)
+        overflow = ("/mcp/xmlrpc/object", metrics.OVERFLOW_LABEL, metrics.OVERFLOW_LABEL)
+        self.assertEqual(histograms[overflow][-1], 5)
+
+    def test_finished_threads_are_retired(self):
+        """Test shards of exited threads are folded together and their counts kept."""
+
+        def request_thread():
+            metrics.observe_request("/mcp/health", None, None, 1, "200")
+
+        for _index in range(5):
+            thread = threading.Thread(target=request_thread)
+            thread.start()
+            thread.join()
+
+        data = metrics.snapshot()
+        self.assertEqual(data["counters"][("mcp_requests_total", ("/mcp/health", "", "", "200"))], 5)
+        self.assertFalse([thread for thread, _shard in metrics._shards if not thread.is_alive()])
+
+
+class TestMetricsEndpoint(common.HttpCase):
+    def setUp(self):
+        super().setUp()
+        utils.clear_mcp_caches()
+        metrics.reset()
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.use_api_keys", "True")
+        self.admin = create_test_user(
+            self.env,
+            "MCP Metrics Admin",
+            "mcp_metrics_admin",
+            groups_id=[(6, 0, [self.env.ref("mcp_server.group_mcp_admin").id])],
+        )
+        self.api_key = self.env(user=self.admin)["res.users.apikeys"]._generate(
+            "rpc", "Metrics Key", datetime.now() + timedelta(days=1)
+        )
+
+    def test_metrics_endpoint(self):
+        """Test metrics are exposed in Prometheus text format and reflect requests."""
+        headers = {"X-API-Key": self.api_key}
+        self.url_open("/mcp/health")
+        response = self.url_open("/mcp/metrics", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/plain", response.headers["Content-Type"])
+        self.assertIn('mcp_requests_total{endpoint="/mcp/health",model="",method="",status="200"} 1', response.text)
+
+        response = self.url_open("/mcp/metrics?aggregate=1", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('mcp_requests_total{endpoint="/mcp/metrics",model="",method="",status="200"}', response.text)
+
+    def test_metrics_requires_admin(self):
+        """Test non-admin users cannot read metrics."""
+        self.admin.groups_id = [(6, 0, [self.env.ref("mcp_server.group_mcp_user").id])]
+        response = self.url_open("/mcp/metrics", headers={"X-API-Key": self.api_key})
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,83 @@
+"""Tests for the MessagePack object endpoint."""
+
+import unittest
+from datetime import date, datetime
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import msgpack_rpc
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+msgpack = msgpack_rpc.msgpack
+
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+class TestMsgpackEncoding(TransactionCase):
+    def test_date_extension_types(self):
+        """Test dates and datetimes round-trip through their extension types."""
+        value = {"when": datetime(2024, 3, 1, 12, 30, 5), "day": date(2024, 3, 1)}
+        packed = msgpack_rpc.dumps(msgpack_rpc.result(value))
+        raw = msgpack.unpackb(packed, raw=False)
+        self.assertEqual(raw["result"]["when"], msgpack.ExtType(msgpack_rpc.EXT_DATETIME, b"2024-03-01 12:30:05"))
+        self.assertEqual(raw["result"]["day"], msgpack.ExtType(msgpack_rpc.EXT_DATE, b"2024-03-01"))
+        self.assertEqual(msgpack_rpc.loads(packed), {"result": value})
+
+    def test_streamed_result_is_one_document(self):
+        """Test the streamed chunks form a single response document."""
+        rows = [{"id": index, "name": f"Partner {index}", "date": date(2024, 1, 2)} for index in range(500)]
+        chunks = list(msgpack_rpc.stream_result(rows, chunk_size=1024))
+        self.assertGreater(len(chunks), 5)
+        self.assertEqual(b"".join(chunks), msgpack_rpc.dumps(msgpack_rpc.result(rows)))
+
+    def test_parse_call(self):
+        """Test requests are accepted as an array or a map of execute_kw parameters."""
+        params = ["db", 2, "key", "res.partner", "search_count", [[]], {}]
+        self.assertEqual(msgpack_rpc.parse_call(params), params)
+        named = {"db": "db", "uid": 2, "password": "key", "model": "res.partner", "method": "search_count"}
+        self.assertEqual(msgpack_rpc.parse_call(named), ["db", 2, "key", "res.partner", "search_count", [], {}])
+        with self.assertRaises(ValueError):
+            msgpack_rpc.parse_call("execute_kw")
+        with self.assertRaises(ValueError):
+            msgpack_rpc.loads(b"\x93\x01")
+
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+@tagged("post_install", "-at_install")
+class TestMsgpackEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env, disabled_models=["res.users"])
+        self.user, self.api_key = create_api_key_user(self.env, "MCP MessagePack User", "mcp_msgpack_user")
+
+    def _post(self, model, method, *args, **kwargs):
+        body = msgpack.packb([self.env.cr.dbname, self.user.id, self.api_key, model, method, list(args), kwargs])
+        response = self.url_open(
+            "/mcp/msgpack/object", data=body, headers={"Content-Type": msgpack_rpc.CONTENT_TYPE}
+        )
+        self.assertEqual(response.headers["Content-Type"], msgpack_rpc.CONTENT_TYPE)
+        return response, msgpack_rpc.loads(response.content)
+
+    def test_search_read(self):
+        """Test results are returned with datetimes as extension types."""
+        response, body = self._post("res.partner", "search_read", [], fields=["name", "write_date"], limit=2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(body["result"]), 2)
+        self.assertIsInstance(body["result"][0]["write_date"], datetime)
+
+    def test_streamed_result(self):
+        """Test results over the streaming threshold are sent in chunks."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_stream_min_rows", "1")
+        response, body = self._post("res.partner", "search_read", [], fields=["name"], limit=3)
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(len(body["result"]), 3)
+
+    def test_errors(self):
+        """Test MCP and request errors are returned with their code as HTTP status."""
+        response, body = self._post("res.users", "search_count", [])
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(body["error"]["code"], 403)
+
+        response = self.url_open(
+            "/mcp/msgpack/object", data=b"\xc1", headers={"Content-Type": msgpack_rpc.CONTENT_TYPE}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,77 @@
+"""Tests for opt-in request profiling through the X-MCP-Profile header."""
+
+import threading
+import xmlrpc.client as xmlrpclib
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from odoo.tests.common import HttpCase, tagged
+
+from ..controllers import profiling, utils
+from .test_helpers import create_test_user
+
+
+@tagged("post_install", "-at_install")
+class TestRequestProfiling(HttpCase):
+    def setUp(self):
+        super().setUp()
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+        utils.clear_mcp_caches()
+
+        partner_model = self.env.ref("base.model_res_partner")
+        enabled = self.env["mcp.enabled.model"].sudo().search([("model_id", "=", partner_model.id)], limit=1)
+        if enabled:
+            enabled.write({"allow_read": True, "active": True})
+        else:
+            self.env["mcp.enabled.model"].sudo().create({"model_id": partner_model.id, "allow_read": True})
+
+        self.admin = create_test_user(
+            self.env,
+            "MCP Profile Admin",
+            "mcp_profile_admin",
+            groups_id=[
+                (6, 0, [self.env.ref("mcp_server.group_mcp_admin").id, self.env.ref("base.group_user").id])
+            ],
+        )
+        self.api_key = self.env(user=self.admin)["res.users.apikeys"]._generate(
+            "rpc", "Profile Key", datetime.now() + timedelta(days=1)
+        )
+
+    def _search_read(self, profile="1"):
+        params = (self.env.cr.dbname, self.admin.id, self.api_key, "res.partner", "search_read", [[]], {"limit": 5})
+        return self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps(params, "execute_kw", allow_none=1),
+            headers={"Content-Type": "text/xml", profiling.PROFILE_HEADER: profile},
+        )
+
+    def test_profile_stored_as_attachment(self):
+        """Test a profiled request stores its profile as a JSON attachment."""
+        response = self._search_read()
+        self.assertEqual(response.status_code, 200)
+        attachment_id = response.headers.get(profiling.PROFILE_RESULT_HEADER)
+        self.assertTrue(attachment_id and attachment_id.isdigit())
+        attachment = self.env["ir.attachment"].browse(int(attachment_id))
+        self.assertEqual(attachment.res_model, "mcp.log")
+        self.assertEqual(attachment.mimetype, "application/json")
+        self.assertIn(b"sql", attachment.raw)
+
+    def test_profile_requires_admin(self):
+        """Test non-admin users are not profiled."""
+        self.admin.groups_id = [(6, 0, [self.env.ref("base.group_user").id])]
+        response = self._search_read()
+        self.assertEqual(response.headers.get(profiling.PROFILE_RESULT_HEADER), "denied")
+
+    def test_profile_concurrency_cap(self):
+        """Test requests over the concurrency cap run unprofiled instead of waiting."""
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        with patch.object(profiling, "_profile_slots", slots):
+            response = self._search_read()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get(profiling.PROFILE_RESULT_HEADER), "busy")
+
+    def test_no_header_no_profile(self):
+        """Test requests without the header are not profiled."""
+        response = self._search_read(profile="0")
+        self.assertNotIn(profiling.PROFILE_RESULT_HEADER, response.headers)
@@ -0,0 +1,106 @@
+"""Tests for the streaming NDJSON record export."""
+
+import json
+from unittest.mock import patch
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import record_export
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestRecordExportCursor(TransactionCase):
+    def test_cursor_roundtrip(self):
+        """Test export cursors are signed and bound to their model."""
+        token = record_export.encode_export_cursor(self.env, "res.partner", 42)
+        self.assertEqual(record_export.decode_export_cursor(self.env, "res.partner", token), 42)
+        with self.assertRaises(ValueError):
+            record_export.decode_export_cursor(self.env, "res.users", token)
+        with self.assertRaises(ValueError):
+            record_export.decode_export_cursor(self.env, "res.partner", "tampered.cursor")
+
+
+@tagged("post_install", "-at_install")
+class TestRecordExportEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env)
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Record Export User", "mcp_record_export_user")
+        self.partners = self.env["res.partner"].create([{"name": f"Export Partner {index}"} for index in range(5)])
+        self.domain = [("name", "like", "Export Partner")]
+
+    def _export(self, model="res.partner", **body):
+        body.setdefault("domain", self.domain)
+        body.setdefault("fields", ["name"])
+        return self.url_open(
+            f"/mcp/models/{model}/export",
+            data=json.dumps(body),
+            headers={"X-API-Key": self.api_key, "Content-Type": "application/json"},
+        )
+
+    def _lines(self, response):
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        return lines, lines.pop()
+
+    def test_export_in_chunks(self):
+        """Test every matching record is exported in id order across cursor chunks."""
+        with patch.object(record_export, "EXPORT_CHUNK_SIZE", 2):
+            response = self._export()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers["Content-Type"])
+        rows, trailer = self._lines(response)
+        self.assertEqual([row["id"] for row in rows], self.partners.sorted("id").ids)
+        self.assertEqual(set(rows[0]), {"id", "name"})
+        self.assertEqual(trailer["rows"], 5)
+        self.assertTrue(trailer["complete"])
+
+    def test_resume(self):
+        """Test an export resumes after the trailer cursor or a given id."""
+        ids = self.partners.sorted("id").ids
+        rows, trailer = self._lines(self._export(limit=2))
+        self.assertEqual([row["id"] for row in rows], ids[:2])
+        self.assertFalse(trailer["complete"])
+
+        rows, trailer = self._lines(self._export(cursor=trailer["next_cursor"]))
+        self.assertEqual([row["id"] for row in rows], ids[2:])
+        self.assertTrue(trailer["complete"])
+
+        rows, _trailer = self._lines(self._export(after_id=ids[3]))
+        self.assertEqual([row["id"] for row in rows], ids[4:])
+
+    def test_limit_reaching_the_end(self):
+        """Test an export whose limit matches the remaining records is reported complete."""
+        rows, trailer = self._lines(self._export(limit=5))
+        self.assertEqual(len(rows), 5)
+        self.assertTrue(trailer["complete"])
+        with patch.object(record_export, "EXPORT_CHUNK_SIZE", 2):
+            rows, trailer = self._lines(self._export(limit=4))
+        self.assertEqual(len(rows), 4)
+        self.assertFalse(trailer["complete"])
+
+    def test_interrupted_export(self):
+        """Test a failure while reading records ends the stream with a resumable trailer."""
+        with patch.object(type(self.env["res.partner"]), "read", side_effect=ValueError("boom")):
+            rows, trailer = self._lines(self._export())
+        self.assertFalse(rows)
+        self.assertEqual(trailer["error"], "Export interrupted")
+        self.assertFalse(trailer["complete"])
+        self.assertEqual(record_export.decode_export_cursor(self.env, "res.partner", trailer["next_cursor"]), 0)
+
+    def test_invalid_requests(self):
+        """Test unknown fields, bad domains and cursors of another model are rejected."""
+        cursor = record_export.encode_export_cursor(self.env, "res.users", 0)
+        invalid = [
+            {"fields": ["no_such_field"]},
+            {"fields": []},
+            {"domain": "not a domain"},
+            {"cursor": cursor},
+        ]
+        for body in invalid:
+            with self.subTest(body=body):
+                self.assertEqual(self._export(**body).status_code, 400)
+
+    def test_model_not_enabled(self):
+        """Test models not enabled for MCP cannot be exported."""
+        response = self._export(model="res.country", domain=[], fields=["name"])
+        self.assertEqual(response.status_code, 403)
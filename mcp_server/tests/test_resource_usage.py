@@ -0,0 +1,60 @@
+"""Tests for per-request resource accounting."""
+
+import threading
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+from ..controllers import resource_usage
+
+
+class TestResourceUsage(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.MCPLog = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enable_logging", "True")
+
+    def test_count_rows(self):
+        """Test rows are counted from lists and single record dicts only."""
+        self.assertEqual(resource_usage.count_rows([{"id": 1}, {"id": 2}]), 2)
+        self.assertEqual(resource_usage.count_rows({"id": 1}), 1)
+        self.assertEqual(resource_usage.count_rows(42), 0)
+        self.assertEqual(resource_usage.count_rows(True), 0)
+
+    def test_measure_sql_counters(self):
+        """Test SQL queries and time are the delta of the thread's cursor counters."""
+        thread = threading.current_thread()
+        with patch.object(thread, "query_count", 10, create=True), patch.object(
+            thread, "query_time", 0.5, create=True
+        ):
+            with resource_usage.measure(self.env) as usage:
+                thread.query_count += 3
+                thread.query_time += 0.025
+        self.assertEqual(usage.sql_count, 3)
+        self.assertAlmostEqual(usage.sql_time_ms, 25.0)
+        self.assertIsNone(usage.peak_memory_kb)
+
+    def test_measure_sampled_memory(self):
+        """Test peak memory is measured when the request is sampled."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.memory_sample_rate", "1")
+        with resource_usage.measure(self.env) as usage:
+            payload = [bytearray(1024) for _index in range(512)]
+        del payload
+        self.assertGreaterEqual(usage.peak_memory_kb, 512)
+
+    def test_log_model_access_stores_usage(self):
+        """Test resource usage values are stored on the log entry."""
+        log = self.MCPLog.log_model_access(
+            model_name="res.partner",
+            operation="search_read",
+            sql_count=4,
+            sql_time_ms=1.25,
+            rows_returned=80,
+            response_bytes=20480,
+            peak_memory_kb=312,
+        )
+        self.assertEqual(log.sql_count, 4)
+        self.assertEqual(log.sql_time_ms, 1.25)
+        self.assertEqual(log.rows_returned, 80)
+        self.assertEqual(log.response_bytes, 20480)
+        self.assertEqual(log.peak_memory_kb, 312)
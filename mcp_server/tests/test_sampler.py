@@ -0,0 +1,74 @@
+"""Tests for the continuous sampling profiler."""
+
+import sys
+import threading
+import time
+
+from odoo.tests import common
+
+from ..controllers import sampler, tracing
+
+
+class TestSampler(common.BaseCase):
+    def setUp(self):
+        super().setUp()
+        sampler._window.clear()
+        self.addCleanup(sampler._window.clear)
+
+    def test_fold_stack_is_root_first(self):
+        """Test folded stacks start with the request tag and end with the innermost frame."""
+
+        def innermost():
+            return sampler.fold_stack(sys._getframe(), "/mcp/test res.partner read")
+
+        frames = innermost().split(";")
+        self.assertEqual(frames[0], "/mcp/test res.partner read")
+        self.assertTrue(frames[-1].endswith(":innermost"))
+        self.assertIn(f"{__name__}:test_fold_stack_is_root_first", frames)
+
+    def test_sample_registered_thread(self):
+        """Test only threads serving an MCP request are sampled, tagged with model and method."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def serve():
+            trace = tracing.Trace("/mcp/xmlrpc/object")
+            trace.attributes.update(model="res.partner", method="search_read")
+            sampler.register(trace)
+            started.set()
+            release.wait(5)
+            sampler.unregister()
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        try:
+            started.wait(5)
+            self.assertEqual(sampler.sample_once(), 1)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(sampler.sample_once(), 0)
+
+        stacks = sampler.folded_stacks()
+        self.assertEqual(sum(stacks.values()), 1)
+        self.assertTrue(next(iter(stacks)).startswith("/mcp/xmlrpc/object res.partner search_read;"))
+
+    def test_folded_stacks_prefix_and_render(self):
+        """Test stacks are filtered by endpoint prefix and rendered as flame graph input."""
+        stacks = sampler._current_slice()
+        stacks["/mcp/models;odoo.http:dispatch"] = 3
+        stacks["/mcp/xmlrpc/object res.partner read;odoo.http:dispatch"] = 5
+
+        filtered = sampler.folded_stacks(minutes=1, prefix="/mcp/xmlrpc")
+        self.assertEqual(list(filtered), ["/mcp/xmlrpc/object res.partner read;odoo.http:dispatch"])
+        self.assertEqual(
+            sampler.render_folded(sampler.folded_stacks()),
+            "/mcp/xmlrpc/object res.partner read;odoo.http:dispatch 5\n/mcp/models;odoo.http:dispatch 3\n",
+        )
+        self.assertEqual(sampler.render_folded({}), "")
+
+    def test_folded_stacks_skip_expired_slices(self):
+        """Test slices older than the window are ignored even when no newer slice replaced them."""
+        expired_start = int(time.time()) - (sampler.WINDOW_SLICES + 2) * sampler.WINDOW_SLICE_SECONDS
+        sampler._window.append((expired_start, {"/mcp/models;odoo.http:dispatch": 4}))
+        self.assertEqual(sampler.folded_stacks(), {})
@@ -0,0 +1,86 @@
+"""Tests for the slow request journal."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+from ..controllers import slow_requests
+
+
+class TestSlowRequests(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.SlowRequest = self.env["mcp.slow.request"]
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.slow_request_threshold_ms", "1")
+
+    def test_describe_call(self):
+        """Test domain, fields and limit are taken from positional and keyword arguments."""
+        description = slow_requests.describe_call("search_read", [[("name", "ilike", "a")], ["name"]], {"limit": 80})
+        self.assertEqual(description["domain"], '[["name", "ilike", "a"]]')
+        self.assertEqual(description["requested_fields"], '["name"]')
+        self.assertEqual(description["query_limit"], 80)
+        self.assertEqual(
+            slow_requests.describe_call("read", [[1, 2], ["email"]], {}), {"requested_fields": '["email"]'}
+        )
+        self.assertEqual(slow_requests.describe_call("unlink", [[1]], {}), {})
+
+    def test_capture_overdue_takes_running_stack(self):
+        """Test the watchdog snapshots the stack of a request past its deadline."""
+        started = threading.Event()
+        release = threading.Event()
+        watch = slow_requests._Watch(time.monotonic())
+
+        def slow_call():
+            slow_requests._watches[threading.get_ident()] = watch
+            started.set()
+            release.wait(5)
+            slow_requests._watches.pop(threading.get_ident(), None)
+
+        thread = threading.Thread(target=slow_call)
+        thread.start()
+        try:
+            started.wait(5)
+            self.assertEqual(slow_requests.capture_overdue(), 1)
+            # Captured once only
+            self.assertEqual(slow_requests.capture_overdue(), 0)
+        finally:
+            release.set()
+            thread.join()
+        self.assertIn("in slow_call", watch.stack)
+
+    def test_watch_journals_slow_call(self):
+        """Test a call over the threshold is journaled with its SQL statements."""
+        with patch.object(slow_requests, "_record") as record:
+            with slow_requests.watch(
+                self.env, "/mcp/xmlrpc/object", "res.partner", "search_read", [[]], {"fields": ["name"]}
+            ):
+                self.env.cr.execute("SELECT pg_sleep(0.01)")
+        values = record.call_args[0][1]
+        self.assertEqual(values["model_name"], "res.partner")
+        self.assertGreaterEqual(values["duration_ms"], 1)
+        self.assertGreaterEqual(values["sql_count"], 1)
+        self.assertIn("pg_sleep", values["sql_statements"])
+        self.assertEqual(values["requested_fields"], '["name"]')
+
+    def test_watch_skips_fast_call_and_disabled(self):
+        """Test nothing is journaled under the threshold or when detection is disabled."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.slow_request_threshold_ms", "60000")
+        with patch.object(slow_requests, "_record") as record:
+            with slow_requests.watch(self.env, "/mcp/xmlrpc/object", "res.partner", "read", [[1]], {}):
+                pass
+            self.env["ir.config_parameter"].sudo().set_param("mcp_server.slow_request_threshold_ms", "0")
+            with slow_requests.watch(self.env, "/mcp/xmlrpc/object", "res.partner", "read", [[1]], {}):
+                time.sleep(0.01)
+        record.assert_not_called()
+
+    def test_journal_is_bounded(self):
+        """Test only the most recent entries are kept."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.slow_request_journal_size", "3")
+        entries = [
+            self.SlowRequest.record({"model_name": "res.partner", "operation": f"op{index}", "duration_ms": 1500})
+            for index in range(5)
+        ]
+        remaining = self.SlowRequest.search([("id", "in", [entry.id for entry in entries])])
+        self.assertEqual(remaining.mapped("operation"), ["op4", "op3", "op2"])
@@ -0,0 +1,73 @@
+"""Tests for request span recording and export."""
+
+import json
+import os
+import tempfile
+
+from odoo.tests import common
+
+from ..controllers import tracing, utils
+
+
+class TestTracing(common.BaseCase):
+    def _traced(self, func):
+        return tracing.trace_request("/test")(func)()
+
+    def test_span_without_trace_is_noop(self):
+        """Test spans outside a traced request record nothing."""
+        with tracing.span("auth"):
+            pass
+        self.assertIsNone(tracing.current_trace())
+
+    def test_server_timing_sums_stages(self):
+        """Test repeated stages are summed in the Server-Timing value."""
+        recorded = {}
+
+        def handler():
+            with tracing.span("log_write"):
+                pass
+            with tracing.span("dispatch"):
+                pass
+            with tracing.span("log_write"):
+                pass
+            recorded["trace"] = tracing.current_trace()
+            return None
+
+        self._traced(handler)
+        trace = recorded["trace"]
+        self.assertEqual([span[0] for span in trace.spans], ["log_write", "dispatch", "log_write"])
+        names = [part.split(";")[0] for part in trace.server_timing().split(", ")]
+        self.assertEqual(names, ["log_write", "dispatch", "total"])
+        self.assertIsNone(tracing.current_trace())
+
+    def test_file_export(self):
+        """Test traces are exported as one OTLP span per line."""
+        recorded = {}
+
+        def handler():
+            tracing.annotate(model="res.partner", method="read")
+            with tracing.span("acl"):
+                pass
+            recorded["trace"] = tracing.current_trace()
+
+        self._traced(handler)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            tracing.export_file(path, [recorded["trace"]])
+            with open(path) as trace_file:
+                spans = [json.loads(line) for line in trace_file]
+
+        root, acl = spans
+        self.assertEqual(root["name"], "/test")
+        self.assertEqual(acl["parentSpanId"], root["spanId"])
+        self.assertEqual(acl["traceId"], root["traceId"])
+        self.assertIn({"key": "model", "value": {"stringValue": "res.partner"}}, root["attributes"])
+
+
+class TestServerTimingHeader(common.HttpCase):
+    def test_health_has_server_timing(self):
+        """Test endpoints return a Server-Timing header."""
+        utils.clear_mcp_caches()
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.enabled", "True")
+        response = self.url_open("/mcp/health")
+        self.assertIn("total;dur=", response.headers.get("Server-Timing", ""))
@@ -0,0 +1,135 @@
+"""Tests for field-level auditing of MCP write calls."""
+
+import json
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+from ..controllers import log_queue, write_audit
+from .test_helpers import create_test_user
+
+
+class TestWriteAudit(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = self.env["res.partner"].create({"name": "Audit Partner", "city": "Brussels"})
+
+    def test_parse_call(self):
+        """Test ids and values are extracted from execute_kw arguments."""
+        self.assertEqual(
+            write_audit.parse_call("write", [[self.partner.id], {"city": "Ghent"}], {}),
+            {"ids": [self.partner.id], "vals_list": [{"city": "Ghent"}]},
+        )
+        self.assertEqual(write_audit.parse_call("unlink", [self.partner.id], {})["ids"], [self.partner.id])
+        self.assertEqual(write_audit.parse_call("create", [{"name": "X"}], {})["vals_list"], [{"name": "X"}])
+        self.assertIsNone(write_audit.parse_call("read", [[self.partner.id]], {}))
+        self.assertIsNone(write_audit.parse_call("write", [["bad"], {}], {}))
+
+    def test_write_diff_only_contains_changes(self):
+        """Test unchanged fields are left out of the diff."""
+        call = write_audit.parse_call("write", [[self.partner.id], {"city": "Ghent", "name": "Audit Partner"}], {})
+        old_values = write_audit.prefetch_old_values(self.env, "res.partner", "write", call)
+        self.partner.write(call["vals_list"][0])
+        diff = write_audit.compute_diff(self.env, "res.partner", "write", call, old_values, True)
+        self.assertEqual(diff, {str(self.partner.id): {"city": ["Brussels", "Ghent"]}})
+
+    def test_write_diff_many2one(self):
+        """Test many2one values are compared by id."""
+        country = self.env.ref("base.be")
+        call = write_audit.parse_call("write", [[self.partner.id], {"country_id": country.id}], {})
+        old_values = write_audit.prefetch_old_values(self.env, "res.partner", "write", call)
+        diff = write_audit.compute_diff(self.env, "res.partner", "write", call, old_values, True)
+        self.assertEqual(diff[str(self.partner.id)]["country_id"], [False, country.id])
+
+    def test_unlink_and_create_diff(self):
+        """Test unlink keeps the old values and create the new ones."""
+        call = write_audit.parse_call("unlink", [[self.partner.id]], {})
+        old_values = write_audit.prefetch_old_values(self.env, "res.partner", "unlink", call)
+        diff = write_audit.compute_diff(self.env, "res.partner", "unlink", call, old_values, True)
+        self.assertEqual(diff[str(self.partner.id)]["city"], ["Brussels", False])
+        self.assertNotIn("write_date", diff[str(self.partner.id)])
+
+        call = write_audit.parse_call("create", [[{"name": "A"}, {"name": "B"}]], {})
+        diff = write_audit.compute_diff(self.env, "res.partner", "create", call, {}, [11, 12])
+        self.assertEqual(diff, {"11": {"name": [False, "A"]}, "12": {"name": [False, "B"]}})
+
+    def test_secrets_not_audited(self):
+        """Test passwords and other non-stored or inverse fields are left out of the diff."""
+        vals = {"name": "Audit User", "login": "audit_user", "password": "s3cret"}
+        call = write_audit.parse_call("create", [vals], {})
+        diff = write_audit.compute_diff(self.env, "res.users", "create", call, {}, [11])
+        self.assertIn("login", diff["11"])
+        self.assertNotIn("password", diff["11"])
+
+        user = create_test_user(self.env, "Audit Target", "audit_target_user")
+        call = write_audit.parse_call("write", [[user.id], {"password": "n3w", "new_password": "n3w"}], {})
+        self.assertEqual(write_audit.prefetch_old_values(self.env, "res.users", "write", call), {})
+
+    def test_restricted_fields_not_audited(self):
+        """Test fields restricted to groups the caller does not have are never read nor logged."""
+        user = create_test_user(
+            self.env, "Audit Caller", "audit_caller_user", groups_id=[(6, 0, [self.env.ref("base.group_user").id])]
+        )
+        user_env = self.env(user=user)
+        for model_name in ("res.partner", "res.users"):
+            model = user_env[model_name]
+            for name in write_audit._audited_fields(model):
+                field = model._fields[name]
+                self.assertTrue(field.store and not field.inverse, f"{model_name}.{name}")
+                self.assertTrue(not field.groups or user.has_groups(field.groups), f"{model_name}.{name}")
+
+        call = write_audit.parse_call("unlink", [[self.partner.id]], {})
+        old_values = write_audit.prefetch_old_values(user_env, "res.partner", "unlink", call)
+        self.assertEqual(old_values[self.partner.id]["city"], "Brussels")
+
+    def test_submit_writes_log_in_test_mode(self):
+        """Test audit entries are written with their diff."""
+        env = self.env(context=dict(self.env.context, test_mcp_logging=True))
+        log_queue.submit(
+            env,
+            "write_operation",
+            model_name="res.partner",
+            operation="write",
+            record_ids=str(self.partner.id),
+            diff_data=json.dumps({str(self.partner.id): {"city": ["Brussels", "Ghent"]}}),
+        )
+        log = self.env["mcp.log"].search([("event_type", "=", "write_operation")], limit=1)
+        self.assertEqual(log.model_name, "res.partner")
+        self.assertEqual(json.loads(log.diff_data)[str(self.partner.id)]["city"], ["Brussels", "Ghent"])
+
+    def test_enqueue_drops_when_full(self):
+        """Test the background queue drops entries instead of blocking when full."""
+        stats = log_queue.get_queue_stats()
+        original_queue = log_queue._queue
+        log_queue._queue = log_queue.queue.Queue(maxsize=1)
+        try:
+            log_queue._queue.put_nowait(("db", "write_operation", {}))
+            self.assertFalse(log_queue.enqueue("db", "write_operation", {}))
+        finally:
+            log_queue._queue = original_queue
+        self.assertEqual(log_queue.get_queue_stats()["dropped"], stats["dropped"] + 1)
+
+    def test_write_batch_isolates_failed_entries(self):
+        """Test a failing entry neither aborts nor is counted with the rest of its batch."""
+
+        def log_event(log_model, event_type, **values):
+            log_model.env.cr.execute("SELECT no_such_column FROM mcp_log" if values.get("bad") else "SELECT 1")
+
+        stats = log_queue.get_queue_stats()
+        with (
+            patch.object(log_queue, "Registry") as registry,
+            patch.object(type(self.env["mcp.log"]), "log_event", log_event),
+        ):
+            registry.return_value.cursor.return_value = nullcontext(self.env.cr)
+            log_queue._write_batch(self.env.cr.dbname, [("error", {}), ("error", {"bad": True}), ("error", {})])
+        self.assertEqual(log_queue.get_queue_stats()["written"], stats["written"] + 2)
+        self.assertEqual(log_queue.get_queue_stats()["failed"], stats["failed"] + 1)
+
+    def test_failed_log_keeps_transaction(self):
+        """Test a log entry that cannot be inserted leaves the caller's transaction usable."""
+        log_model = self.env["mcp.log"].with_context(test_mcp_logging=True)
+        self.assertFalse(log_model.log_event("error", user_id=2147483647))
+        self.assertTrue(self.partner.exists())
+        with self.assertRaises(Exception):
+            log_model.with_context(mcp_log_raise_errors=True).log_event("error", user_id=2147483647)
@@ -0,0 +1,145 @@
+"""Tests for streaming XML-RPC responses and incremental request parsing."""
+
+import io
+import xmlrpc.client as xmlrpclib
+from datetime import date
+from xml.parsers.expat import ExpatError
+
+from odoo.tests.common import HttpCase, TransactionCase, tagged
+
+from ..controllers import xmlrpc_stream
+from ..controllers.xmlrpc import odoo_dumps
+from .test_helpers import create_api_key_user, enable_model_for_mcp
+
+
+class TestXmlRpcStreamEncoding(TransactionCase):
+    def _rows(self, count):
+        return [
+            {"id": index, "name": f"Partner <{index}> & co", "date": date(2024, 1, 2), "tags": [1, 2]}
+            for index in range(count)
+        ]
+
+    def test_same_output_as_odoo_dumps(self):
+        """Test the chunks join to the document odoo_dumps builds."""
+        for rows in (self._rows(50), []):
+            with self.subTest(rows=len(rows)):
+                streamed = b"".join(xmlrpc_stream.iter_response(rows, chunk_size=256))
+                self.assertEqual(streamed, odoo_dumps((rows,)).encode())
+
+    def test_chunk_size(self):
+        """Test the response is split into chunks of about the requested size."""
+        chunks = list(xmlrpc_stream.iter_response(self._rows(200), chunk_size=1024))
+        self.assertGreater(len(chunks), 10)
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), 1024)
+            self.assertLess(len(chunk), 2048)
+
+    def test_stream_response_fails_early(self):
+        """Test a value the marshaller cannot encode in the first rows raises before sending."""
+        with self.assertRaises(TypeError):
+            xmlrpc_stream.stream_response([{"id": 1, "value": object()}])
+
+    def test_should_stream(self):
+        """Test only array results over the threshold are streamed."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_stream_min_rows", "10")
+        self.assertTrue(xmlrpc_stream.should_stream(self.env, self._rows(10)))
+        self.assertFalse(xmlrpc_stream.should_stream(self.env, self._rows(9)))
+        self.assertFalse(xmlrpc_stream.should_stream(self.env, {"id": 1}))
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_stream_min_rows", "0")
+        self.assertFalse(xmlrpc_stream.should_stream(self.env, self._rows(5000)))
+
+
+class TestXmlRpcRequestParsing(TransactionCase):
+    def _body(self, rows=100):
+        values = [{"name": f"Partner {index}", "ref": str(index)} for index in range(rows)]
+        return xmlrpclib.dumps(("db", 2, "key", "res.partner", "create", [values], {}), "execute_kw").encode()
+
+    def test_same_result_as_loads(self):
+        """Test incremental parsing returns what xmlrpclib.loads returns."""
+        body = self._body(rows=5000)
+        self.assertGreater(len(body), xmlrpc_stream.READ_SIZE)
+        self.assertEqual(xmlrpc_stream.load_request(io.BytesIO(body)), xmlrpclib.loads(body))
+
+    def test_limits(self):
+        """Test each limit rejects the request, and 0 disables it."""
+        body = self._body()
+        for limits in ({"max_body_size": 1000}, {"max_elements": 100}, {"max_depth": 5}):
+            with self.subTest(limits=limits), self.assertRaises(xmlrpc_stream.RequestLimitError):
+                xmlrpc_stream.load_request(io.BytesIO(body), **limits)
+        params, _method = xmlrpc_stream.load_request(
+            io.BytesIO(body), max_body_size=0, max_elements=0, max_depth=0
+        )
+        self.assertEqual(len(params[5][0]), 100)
+
+    def test_declared_size_rejected_before_reading(self):
+        """Test a Content-Length over the limit is rejected without reading the body."""
+        stream = io.BytesIO(self._body())
+        with self.assertRaises(xmlrpc_stream.RequestLimitError):
+            xmlrpc_stream.load_request(stream, max_body_size=1000, content_length=5000)
+        self.assertEqual(stream.tell(), 0)
+
+    def test_stops_reading_at_limit(self):
+        """Test parsing stops at the block where a limit is crossed."""
+        body = self._body(rows=20000)
+        stream = io.BytesIO(body)
+        with self.assertRaises(xmlrpc_stream.RequestLimitError):
+            xmlrpc_stream.load_request(stream, max_elements=1000)
+        self.assertEqual(stream.tell(), xmlrpc_stream.READ_SIZE)
+
+    def test_invalid_xml(self):
+        """Test malformed bodies raise ExpatError like xmlrpclib.loads."""
+        with self.assertRaises(ExpatError):
+            xmlrpc_stream.load_request(io.BytesIO(b"<methodCall><params>"))
+
+
+@tagged("post_install", "-at_install")
+class TestXmlRpcStreamEndpoint(HttpCase):
+    def setUp(self):
+        super().setUp()
+        enable_model_for_mcp(self.env)
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_stream_min_rows", "2")
+        self.user, self.api_key = create_api_key_user(self.env, "MCP Stream User", "mcp_stream_user")
+        self.env["res.partner"].create([{"name": f"Stream Partner {index}"} for index in range(3)])
+
+    def _execute(self, method, *args, **kwargs):
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps(
+                (self.env.cr.dbname, self.user.id, self.api_key, "res.partner", method, list(args), kwargs),
+                "execute_kw",
+            ),
+            headers={"Content-Type": "text/xml"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_large_result_is_streamed(self):
+        """Test results over the threshold are sent without Content-Length."""
+        response = self._execute("search_read", [("name", "like", "Stream Partner")], fields=["name"])
+        self.assertNotIn("Content-Length", response.headers)
+        rows = xmlrpclib.loads(response.content)[0][0]
+        self.assertEqual(sorted(row["name"] for row in rows), [f"Stream Partner {index}" for index in range(3)])
+
+    def test_small_result_is_buffered(self):
+        """Test results under the threshold keep a Content-Length and their logged size."""
+        response = self._execute("search_count", [])
+        self.assertEqual(int(response.headers["Content-Length"]), len(response.content))
+        log = self.env["mcp.log"].search(
+            [("event_type", "=", "model_access"), ("user_id", "=", self.user.id)], order="id desc", limit=1
+        )
+        self.assertEqual(log.response_bytes, len(response.content))
+
+    def test_request_over_limit(self):
+        """Test requests over a limit get a 413 fault."""
+        self.env["ir.config_parameter"].sudo().set_param("mcp_server.xmlrpc_max_elements", "20")
+        response = self.url_open(
+            "/mcp/xmlrpc/object",
+            data=xmlrpclib.dumps(
+                (self.env.cr.dbname, self.user.id, self.api_key, "res.partner", "read", [list(range(1, 50))], {}),
+                "execute_kw",
+            ),
+            headers={"Content-Type": "text/xml"},
+        )
+        with self.assertRaises(xmlrpclib.Fault) as fault:
+            xmlrpclib.loads(response.content)
+        self.assertEqual(fault.exception.faultCode, 413)